@@ -0,0 +1,37 @@
+# -*- encoding: utf-8 -*-
+"""
+Benchmark of LMDBer append throughput per topic count with and without the
+cache of last appended ordinal.
+
+Usage:
+    python scripts/bench/append.py [count]
+"""
+import sys
+import time
+
+from keri.db.dbing import openLMDB
+
+
+def bench(count=2000, topicses=(1, 10, 100)):
+    """
+    Prints appends per second for each topic count walking back from the max
+    ordinal (cache cleared) and cached.
+    """
+    for topics in topicses:
+        rates = []
+        for cached in (False, True):
+            with openLMDB() as dber:
+                db = dber.env.open_db(key=b'tpcs.')
+                keys = [b'topic%03d' % i for i in range(topics)]
+                start = time.perf_counter()
+                with dber.txn():
+                    for i in range(count):
+                        if not cached:
+                            dber._ons = {}
+                        dber.appendIoSetVal(db, keys[i % topics], b'%08d' % i)
+                rates.append(count / (time.perf_counter() - start))
+        print(f"append {topics} topics: {rates[0]:.0f}/s walk {rates[1]:.0f}/s cached")
+
+
+if __name__ == "__main__":
+    bench(count=int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -100,8 +100,7 @@ class WitnessReceiptor(doing.DoDoer):
 
                     witers.append(witer)
                     if "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
-                        for msg in hab.db.clonePreIter(pre=pre):
-                            witer.msgs.append(msg)
+                        witer.msgs.append(hab.db.streamPreIter(pre=pre))  # pulled as sent
 
                     witer.msgs.append(bytearray(msg))  # make a copy
                     self.extend([witer])
@@ -380,12 +379,15 @@ class TCPWitnesser(doing.DoDoer):
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            msgs (Deck): outgoing messages where each is bytes or an iterable
+                of chunks such as a stream of .db.streamPreIter pulled as sent
 
         """
         self.hab = hab
         self.wit = wit
         self.url = url
         self.posted = 0
+        self.streaming = False  # True while sending chunks of a stream in .msgs
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
         self.parser = None
@@ -424,16 +426,21 @@ class TCPWitnesser(doing.DoDoer):
             while not self.msgs:
                 yield self.tock
 
-            msg = self.msgs.popleft()
-            self.posted += 1
+            msgs = self.msgs.popleft()
+            if isinstance(msgs, (bytes, bytearray, memoryview)):
+                msgs = (msgs, )
+            self.streaming = True
+            for msg in msgs:  # pull next chunk of stream once prior chunk is sent
+                self.posted += 1
 
-            client.tx(msg)  # send to connected remote
+                client.tx(msg)  # send to connected remote
 
-            while client.txbs:
-                yield self.tock
+                while client.txbs:
+                    yield self.tock
 
-            self.sent.append(msg)
-            yield self.tock
+                self.sent.append(msg)
+                yield self.tock
+            self.streaming = False
 
     def msgDo(self, tymth=None, tock=0.0, **opts):
         """
@@ -459,7 +466,7 @@ class TCPWitnesser(doing.DoDoer):
 
     @property
     def idle(self):
-        return len(self.sent) == self.posted
+        return not self.msgs and not self.streaming and len(self.sent) == self.posted
 
 
 class HttpWitnesser(doing.DoDoer):
@@ -475,11 +482,14 @@ class HttpWitnesser(doing.DoDoer):
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            msgs (Deck): outgoing messages where each is bytes or an iterable
+                of chunks such as a stream of .db.streamPreIter pulled as sent
 
         """
         self.hab = hab
         self.wit = wit
         self.posted = 0
+        self.streaming = False  # True while sending chunks of a stream in .msgs
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
         self.parser = None
@@ -512,12 +522,17 @@ class HttpWitnesser(doing.DoDoer):
             while not self.msgs:
                 yield self.tock
 
-            msg = self.msgs.popleft()
-            self.posted += httping.streamCESRRequests(client=self.client, ims=msg)
-            while self.client.requests:
-                yield self.tock
+            msgs = self.msgs.popleft()
+            if isinstance(msgs, (bytes, bytearray, memoryview)):
+                msgs = (msgs, )
+            self.streaming = True
+            for msg in msgs:  # pull next chunk of stream once prior chunk is sent
+                self.posted += httping.streamCESRRequests(client=self.client, ims=msg)
+                while self.client.requests:
+                    yield self.tock
 
-            yield self.tock
+                yield self.tock
+            self.streaming = False
 
     def responseDo(self, tymth=None, tock=0.0):
         """
@@ -537,7 +552,7 @@ class HttpWitnesser(doing.DoDoer):
 
     @property
     def idle(self):
-        return self.posted == len(self.sent)
+        return not self.msgs and not self.streaming and self.posted == len(self.sent)
 
 
 def mailbox(hab, cid):
@@ -0,0 +1,69 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands.db module
+
+"""
+import argparse
+import os
+
+from hio import help
+from hio.base import doing
+
+from keri.app import storing
+from keri.app.cli.common import existing
+from keri.kering import ConfigurationError
+from keri.vdr import viring
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Hot backup of keystore, event, registry and mailbox databases')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+parser.add_argument("--dest", "-d", help="directory to write backup to, used as head directory of copies",
+                    required=True)
+parser.add_argument("--no-compact", help="copy all pages instead of compacted copy", dest="compact",
+                    action="store_false")
+
+
+def handler(args):
+    """ Command line database backup handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(backup, **kwa)]
+
+
+def backup(tymth, tock=0.0, **opts):
+    """ Copy each database of keystore into same relative path under dest while databases may be in use
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+    name = args.name
+    base = args.base
+    bran = args.bran
+
+    try:
+        with existing.existingHby(name=name, base=base, bran=bran) as hby:
+            reger = viring.Reger(name=hby.name, base=base, temp=False)
+            mbx = storing.Mailboxer(name=hby.name, base=base, temp=False)
+            try:
+                for db in (hby.ks, hby.db, reger, mbx):
+                    path = os.path.join(args.dest, db.TailDirPath, base, db.name)
+                    txnid = db.backup(path, compact=args.compact)
+                    print(f"Backed up {db.path} to {path} at transaction {txnid}")
+            finally:
+                reger.close()
+                mbx.close()
+
+    except ConfigurationError as e:
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
+    except ValueError as e:
+        print(f"backup failed: {e}")
+        return -1
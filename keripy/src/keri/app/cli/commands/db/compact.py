@@ -0,0 +1,75 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands.db module
+
+"""
+import argparse
+import os
+
+from hio import help
+from hio.base import doing
+
+from keri.app import storing
+from keri.app.cli.common import existing
+from keri.kering import ConfigurationError
+from keri.vdr import viring
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Compact keystore, event, registry and mailbox databases')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+
+
+def handler(args):
+    """ Command line database compaction handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(compact, **kwa)]
+
+
+def compact(tymth, tock=0.0, **opts):
+    """ Stage compacted copy of each database and swap in now if no other process has it open
+    otherwise the copy is swapped in when that process restarts. A copy made stale by writes
+    since compaction is discarded and the database compacted again before it is reopened
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+    name = args.name
+    base = args.base
+    bran = args.bran
+
+    try:
+        with existing.existingHby(name=name, base=base, bran=bran) as hby:
+            reger = viring.Reger(name=hby.name, base=base, temp=False)
+            mbx = storing.Mailboxer(name=hby.name, base=base, temp=False)
+            dbs = (hby.ks, hby.db, reger, mbx)
+            try:
+                for db in dbs:
+                    print(f"Compacted {db.path} into {db.compact()}")
+            finally:
+                reger.close()
+                mbx.close()
+
+        for db in dbs:  # swap in on reopen when no other process has db open
+            db.reopen(reuse=True)
+            db.close()
+            staged = db.path + ".compact"
+            if os.path.exists(staged):
+                print(f"{db.path} in use, compacted copy swapped in on its next restart")
+            elif db.stale:
+                print(f"{db.path} written to since compaction, compacted copy discarded "
+                      f"and {db.path} compacted again on reopen")
+            else:
+                print(f"Reopened {db.path}, compacted copy swapped in")
+
+    except ConfigurationError as e:
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
@@ -0,0 +1,63 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands.db module
+
+"""
+import argparse
+
+from hio import help
+from hio.base import doing
+
+from keri.app.cli.common import existing
+from keri.kering import ConfigurationError
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Export first seen event logs with attachments to CESR stream file')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+parser.add_argument("--file", "-f", help="path of CESR stream file to write", required=True)
+parser.add_argument("--prefix", help="identifier prefix of KEL to export, may be repeated, default all KELs",
+                    dest="pres", action="append", default=None)
+
+
+def handler(args):
+    """ Command line KEL export handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(export, **kwa)]
+
+
+def export(tymth, tock=0.0, **opts):
+    """ Write first seen event messages with attachments of all or selected KELs to file
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+    name = args.name
+    base = args.base
+    bran = args.bran
+
+    try:
+        with existing.existingHby(name=name, base=base, bran=bran) as hby:
+            count = size = 0
+            with hby.db.snapshot(), open(args.file, "wb") as f:
+                if args.pres:
+                    msgs = (msg for pre in args.pres for msg in hby.db.clonePreIter(pre=pre))
+                else:
+                    msgs = hby.db.cloneAllPreIter()
+                for msg in msgs:
+                    f.write(msg)
+                    count += 1
+                    size += len(msg)
+            print(f"Exported {count} events of {size} bytes to {args.file}")
+
+    except ConfigurationError as e:
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
@@ -0,0 +1,91 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands.db module
+
+"""
+import argparse
+import mmap
+import os
+import time
+
+from hio import help
+from hio.base import doing
+
+from keri.app.cli.common import existing
+from keri.core import eventing, parsing
+from keri.kering import ConfigurationError
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Import first seen event logs with attachments from CESR stream file')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+parser.add_argument("--file", "-f", help="path of CESR stream file to read", required=True)
+parser.add_argument("--batch-size", help="max number of writes per group commit, default 1000",
+                    dest="batchSize", type=int, default=1000)
+parser.add_argument("--chunk-size", help="bytes of file parsed at a time, default 65536",
+                    dest="chunkSize", type=int, default=65536)
+
+
+def handler(args):
+    """ Command line KEL import handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(load, **kwa)]
+
+
+def load(tymth, tock=0.0, **opts):
+    """ Parse memory mapped file in chunks into Kevery with group commits and report progress
+
+    Events of each chunk are processed as one batch in order of sn per prefix
+    by Kevery.processEventBatch.
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+    name = args.name
+    base = args.base
+    bran = args.bran
+
+    try:
+        with existing.existingHby(name=name, base=base, bran=bran) as hby:
+            total = os.path.getsize(args.file)
+            if not total:
+                print(f"Nothing to import from empty {args.file}")
+                return 0
+
+            hby.db.batchSize = args.batchSize  # group commit mode
+            kvy = eventing.Kevery(db=hby.db, lax=True, local=False)
+            psr = parsing.Parser(kvy=kvy, batch=True)  # events onto kvy.evts
+            start = time.monotonic()
+            done = percent = 0
+            with open(args.file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                chunks = (view[i:i + args.chunkSize] for i in range(0, total, args.chunkSize))
+                try:
+                    for rest in psr.chunkParsator(chunks=chunks):
+                        kvy.processEventBatch()  # events of chunk in order of sn
+                        kvy.cues.clear()  # no receipts when importing
+                        done = min(done + args.chunkSize, total)
+                        if (p := (done - rest) * 100 // total) > percent:
+                            percent = p
+                            print(f"Imported {done - rest} of {total} bytes ({percent}%) "
+                                  f"in {time.monotonic() - start:.1f}s")
+                        hby.db.tick()
+                finally:
+                    del chunks
+                    view.release()
+
+            kvy.processEscrows()  # events received before their dependencies
+            hby.db.flush()
+            print(f"Imported {args.file} in {time.monotonic() - start:.1f}s")
+
+    except ConfigurationError as e:
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
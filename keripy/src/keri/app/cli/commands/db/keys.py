@@ -0,0 +1,65 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands.db module
+
+"""
+import argparse
+
+from hio import help
+from hio.base import doing
+
+from keri.app.cli.common import existing
+from keri.kering import ConfigurationError
+from keri.vdr import viring
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Display or migrate key versions of ordinal sub databases. '
+                                             'Stop any agent or witness using the keystore before migrating')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+parser.add_argument("--migrate", help="migrate ordinal sub databases to compact binary keys, resumes if interrupted",
+                    action="store_true")
+parser.add_argument("--batch", help="max entries migrated per write transaction, default 1000",
+                    type=int, default=1000)
+
+
+def handler(args):
+    """ Command line key version handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(keys, **kwa)]
+
+
+def keys(tymth, tock=0.0, **opts):
+    """ Print key version of each ordinal sub database and migrate them when requested
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+    name = args.name
+    base = args.base
+    bran = args.bran
+
+    try:
+        with existing.existingHby(name=name, base=base, bran=bran) as hby:
+            reger = viring.Reger(name=hby.name, base=base, temp=False)
+            try:
+                for db in (hby.db, reger):
+                    if args.migrate:
+                        for sub, count in db.migrateKeys(batch=args.batch).items():
+                            print(f"Migrated {count} entries of {db.path} {sub} to compact keys")
+                    for sub, ver in db.keyVers().items():
+                        print(f"{db.path} {sub} key version {ver}")
+            finally:
+                reger.close()
+
+    except ConfigurationError as e:
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
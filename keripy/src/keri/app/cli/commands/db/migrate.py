@@ -0,0 +1,65 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands.db module
+
+"""
+import argparse
+
+from hio import help
+from hio.base import doing
+
+from keri.app import keeping
+from keri.db import basing
+from keri.vdr import viring
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Run or estimate pending schema migrations of keystore databases. '
+                                             'Stop any agent or witness using the keystore before migrating')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument("--dry-run", help="only estimate duration of pending migrations from sub database sizes",
+                    dest="dry", action="store_true")
+parser.add_argument("--batch", help="max entries migrated per write transaction, default 1000",
+                    type=int, default=1000)
+
+
+def handler(args):
+    """ Command line schema migration handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(migrate, **kwa)]
+
+
+def migrate(tymth, tock=0.0, **opts):
+    """ Run or estimate pending schema migrations of keystore, key event and registry databases
+
+    Databases are opened directly instead of through a Habery whose setup would
+    run the migrations.
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+    name = args.name
+    base = args.base
+
+    dbers = []
+    try:
+        dbers.append(keeping.Keeper(name=name, base=base, temp=False, reopen=True))
+        dbers.append(basing.Baser(name=name, base=base, temp=False, reopen=True))
+        dbers.append(viring.Reger(name=name, base=base, temp=False, reopen=True))
+        for dber in dbers:
+            reports = dber.migrate(batch=args.batch, dry=args.dry)
+            if not reports:
+                print(f"{dber.path} at schema version {dber.schemaVer}, nothing to migrate")
+            for report in reports:
+                verb = "Pending" if args.dry else "Migrated"
+                print(f"{verb} {dber.path} schema version {report['ver']} {report['name']}: "
+                      f"{report['entries']} entries, estimated {report['secs']:.1f} seconds")
+    finally:
+        for dber in dbers:
+            dber.close()
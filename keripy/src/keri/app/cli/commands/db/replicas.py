@@ -0,0 +1,51 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands.db module
+
+"""
+import argparse
+
+from hio import help
+from hio.base import doing
+
+from keri.app import replicating
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Run readonly query replica worker processes over databases of a '
+                                             'running agent or witness')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument("--port", help="HTTP port of first replica, others use consecutive ports, default 5640",
+                    type=int, default=5640)
+parser.add_argument("--workers", "-w", help="number of replica worker processes, default 1", type=int, default=1)
+
+
+def handler(args):
+    """ Command line readonly replicas handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(replicas, **kwa)]
+
+
+def replicas(tymth, tock=0.0, **opts):
+    """ Launch replica worker processes and run until they exit or interrupted
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+
+    procs = replicating.launch(name=args.name, base=args.base, port=args.port, workers=args.workers)
+    print(f"Serving {args.workers} readonly replicas of {args.name} on ports "
+          f"{args.port}-{args.port + args.workers - 1}")
+    try:
+        while any(proc.is_alive() for proc in procs):
+            yield 1.0
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.join()
@@ -0,0 +1,57 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands.db module
+
+"""
+import argparse
+import json
+
+from hio import help
+from hio.base import doing
+
+from keri.app.cli.common import existing
+from keri.kering import ConfigurationError
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Display database capacity and per sub database usage')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+parser.add_argument("--top", "-t", help="only show this many largest sub databases by bytes", type=int,
+                    default=None)
+
+
+def handler(args):
+    """ Command line database stats handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(stats, **kwa)]
+
+
+def stats(tymth, tock=0.0, **opts):
+    """ Print capacity stats of database with sub databases sorted by bytes largest first
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+    name = args.name
+    base = args.base
+    bran = args.bran
+    top = args.top
+
+    try:
+        with existing.existingHby(name=name, base=base, bran=bran) as hby:
+            data = hby.db.stats()
+            dbs = sorted(data["dbs"].items(), key=lambda item: item[1]["bytes"], reverse=True)
+            data["dbs"] = dict(dbs[:top])
+            print(json.dumps(data, indent=2))
+
+    except ConfigurationError as e:
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
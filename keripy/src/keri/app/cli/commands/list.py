@@ -44,8 +44,9 @@ def ids(tymth, tock=0.0, **opts):
 
     try:
         with existing.existingHby(name=name, base=base, bran=bran) as hby:
-            for hab in hby.habs.values():
-                print(f"{hab.name} ({hab.pre})")
+            for (alias,), habord in hby.db.habs.getItemIter():
+                if habord.hid in hby.habs:  # listed without building its Hab
+                    print(f"{alias} ({habord.hid})")
 
     except ConfigurationError as e:
         print(e)
@@ -41,6 +41,12 @@ parser.add_argument('--passcode', '-p', help='22 character encryption passcode f
                     dest="bran", default=None)  # passcode => bran
 parser.add_argument('--ledger', '-l', help='Ledger name. Available options: cardano',
                     required=False, default=None)
+parser.add_argument('--batch-size', dest="batchSize", action='store', default=0,
+                    help="Group commit up to this many database writes per transaction. "
+                         "Default is 0 which commits each write.")
+parser.add_argument('--batch-period', dest="batchPeriod", action='store', default=0.05,
+                    help="Max seconds database writes accumulate before group commit. "
+                         "Default is 0.05.")
 
 def launch(args):
     help.ogler.level = logging.CRITICAL
@@ -60,13 +66,16 @@ def launch(args):
                bran=args.bran,
                tcp=int(args.tcp),
                http=int(args.http),
-               ledger=ledger)
+               ledger=ledger,
+               batchSize=int(args.batchSize),
+               batchPeriod=float(args.batchPeriod))
 
     logger.info("\n******* Ended Witness for %s listening: http/%s, tcp/%s"
                 ".******\n\n", args.name, args.http, args.tcp)
 
 
-def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0, ledger=None):
+def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0, ledger=None,
+               batchSize=0, batchPeriod=0.05):
     """
     Setup and run one witness
     """
@@ -83,6 +92,9 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
     else:
         hby = existing.setupHby(name=name, base=base, bran=bran)
 
+    hby.db.batchSize = batchSize  # group commit mode when batchSize > 0
+    hby.db.batchPeriod = batchPeriod
+
     hbyDoer = habbing.HaberyDoer(habery=hby)  # setup doer
     doers = [hbyDoer]
 
@@ -95,19 +95,21 @@ def existingHab(name, alias, base="", bran=None):
 
 
 def aliasInput(hby):
-    habs = list(hby.habs.values())
+    # (name, pre) from the .habs records so no Hab is built just to list it
+    habs = [(name, habord.hid) for (name,), habord in hby.db.habs.getItemIter()
+            if habord.hid in hby.habs]
     if len(habs) == 1:
-        return habs[0].name
+        return habs[0][0]
 
     while True:
         print("Enter the number of your local AID to use:")
-        for idx, hab in enumerate(habs):
-            print(f"\t{idx+1}: {hab.name} ({hab.pre})")
+        for idx, (name, pre) in enumerate(habs):
+            print(f"\t{idx+1}: {name} ({pre})")
         try:
             idx = input("Number: ")
             idx = int(idx) - 1
             if 0 <= idx < len(habs):
-                return habs[idx].name
+                return habs[idx][0]
             else:
                 print("Invalid number\n")
         except ValueError:
@@ -67,8 +67,9 @@ class Postman(doing.DoDoer):
                     print(f"exiting because can't find wit for {recp}")
                     continue
 
-                msg = bytearray()
-                msg.extend(introduce(hab, wit))
+                witer = agenting.witnesser(hab=hab, wit=wit)
+                witer.msgs.append(introduceIter(hab, wit))  # pulled as sent
+
                 # Transpose the signatures to point to the new location
 
                 # create the forward message with payload embedded at `a` field
@@ -86,13 +87,10 @@ class Postman(doing.DoDoer):
                                               count=(len(atc) // 4)).qb64b)
                     ims.extend(atc)
 
-                witer = agenting.witnesser(hab=hab, wit=wit)
-
-                msg.extend(ims)
-                witer.msgs.append(bytearray(msg))  # make a copy
+                witer.msgs.append(bytearray(ims))  # make a copy
                 self.extend([witer])
 
-                while not witer.sent:
+                while not witer.idle:
                     _ = (yield self.tock)
 
                 self.cues.append(dict(dest=recp, topic=tpc, said=srdr.said))
@@ -255,8 +253,25 @@ def introduce(hab, wit):
 
     """
     msgs = bytearray()
+    for chunk in introduceIter(hab, wit, size=0):
+        msgs.extend(chunk)
+    return msgs
+
+
+def introduceIter(hab, wit, size=None):
+    """ Returns iterator of chunks of hab KEL if lastest event has not been receipted by wit
+
+    Like introduce but streams the KEL with back pressure as hab.db.streamPreIter
+    so a witnesser pulls the next chunk once the prior chunk is sent.
+
+    Parameters:
+        hab (Hab): local environment for the identifier to propagate
+        wit (str): qb64 identifier prefix of the recipient of KEL if not already receipted
+        size (int | None): bytes per chunk, default hab.db.ChunkSize
+
+    """
     if wit in hab.kever.wits:
-        return msgs
+        return
 
     iserder = hab.kever.serder
     witPrefixer = coring.Prefixer(qb64=wit)
@@ -273,9 +288,7 @@ def introduce(hab, wit):
 
     if not found:  # no receipt from remote so send own inception
         # no vrcs or rct of own icp from remote so send own inception
-        for msg in hab.db.clonePreIter(pre=hab.pre):
-            msgs.extend(msg)
+        yield from hab.db.streamPreIter(pre=hab.pre, size=size)
 
-        msgs.extend(hab.replyEndRole(cid=hab.pre, role=kering.Roles.witness))
-
-    return msgs
+        if msg := hab.replyEndRole(cid=hab.pre, role=kering.Roles.witness):
+            yield msg
@@ -183,6 +183,85 @@ def setupHabery(name="who", base="main", temp=False, curls=None, remote="eve", i
             serverDoer, directant]
 
 
+class habdict(dict):
+    """
+    Subclass of dict of Habs keyed by identifier prefix that builds each Hab
+    stored in .hby.db.habs on first access instead of when the Habery is setup
+
+    Keys and membership do not build Habs. Values and items build all of them.
+
+    Attributes:
+        hby (Habery | None): habery that builds Habs of .names
+        names (dict): hab names keyed by identifier prefix of Habs not yet built
+    """
+    __slots__ = ('hby', 'names')  # no .__dict__
+
+    def __init__(self, *pa, **kwa):
+        super(habdict, self).__init__(*pa, **kwa)
+        self.hby = None
+        self.names = dict()
+
+    def __getitem__(self, k):
+        try:
+            return super(habdict, self).__getitem__(k)
+        except KeyError as ex:
+            if k not in self.names:
+                raise ex  # reraise KeyError
+            hab = self.hby.loadHab(pre=k, name=self.names.pop(k))
+            super(habdict, self).__setitem__(k, hab)
+            return hab
+
+    def __setitem__(self, k, v):
+        self.names.pop(k, None)
+        super(habdict, self).__setitem__(k, v)
+
+    def __delitem__(self, k):
+        if k in self.names:
+            del self.names[k]
+        else:
+            super(habdict, self).__delitem__(k)
+
+    def __contains__(self, k):
+        return super(habdict, self).__contains__(k) or k in self.names
+
+    def __iter__(self):
+        yield from list(super(habdict, self).keys())
+        yield from list(self.names)
+
+    def __len__(self):
+        return super(habdict, self).__len__() + len(self.names)
+
+    def get(self, k, default=None):
+        return self.__getitem__(k) if self.__contains__(k) else default
+
+    def pop(self, k, *pa):
+        if self.__contains__(k):
+            hab = self.__getitem__(k)
+            super(habdict, self).__delitem__(k)
+            return hab
+        return super(habdict, self).pop(k, *pa)
+
+    def keys(self):
+        return list(self.__iter__())
+
+    def values(self):
+        self.load()
+        return super(habdict, self).values()
+
+    def items(self):
+        self.load()
+        return super(habdict, self).items()
+
+    def clear(self):
+        self.names.clear()
+        super(habdict, self).clear()
+
+    def load(self):
+        """ Build all Habs not yet built """
+        for pre in list(self.names):
+            self.__getitem__(pre)
+
+
 class Habery:
     """Habery class provides shared database environments for all its Habitats
     Key controller and identifier controller shared configuration file, keystore
@@ -301,7 +380,8 @@ class Habery:
         self.kvy = eventing.Kevery(db=self.db, lax=False, local=True, rvy=self.rvy)
         self.kvy.registerReplyRoutes(router=self.rtr)
         self.psr = parsing.Parser(framed=True, kvy=self.kvy, rvy=self.rvy, exc=self.exc)
-        self.habs = {}  # empty .habs
+        self.habs = habdict()  # empty .habs, built on first access
+        self.habs.hby = self
         self._signator = None
         self.inited = False
 
@@ -322,7 +402,8 @@ class Habery:
         setup of these resources. Putting the .db and .ks associated
         initialization here enables asynchronous opening .db and .ks after
         Baser and Keeper instances are instantiated. First call to .setup will
-        initialize databases (vacuous initialization).
+        initialize databases (vacuous initialization). Runs any pending schema
+        migrations of .ks and .db before loading Habs.
 
         Parameters:
             seed (str): qb64 private-signing key (seed) for the aeid from which
@@ -359,6 +440,11 @@ class Habery:
                                      "database, .ks or .db.")
         self.free = True if free else False
 
+        if not self.ks.readonly:  # run pending schema migrations
+            self.ks.migrate()
+        if not self.db.readonly and self.db.migrate():
+            self.db.reload()  # reload kevers from migrated key state
+
         if bran and not seed:  # create seed from stretch of bran as salt
             if len(bran) < 21:
                 raise ValueError(f"Bran (passcode seed material) too short.")
@@ -391,43 +477,52 @@ class Habery:
     def loadHabs(self):
         """Load Habs instance from db
 
-        .db.reopen calls .db.reload which loads .db.kevers from key state in
-        .db.states and loads  associated .db.prefixes.
-        It also removes any bare .habs without key state
-        Thus by now know that .habs are valid so can create Hab instances
+        .db.reopen calls .db.reload which loads .db.prefixes from the startup
+        snapshot of .db.habs and removes any bare .habs without key state when
+        it rebuilds the snapshot. Thus by now know that .habs are valid.
+        Hab instances are created on first access of .habs by .loadHab
 
         """
         self.reconfigure()  # pre hab load reconfiguration
 
-        groups = []
-        for name, habord in self.db.habs.getItemIter():
-            name, = name  # detupleize the database key name
-            pre = habord.hid
-
-            # create Hab instance and inject dependencies
-            hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                      rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
-                      name=name, pre=pre, temp=self.temp, smids=habord.smids)
-
-            # Rules for acceptance
-            #  if its delegated its accepted into its own local KEL even if the
-            #    delegator has not sealed it
-            if not hab.accepted and not habord.mid:
-                raise kering.ConfigurationError(f"Problem loading Hab pre="
-                                                f"{pre} name={name} from db.")
-
-            # read in config file and process any oobis or endpoints for hab
-            hab.inited = True
-            self.habs[hab.pre] = hab
-            if habord.mid:
-                groups.append(habord)
-
-        # Populate the participant hab after loading all habs
-        for habord in groups:
-            self.habs[habord.hid].mhab = self.habs[habord.mid]
+        if (snap := self.db.strt.get(keys="habs")) is None:  # .db.habs written since open
+            snap = self.db.startup()
+        self.habs.clear()
+        self.habs.names.update(snap.names)
 
         self.reconfigure()  # post hab load reconfiguration
 
+    def loadHab(self, pre, name):
+        """Returns Hab instance loaded from db
+
+        Parameters:
+            pre (str): qb64 identifier prefix of hab
+            name (str): alias of hab
+
+        """
+        if (habord := self.db.habs.get(keys=name)) is None or habord.hid != pre:
+            raise kering.ConfigurationError(f"Missing Hab pre={pre} name={name}"
+                                            f" from db.")
+
+        # create Hab instance and inject dependencies
+        hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
+                  rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                  name=name, pre=pre, temp=self.temp, smids=habord.smids)
+
+        # Rules for acceptance
+        #  if its delegated its accepted into its own local KEL even if the
+        #    delegator has not sealed it
+        if not hab.accepted and not habord.mid:
+            raise kering.ConfigurationError(f"Problem loading Hab pre="
+                                            f"{pre} name={name} from db.")
+
+        # read in config file and process any oobis or endpoints for hab
+        hab.inited = True
+        if habord.mid:  # participant hab of group hab
+            hab.mhab = self.habs[habord.mid]
+
+        return hab
+
     def makeHab(self, name, **kwa):
         """Make new Hab with name, pre is generated from **kwa
 
@@ -1526,32 +1621,58 @@ class Hab:
             fn is int first seen ordering number
 
         """
+        with self.db.snapshot():
+            msgs = bytearray()
+            for chunk in self.replayIter(pre=pre, fn=fn, size=0):
+                msgs.extend(chunk)
+            return msgs
+
+    def replayIter(self, pre=None, fn=0, size=None):
+        """
+        Returns iterator of chunks of replay of FEL first seen event log for
+        pre starting from fn preceded by the FEL of its delegator if any.
+        Streams with back pressure as .db.streamPreIter so pull the next chunk
+        once the prior one is sent. Default pre is own .pre
+
+        Parameters:
+            pre is qb64 str or bytes of identifier prefix.
+                default is own .pre
+            fn is int first seen ordering number
+            size (int | None): bytes per chunk, default .db.ChunkSize
+        """
         if not pre:
             pre = self.pre
 
-        msgs = bytearray()
         kever = self.kevers[pre]
         if kever.delegated:
-            for msg in self.db.clonePreIter(pre=kever.delegator, fn=0):
-                msgs.extend(msg)
+            yield from self.db.streamPreIter(pre=kever.delegator, fn=0, size=size)
 
-        for msg in self.db.clonePreIter(pre=pre, fn=fn):
-            msgs.extend(msg)
-
-        return msgs
+        yield from self.db.streamPreIter(pre=pre, fn=fn, size=size)
 
     def replayAll(self, key=b''):
         """
         Returns replay of FEL first seen event log for all pre starting at key
 
         Parameters:
-            key (bytes): fnKey(pre, fn)
+            key (bytes): .db.ordKey(.db.fels, pre, fn)
 
         """
-        msgs = bytearray()
-        for msg in self.db.cloneAllPreIter(key=key):
-            msgs.extend(msg)
-        return msgs
+        with self.db.snapshot():
+            msgs = bytearray()
+            for chunk in self.replayAllIter(key=key, size=0):
+                msgs.extend(chunk)
+            return msgs
+
+    def replayAllIter(self, key=b'', size=None):
+        """
+        Returns iterator of chunks of replay of FEL first seen event log for
+        all pre starting at key. Streams with back pressure as .db.streamAllPreIter
+
+        Parameters:
+            key (bytes): .db.ordKey(.db.fels, pre, fn)
+            size (int | None): bytes per chunk, default .db.ChunkSize
+        """
+        return self.db.streamAllPreIter(key=key, size=size)
 
     def makeOtherEvent(self, pre, sn):
         """
@@ -1994,6 +2115,7 @@ class Hab:
             cueKin = cue["kin"]  # type or kind of cue
 
             if cueKin in ("receipt",):  # cue to receipt a received event from other pre
+                self.db.flush()  # receipt promises durability of receipted event
                 cuedSerder = cue["serder"]  # Serder of received event for other pre
                 cuedKed = cuedSerder.ked
                 cuedPrefixer = coring.Prefixer(qb64=cuedKed["i"])
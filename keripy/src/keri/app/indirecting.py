@@ -219,11 +219,14 @@ class WitnessStart(doing.DoDoer):
             while self.cues:
                 cue = self.cues.popleft()
                 cueKin = cue["kin"]
+                if cueKin == "receipt":  # receipt promises durability of receipted event
+                    self.hab.db.flush()
                 if cueKin == "stream":
                     self.queries.append(cue)
                 else:
                     self.responses.append(cue)
                 yield self.tock
+            self.hab.db.tick()  # group commit when due
             yield self.tock
 
     def exchangerDo(self, tymth=None, tock=0.0):
@@ -406,6 +409,7 @@ class Indirector(doing.DoDoer):
             for msg in self.hab.processCuesIter(self.kevery.cues):
                 self.sendMessage(msg, label="chit or receipt")
                 yield  # throttle just do one cue at a time
+            self.hab.db.tick()  # group commit when due
             yield
 
     def escrowDo(self, tymth=None, tock=0.0):
@@ -587,19 +591,17 @@ class MailboxDirector(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        habs = list(self.hby.habs.values())
-        for hab in habs:
-            if hab.accepted:
-                self.addPollers(hab)
+        for pre in self.hby.habs.keys():  # build each accepted Hab in turn
+            if pre in self.hby.kevers:  # accepted without building its Hab
+                self.addPollers(hab=self.hby.habs[pre])
                 _ = (yield self.tock)
 
         while True:
             pres = oset(self.hby.habs.keys())
             if new := pres - self.prefixes:
                 for pre in new:
-                    hab = self.hby.habs[pre]
-                    if hab.accepted:
-                        self.addPollers(hab=hab)
+                    if pre in self.hby.kevers:
+                        self.addPollers(hab=self.hby.habs[pre])
                         _ = (yield self.tock)
 
             for msg in self.processPollIter():
@@ -990,25 +992,26 @@ class MailboxIterable:
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
             data = bytearray()
-            for topic, idx in self.topics.items():
-                key = self.pre + topic
-                for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
-                    data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
-                                          .encode("utf-8")))
-                    data.extend(msg)
-                    data.extend(b'\n\n')
-                    idx = idx + 1
-                    self.start = time.perf_counter()
-
-                    if self.ledger:
-                        try:
-                            serder = coring.Serder(raw=msg)
-                            event = eventing.loadEvent(self.hab.db, self.pre, serder.saidb)
-                            self.ledger.publishEvent(event)
-                            
-                        except Exception as e:
-                            logger.error(f"ledger error: {e}")
-                self.topics[topic] = idx
+            with self.mbx.snapshot():  # msgs are copied once into data
+                for topic, idx in self.topics.items():
+                    key = self.pre + topic
+                    for fn, _, msg in self.mbx.cloneTopicIter(key, idx, copy=False):
+                        data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
+                                              .encode("utf-8")))
+                        data.extend(msg)
+                        data.extend(b'\n\n')
+                        idx = idx + 1
+                        self.start = time.perf_counter()
+
+                        if self.ledger:
+                            try:
+                                serder = coring.Serder(raw=bytes(msg))
+                                event = eventing.loadEvent(self.hab.db, self.pre, serder.saidb)
+                                self.ledger.publishEvent(event)
+
+                            except Exception as e:
+                                logger.error(f"ledger error: {e}")
+                    self.topics[topic] = idx
             self.end = time.perf_counter()
             return data
 
@@ -218,6 +218,7 @@ class Keeper(dbing.LMDBer):
     AltTailDirPath = ".keri/ks"
     TempPrefix = "keri_ks_"
     MaxNamedDBs = 8
+    Migrations = dbing.Migrator()  # registry of schema migrations
 
     def __init__(self, headDirPath=None, perm=None, reopen=False, **kwa):
         """
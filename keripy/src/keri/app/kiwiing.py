@@ -147,8 +147,8 @@ class IdentifierEnd(doing.DoDoer):
         """
         res = []
 
-        for pre, hab in self.hby.habs.items():
-            info = self.info(hab)
+        for pre in self.hby.habs.keys():  # build each Hab as it is listed
+            info = self.info(self.hby.habs[pre])
             res.append(info)
 
         rep.status = falcon.HTTP_200
@@ -723,10 +723,24 @@ class IdentifierEnd(doing.DoDoer):
 
 
 class KeyStateEnd:
+    """ Key state and key event log endpoint
 
-    def __init__(self, hby, counselor):
+    Reads key state from the states sub db so it serves from a readonly Baser
+    of a query replica as well as from the Habery of the writer. Pending
+    multisig events only exist in memory of the writer so need a counselor.
+
+    """
+
+    def __init__(self, hby=None, counselor=None, db=None):
+        """
+        Parameters:
+            hby (Habery): habery of writer with .db
+            counselor (Counselor): optional source of pending multisig events
+            db (basing.Baser): key event database, default hby.db
+        """
         self.hby = hby
         self.counselor = counselor
+        self.db = db if db is not None else hby.db
 
     def on_get(self, _, rep, prefix):
         """
@@ -738,7 +752,7 @@ class KeyStateEnd:
 
         ---
         summary:  Display key event log (KEL) for given identifier prefix
-        description:  If provided qb64 identifier prefix is in Kevers, return the current state of the
+        description:  If provided qb64 identifier prefix has key state, return the current state of the
                       identifier along with the KEL and all associated signatures and receipts
         tags:
            - Ket Event Log
@@ -757,65 +771,65 @@ class KeyStateEnd:
 
 
         """
-        if prefix not in self.hby.kevers:
-            rep.status = falcon.HTTP_404
-            rep.text = f"no information found for {prefix}"
-            return
-
-        kever = self.hby.kevers[prefix]
-        pre = kever.prefixer.qb64
-        preb = kever.prefixer.qb64b
-
-        res = dict(
-            pre=pre,
-            state=kever.state().ked
-        )
-
-        kel = []
-        for fn, dig in self.hby.db.getFelItemPreIter(preb, fn=0):
-            try:
-                event = eventing.loadEvent(self.hby.db, preb, dig)
-            except ValueError as e:
-                rep.status = falcon.HTTP_400
-                rep.text = e.args[0]
-                return
-
-            kel.append(event)
-
-        key = dbing.snKey(pre=pre, sn=0)
-        # load any partially witnesses events for this prefix
-        for ekey, edig in self.hby.db.getPweItemsNextIter(key=key):
-            pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-            try:
-                kel.append(eventing.loadEvent(self.hby.db, pre, edig))
-            except ValueError as e:
-                rep.status = falcon.HTTP_400
-                rep.text = e.args[0]
+        with self.db.snapshot():
+            if (state := self.db.states.get(keys=prefix)) is None:
+                rep.status = falcon.HTTP_404
+                rep.text = f"no information found for {prefix}"
                 return
 
-        # load any partially signed events from this prefix
-        for ekey, edig in self.hby.db.getPseItemsNextIter(key=key):
-            pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-            try:
-                kel.append(eventing.loadEvent(self.hby.db, pre, edig))
-            except ValueError as e:
-                rep.status = falcon.HTTP_400
-                rep.text = e.args[0]
-                return
+            pre = prefix
+            preb = prefix.encode("utf-8")
 
-        res["kel"] = kel
+            res = dict(
+                pre=pre,
+                state=state.ked
+            )
 
-        # Check to see if we have any pending distributed multisig events
-        evts = []
-        if pre in self.hby.habs:
-            hab = self.hby.habs[pre]
-            if hab.mhab:
-                evts = self.counselor.pendingEvents(pre)
-        res["pending"] = evts
+            kel = []
+            for fn, dig in self.db.getFelItemPreIter(preb, fn=0):
+                try:
+                    event = eventing.loadEvent(self.db, preb, dig)
+                except ValueError as e:
+                    rep.status = falcon.HTTP_400
+                    rep.text = e.args[0]
+                    return
+
+                kel.append(event)
+
+            key = dbing.snKey(pre=pre, sn=0)
+            # load any partially witnesses events for this prefix
+            for ekey, edig in self.db.getPweItemsNextIter(key=key):
+                pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
+                try:
+                    kel.append(eventing.loadEvent(self.db, pre, edig))
+                except ValueError as e:
+                    rep.status = falcon.HTTP_400
+                    rep.text = e.args[0]
+                    return
+
+            # load any partially signed events from this prefix
+            for ekey, edig in self.db.getPseItemsNextIter(key=key):
+                pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
+                try:
+                    kel.append(eventing.loadEvent(self.db, pre, edig))
+                except ValueError as e:
+                    rep.status = falcon.HTTP_400
+                    rep.text = e.args[0]
+                    return
+
+            res["kel"] = kel
+
+            # Check to see if we have any pending distributed multisig events
+            evts = []
+            if self.hby is not None and self.counselor is not None and prefix in self.hby.habs:
+                hab = self.hby.habs[prefix]
+                if hab.mhab:
+                    evts = self.counselor.pendingEvents(prefix)
+            res["pending"] = evts
 
-        rep.status = falcon.HTTP_200
-        rep.content_type = "application/json"
-        rep.data = json.dumps(res).encode("utf-8")
+            rep.status = falcon.HTTP_200
+            rep.content_type = "application/json"
+            rep.data = json.dumps(res).encode("utf-8")
 
     def on_get_pubkey(self, _, rep, pubkey):
         """
@@ -847,7 +861,7 @@ class KeyStateEnd:
 
         """
         found = None
-        for pre, digb, raw in self.hby.db.getAllItemIter(db=self.hby.db.evts):
+        for pre, digb, raw in self.db.getAllItemIter(db=self.db.evts):
             serder = coring.Serder(raw=bytes(raw))
             if len(serder.ked['k']) == 1 and pubkey in serder.ked['k']:
                 found = serder
@@ -3453,7 +3467,56 @@ class SchemaEnd:
         rep.data = json.dumps(data).encode("utf-8")
 
 
+class DatabaseEnd:
+
+    def __init__(self, db):
+        """ Create endpoint for retrieving database capacity statistics
+
+        Parameters:
+            db (Baser): database to report on
+
+        """
+        self.db = db
+
+    def on_get(self, req, rep):
+        """ Database capacity GET endpoint
+
+        Parameters:
+            req (Request): falcon.Request HTTP request
+            rep (Response): falcon.Response HTTP response
+
+        ---
+        summary:  Display database map size usage and per sub database entries, pages and bytes
+        description:  Display database map size usage and per sub database entries, pages and bytes
+        tags:
+           - Database
+        responses:
+           200:
+              description: Database capacity statistics
+
+        """
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json"
+        rep.data = json.dumps(self.db.stats()).encode("utf-8")
+
+
 class EscrowEnd:
+    """ Escrow status endpoints
+
+    Listings are bounded pages of escrow entries whose events are loaded and
+    written to a streamed JSON response one at a time so a large escrow
+    backlog neither blocks the event loop nor builds the whole response in
+    memory.
+
+    """
+
+    # endpoint names of escrows mapped to their indexed escrow sub dbs of Baser
+    Escrows = {"out-of-order-events": "ooes",
+               "partially-witnessed-events": "pwes",
+               "partially-signed-events": "pses",
+               "likely-duplicitous-events": "ldes"}
+    Limit = 100  # default maximum entries per escrow of a listing
+    MaxLimit = 1000  # maximum entries per escrow of a listing
 
     def __init__(self, db):
         """ Create endpoint for retrieving escrow status
@@ -3473,7 +3536,8 @@ class EscrowEnd:
 
         ---
         summary:  Display escrow status for entire database or search for single identifier in escrows
-        description:  Display escrow status for entire database or search for single identifier in escrows
+        description:  Display the first limit events of each escrow for entire database or search for single
+                      identifier in escrows. Use /escrows/pages to page through an escrow with a cursor
         tags:
            - Escrows
         parameters:
@@ -3489,6 +3553,12 @@ class EscrowEnd:
               type: string
             required: false
             description: name of escrow to load, ignoring others
+          - in: query
+            name: limit
+            schema:
+              type: integer
+            required: false
+            description: maximum number of events of each escrow, default 100 at most 1000
         responses:
            200:
               description: Escrow information
@@ -3498,103 +3568,167 @@ class EscrowEnd:
 
         """
         rpre = req.params.get("pre")
-        if rpre is not None:
-            rpre = rpre.encode("utf-8")
         escrow = req.params.get("escrow")
+        limit = req.get_param_as_int("limit", min_value=1, max_value=self.MaxLimit,
+                                     default=self.Limit)
 
-        escrows = dict()
-
-        if (not escrow) or escrow == "out-of-order-events":
-            oots = list()
-            key = ekey = b''  # both start same. when not same means escrows found
-            while True:
-                for ekey, edig in self.db.getOoeItemsNextIter(key=key):
-                    pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-                    if rpre and pre != rpre:
-                        continue
-
-                    try:
-                        oots.append(eventing.loadEvent(self.db, pre, edig))
-                    except ValueError as e:
-                        rep.status = falcon.HTTP_400
-                        rep.text = e.args[0]
-                        return
-
-                if ekey == key:  # still same so no escrows found on last while iteration
-                    break
-                key = ekey  # setup next while iteration, with key after ekey
-
-            escrows["out-of-order-events"] = oots
-
-        if (not escrow) or escrow == "partially-witnessed-events":
-            pwes = list()
-            key = ekey = b''  # both start same. when not same means escrows found
-            while True:  # break when done
-                for ekey, edig in self.db.getPweItemsNextIter(key=key):
-                    pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-                    if rpre and pre != rpre:
-                        continue
-
-                    try:
-                        pwes.append(eventing.loadEvent(self.db, pre, edig))
-                    except ValueError as e:
-                        rep.status = falcon.HTTP_400
-                        rep.text = e.args[0]
-                        return
-
-                if ekey == key:  # still same so no escrows found on last while iteration
-                    break
-                key = ekey  # setup next while iteration, with key after ekey
-
-            escrows["partially-witnessed-events"] = pwes
-
-        if (not escrow) or escrow == "partially-signed-events":
-            pses = list()
-            key = ekey = b''  # both start same. when not same means escrows found
-            while True:  # break when done
-                for ekey, edig in self.db.getPseItemsNextIter(key=key):
-                    pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-                    if rpre and pre != rpre:
-                        continue
-
-                    try:
-                        pses.append(eventing.loadEvent(self.db, pre, edig))
-                    except ValueError as e:
-                        rep.status = falcon.HTTP_400
-                        rep.text = e.args[0]
-                        return
-
-                if ekey == key:  # still same so no escrows found on last while iteration
-                    break
-                key = ekey  # setup next while iteration, with key after ekey
-
-            escrows["partially-signed-events"] = pses
-
-        if (not escrow) or escrow == "likely-duplicitous-events":
-            ldes = list()
-            key = ekey = b''  # both start same. when not same means escrows found
-            while True:  # break when done
-                for ekey, edig in self.db.getLdeItemsNextIter(key=key):
-                    pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-                    if rpre and pre != rpre:
-                        continue
-
-                    try:
-                        ldes.append(eventing.loadEvent(self.db, pre, edig))
-                    except ValueError as e:
-                        rep.status = falcon.HTTP_400
-                        rep.text = e.args[0]
-                        return
-
-                if ekey == key:  # still same so no escrows found on last while iteration
-                    break
-                key = ekey  # setup next while iteration, with key after ekey
-
-            escrows["likely-duplicitous-events"] = ldes
+        pages = []
+        with self.db.snapshot():
+            for name in self.Escrows:
+                if (not escrow) or escrow == name:
+                    items, _ = self.page(name, pre=rpre, limit=limit)
+                    pages.append((name, items))
 
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json"
-        rep.data = json.dumps(escrows, indent=2).encode("utf-8")
+        rep.stream = self.streamPages(pages)
+
+    def on_get_pages(self, req, rep):
+        """
+
+        Parameters:
+            req (Request): falcon.Request HTTP request
+            rep (Response): falcon.Response HTTP response
+
+        ---
+        summary:  Page through events of one escrow
+        description:  Display count of entries of one escrow and a page of its events after cursor with the
+                      cursor of the next page, if any, optionally only for single identifier
+        tags:
+           - Escrows
+        parameters:
+          - in: query
+            name: escrow
+            schema:
+              type: string
+            required: true
+            description: name of escrow to page through
+          - in: query
+            name: pre
+            schema:
+              type: string
+            required: false
+            description: qb64 identifier prefix to search for in escrow
+          - in: query
+            name: limit
+            schema:
+              type: integer
+            required: false
+            description: maximum number of events of page, default 100 at most 1000
+          - in: query
+            name: cursor
+            schema:
+              type: string
+            required: false
+            description: next cursor of prior page. Omit for first page
+        responses:
+           200:
+              description: Count of escrow entries, next cursor or null for last page and page of events
+           400:
+              description: Missing escrow or invalid cursor
+           404:
+              description: Unknown escrow
+
+        """
+        escrow = req.params.get("escrow")
+        if not escrow:
+            rep.status = falcon.HTTP_400
+            rep.text = "escrow name required"
+            return
+
+        if escrow not in self.Escrows:
+            rep.status = falcon.HTTP_404
+            rep.text = f"unknown escrow {escrow}"
+            return
+
+        cursor = req.params.get("cursor")
+        if cursor is not None:
+            key, sep, ioval = cursor.partition("/")
+            if not (key and sep and ioval):
+                rep.status = falcon.HTTP_400
+                rep.text = f"invalid cursor {cursor}"
+                return
+            cursor = (key.encode("utf-8"), ioval.encode("utf-8"))
+
+        rpre = req.params.get("pre")
+        limit = req.get_param_as_int("limit", min_value=1, max_value=self.MaxLimit,
+                                     default=self.Limit)
+
+        with self.db.snapshot():
+            sdb, top = self.scope(escrow, pre=rpre)
+            count = self.db.cntIoValsTop(sdb, top=top)
+            items, last = self.page(escrow, pre=rpre, limit=limit, cursor=cursor)
+
+        nxt = b'/'.join(last).decode("utf-8") if last is not None else None
+        head = json.dumps(dict(escrow=escrow, count=count, next=nxt))
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json"
+        rep.stream = self.streamEvents(items, head=head[:-1].encode("utf-8") + b', "events": ',
+                                       tail=b'}')
+
+    def scope(self, escrow, pre=None):
+        """ Returns duple (sdb, top) of escrow sub db and key prefix of entries of pre
+
+        Parameters:
+            escrow (str): endpoint name of escrow
+            pre (str): optional qb64 identifier prefix of entries
+
+        """
+        return (getattr(self.db, self.Escrows[escrow]),
+                pre.encode("utf-8") + b'.' if pre else b'')
+
+    def page(self, escrow, pre=None, limit=Limit, cursor=None):
+        """ Returns duple (items, last) of page of escrow as Baser.getIoItemsPage
+
+        Parameters:
+            escrow (str): endpoint name of escrow
+            pre (str): optional qb64 identifier prefix of page entries
+            limit (int): maximum number of entries of page
+            cursor (tuple): optional (key, ioval) of last entry of prior page
+
+        """
+        sdb, top = self.scope(escrow, pre=pre)
+        key, ioval = cursor if cursor is not None else (b'', b'')
+        return self.db.getIoItemsPage(sdb, top=top, key=key, ioval=ioval, limit=limit)
+
+    def streamPages(self, pages):
+        """ Returns generator of JSON object of loaded events of pages keyed by escrow name
+
+        Parameters:
+            pages (list): duples (escrow, items) of escrow name and page items
+
+        """
+        yield b'{'
+        for i, (name, items) in enumerate(pages):
+            head = b'%s"%s": ' % (b', ' if i else b'', name.encode("utf-8"))
+            yield from self.streamEvents(items, head=head)
+        yield b'}'
+
+    def streamEvents(self, items, head=b'', tail=b''):
+        """ Returns generator of JSON array of events of escrow items loaded one at a time
+
+        Entries whose event can no longer be loaded, such as those unescrowed
+        while streaming, are logged and skipped.
+
+        Parameters:
+            items (list): (key, dig) escrow entries
+            head (bytes): JSON to stream before array
+            tail (bytes): JSON to stream after array
+
+        """
+        yield head + b'['
+        sep = b''
+        for key, dig in items:
+            pre, _ = dbing.splitKeySN(key)
+            try:
+                evt = eventing.loadEvent(self.db, pre, dig)
+            except ValueError as ex:
+                logger.error("Escrow listing skipped entry at key = %s: %s", key, ex.args[0])
+                continue
+            yield sep + json.dumps(evt).encode("utf-8")
+            sep = b', '
+        yield b']' + tail
 
     def on_get_partial(self, req, rep, pre, dig):
         """
@@ -3852,14 +3986,18 @@ def loadEnds(app, *,
 
     escrowEnd = EscrowEnd(db=hby.db)
     app.add_route("/escrows", escrowEnd)
+    app.add_route("/escrows/pages", escrowEnd, suffix="pages")
     app.add_route("/escrows/{pre}/{dig}", escrowEnd, suffix="partial")
 
+    databaseEnd = DatabaseEnd(db=hby.db)
+    app.add_route("/database", databaseEnd)
+
     aeidEnd = AeidEnd(hby=hby)
     app.add_route("/codes", aeidEnd)
 
     signalEnd = signaling.loadEnds(app, signals=signaler.signals)
     resources = [identifierEnd, MultisigInceptEnd, registryEnd, oobiEnd, credsEnd, keyEnd, signalEnd,
-                 presentationEnd, multiIcpEnd, multiEvtEnd, chacha, contact, escrowEnd, lockEnd, aeidEnd]
+                 presentationEnd, multiIcpEnd, multiEvtEnd, chacha, contact, escrowEnd, databaseEnd, lockEnd, aeidEnd]
 
     app.add_route("/spec.yaml", specing.SpecResource(app=app, title='KERI Interactive Web Interface API',
                                                      resources=resources))
@@ -0,0 +1,225 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.app.replicating module
+
+Readonly query replicas serving read only HTTP endpoints from worker processes
+that share the LMDB environments of the writer process
+"""
+import multiprocessing
+
+import falcon
+import lmdb
+from hio.base import doing
+from hio.core import http
+
+from . import directing, kiwiing
+from .. import help
+from ..db import basing
+from ..vdr import viring
+
+logger = help.ogler.getLogger()
+
+
+class Replica:
+    """
+    Replica opens the key event and registry databases of a writer
+    process in readonly mode. LMDB supports any number of concurrent readers
+    across processes so replicas serve queries without stealing time from the
+    single threaded event loop of the writer that keeps exclusive ingestion.
+
+    Each read transaction sees the latest commit of the writer so a replica
+    reads key state from the database instead of caching Kevers in memory.
+    Group commit batches of the writer become visible once committed.
+
+    Attributes:
+        db (basing.Baser): readonly key event database
+        reger (viring.Reger | None): readonly registry database if any
+
+    """
+
+    def __init__(self, name, base="", headDirPath=None):
+        """
+        Parameters:
+            name (str): name of databases of writer
+            base (str): optional base of databases of writer
+            headDirPath (str): optional head directory override of databases
+        """
+        self.db = basing.Baser(name=name, base=base, headDirPath=headDirPath,
+                               temp=False, reopen=True, reuse=True, readonly=True)
+        try:
+            self.reger = viring.Reger(name=name, base=base, headDirPath=headDirPath,
+                                      temp=False, reuse=True, readonly=True)
+        except lmdb.Error:  # writer has not created registry database
+            self.reger = None
+
+    def close(self):
+        """ Close readonly databases without clearing them """
+        for db in (self.reger, self.db):
+            if db is not None:
+                db.close()
+
+
+class ReplicaDoer(doing.Doer):
+    """
+    Doer that closes the databases of its Replica on exit
+    """
+
+    def __init__(self, replica, **kwa):
+        """
+        Parameters:
+            replica (Replica): readonly databases
+        """
+        super(ReplicaDoer, self).__init__(**kwa)
+        self.replica = replica
+
+    def exit(self):
+        """ Exit context and close Replica """
+        self.replica.close()
+
+
+class TelEnd:
+    """ Readonly transaction event log replay endpoint """
+
+    def __init__(self, reger):
+        """
+        Parameters:
+            reger (viring.Reger): readonly registry database
+        """
+        self.reger = reger
+
+    def on_get(self, _, rep, regk):
+        """
+
+        Parameters:
+            _ (Request): falcon.Request HTTP request
+            rep (Response): falcon.Response HTTP response
+            regk (str): qb64 registry or credential identifier of TEL
+
+        ---
+        summary:  Replay transaction event log (TEL) with attachments for given identifier
+        description:  Replay transaction event log (TEL) with attachments for given identifier
+        tags:
+           - Registries
+        parameters:
+          - in: path
+            name: regk
+            schema:
+              type: string
+            required: true
+            description: qb64 identifier of TEL to replay
+        responses:
+           200:
+              description: CESR stream of TEL events
+           404:
+              description: Identifier not found in registry database
+
+        """
+        msgs = bytearray()
+        with self.reger.snapshot():
+            for msg in self.reger.clonePreIter(pre=regk):
+                msgs.extend(msg)
+
+        if not msgs:
+            rep.status = falcon.HTTP_404
+            rep.text = f"no TEL found for {regk}"
+            return
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json+cesr"
+        rep.data = bytes(msgs)
+
+
+def loadEnds(app, replica):
+    """
+    Load readonly endpoints of replica into app
+
+    OOBI endpoints stay with the writer because OOBI replies are signed with
+    keys from its keystore. Mailbox reads stay with the writer because they
+    are answers to signed mailbox queries processed by its Kevery.
+
+    Parameters:
+        app (falcon.App): falcon.App to register handlers with
+        replica (Replica): readonly databases
+
+    """
+    keyEnd = kiwiing.KeyStateEnd(db=replica.db)
+    app.add_route("/keystate/{prefix}", keyEnd)
+
+    if replica.reger is not None:
+        telEnd = TelEnd(reger=replica.reger)
+        app.add_route("/tels/{regk}", telEnd)
+
+    escrowEnd = kiwiing.EscrowEnd(db=replica.db)
+    app.add_route("/escrows", escrowEnd)
+    app.add_route("/escrows/pages", escrowEnd, suffix="pages")
+    app.add_route("/escrows/{pre}/{dig}", escrowEnd, suffix="partial")
+
+    databaseEnd = kiwiing.DatabaseEnd(db=replica.db)
+    app.add_route("/database", databaseEnd)
+
+
+def setup(name, base="", port=5640, headDirPath=None):
+    """
+    Returns doers of readonly replica HTTP server on port
+
+    Parameters:
+        name (str): name of databases of writer
+        base (str): optional base of databases of writer
+        port (int): HTTP port of replica
+        headDirPath (str): optional head directory override of databases
+
+    """
+    replica = Replica(name=name, base=base, headDirPath=headDirPath)
+    app = falcon.App(middleware=falcon.CORSMiddleware(
+        allow_origins='*', allow_credentials='*', expose_headers=['cesr-attachment', 'cesr-date', 'content-type']))
+    loadEnds(app, replica=replica)
+
+    server = http.Server(port=port, app=app)
+    serverDoer = http.ServerDoer(server=server)
+
+    return [ReplicaDoer(replica=replica), serverDoer]
+
+
+def runReplica(name, base="", port=5640, headDirPath=None):
+    """
+    Run readonly replica HTTP server until interrupted. Target of worker process.
+
+    Parameters:
+        name (str): name of databases of writer
+        base (str): optional base of databases of writer
+        port (int): HTTP port of replica
+        headDirPath (str): optional head directory override of databases
+
+    """
+    doers = setup(name=name, base=base, port=port, headDirPath=headDirPath)
+    directing.runController(doers=doers, expire=0.0)
+
+
+def launch(name, base="", port=5640, workers=1, headDirPath=None):
+    """
+    Returns started worker processes each serving a readonly replica on its
+    own HTTP port starting at port. A load balancer in front of the workers
+    spreads queries across them.
+
+    Workers are spawned not forked because an LMDB environment open in the
+    parent must not be used in a forked child.
+
+    Parameters:
+        name (str): name of databases of writer
+        base (str): optional base of databases of writer
+        port (int): HTTP port of first worker, others use consecutive ports
+        workers (int): number of worker processes
+        headDirPath (str): optional head directory override of databases
+
+    """
+    ctx = multiprocessing.get_context("spawn")
+    procs = []
+    for i in range(workers):
+        proc = ctx.Process(target=runReplica, name=f"replica{i}", daemon=True,
+                           kwargs=dict(name=name, base=base, port=port + i,
+                                       headDirPath=headDirPath))
+        proc.start()
+        procs.append(proc)
+        logger.info("Replica %s of %s serving on port %s.", i, name, port + i)
+    return procs
@@ -96,8 +96,8 @@ class Mailboxer(dbing.LMDBer):
         digs = self.getIoSetVals(db=self.tpcs, key=topic, ion=fn)
         msgs = []
         for dig in digs:
-            if msg := self.msgs.get(keys=dig):
-                msgs.append(msg.encode("utf-8"))
+            if msg := self.msgs.getRaw(keys=dig):
+                msgs.append(bytes(msg))
         return msgs
 
     def storeMsg(self, topic, msg):
@@ -119,19 +119,27 @@ class Mailboxer(dbing.LMDBer):
         self.appendToTopic(topic=topic, val=digb)
         return self.msgs.pin(keys=digb, val=msg)
 
-    def cloneTopicIter(self, topic, fn=0):
+    def cloneTopicIter(self, topic, fn=0, copy=True):
         """
         Returns iterator of first seen exn messages with attachments for the
         identifier prefix pre starting at first seen order number, fn.
 
+        Parameters:
+            topic (Option(bytes|str)): Apparent effective key
+            fn (int) starting index
+            copy (bool): True means each msg is a bytes copy.
+                         False means each msg is a zero copy memoryview into
+                         the database only valid within a .snapshot() block.
+                         Use when msg is only copied into an output buffer.
+
         """
         if hasattr(topic, 'encode'):
             topic = topic.encode("utf-8")
 
         for (key, dig) in self.getIoSetItemsIter(self.tpcs, key=topic, ion=fn):
             topic, ion = dbing.unsuffix(key)
-            if msg := self.msgs.get(keys=dig):
-                yield ion, topic, msg.encode("utf-8")
+            if msg := self.msgs.getRaw(keys=dig):
+                yield ion, topic, bytes(msg) if copy else msg
 
 
 class Respondant(doing.DoDoer):
@@ -4602,6 +4602,8 @@ class Counter:
         first = qb64b[:2]  # extract first two char code selector
         if hasattr(first, "decode"):
             first = first.decode("utf-8")
+        if first == "-":  # partial two char selector need more bytes
+            raise ShortageError("Need 1 more character.")
         if first not in self.Hards:
             if first[0] == '_':
                 raise UnexpectedOpCodeError("Unexpected op code start"
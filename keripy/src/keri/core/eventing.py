@@ -6,6 +6,7 @@ keri.core.eventing module
 import datetime
 import json
 import logging
+import os
 from collections import namedtuple
 from dataclasses import dataclass, astuple
 from urllib.parse import urlsplit
@@ -20,7 +21,7 @@ from .coring import (versify, Serials, Ilks, MtrDex, NonTransDex, CtrDex, Counte
 from .. import help
 from .. import kering
 from ..db import basing, dbing
-from ..db.dbing import dgKey, snKey, fnKey, splitKeySN, splitKey
+from ..db.dbing import dgKey, snKey, splitKeySN, splitKey
 from ..help import helping
 from ..kering import (MissingEntryError,
                       ValidationError, MissingSignatureError,
@@ -1554,10 +1555,25 @@ class Kever:
         kevers (dict): reference to self.db.kevers
         transferable (bool): True if nexter is not none and pre is transferable
 
+    Kever has no per instance dict. When reloaded from key state it keeps
+    only the qb64 keys, thresholds and numbers of the state. The matter
+    instances .prefixer, .sner, .fner, .dater, .tholder, .ntholder,
+    .verfers, .nexter and .toader are built from them on first access and
+    .serder is loaded from .db on first access. So kevers of identifiers that
+    are tracked but not validated against stay small and reload cheaply.
+
     """
     EstOnly = False
     DoNotDelegate = False
 
+    __slots__ = ("db", "cues", "prefixes", "local", "version", "ilk", "fn",
+                 "wits", "cuts", "adds", "estOnly", "doNotDelegate", "lastEst",
+                 "delegator", "delegated",
+                 "_prefixer", "_sner", "_fner", "_dater", "_tholder",
+                 "_ntholder", "_verfers", "_nexter", "_toader", "_serder",
+                 "_pre", "_sn", "_dts", "_kt", "_nt", "_keys", "_ndigs",
+                 "_bt", "_said")
+
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, seqner=None, saider=None, firner=None, dater=None,
                  cues=None, prefixes=None, local=False,
@@ -1611,6 +1627,11 @@ class Kever:
         self.cues = cues
         self.prefixes = prefixes if prefixes is not None else db.prefixes
         self.local = True if local else False
+        self._prefixer = self._sner = self._fner = self._dater = None
+        self._tholder = self._ntholder = self._verfers = self._nexter = None
+        self._toader = self._serder = None
+        self._pre = self._sn = self._dts = self._kt = self._nt = None
+        self._keys = self._ndigs = self._bt = self._said = None
 
         if state:  # preload from state
             self.reload(state)
@@ -1658,14 +1679,15 @@ class Kever:
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
         # returns fn == None if already logged fn log is non idempotent
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                first=True if not check else False, seqner=seqner, saider=saider,
-                                firner=firner, dater=dater)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fn = fn
-            self.fner = Number(num=self.fn)
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+        with self.db.txn():  # log event and key state in one write transaction
+            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                    first=True if not check else False, seqner=seqner, saider=saider,
+                                    firner=firner, dater=dater)
+            if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                self.fn = fn
+                self.fner = Number(num=self.fn)
+                self.dater = Dater(dts=dts)
+                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
 
 
     @property
@@ -1711,17 +1733,20 @@ class Kever:
                                                           state.pretty()))
 
         self.version = state.version
-        self.prefixer = Prefixer(qb64=state.pre)
-        self.sner = state.sner  # sequence number Number instance
+        # matter instances are built from raw state on first access
+        self._prefixer = self._sner = self._fner = self._dater = None
+        self._tholder = self._ntholder = self._verfers = self._nexter = None
+        self._toader = self._serder = None
+        self._pre = state.ked["i"]
+        self._sn = int(state.ked["s"], 16)
         self.fn = int(state.ked["f"], 16)
-        self.fner = Number(num=self.fn)
-        self.dater = Dater(dts=state.ked["dt"])
+        self._dts = state.ked["dt"]
         self.ilk = state.ked["et"]
-        self.tholder = Tholder(sith=state.ked["kt"])
-        self.ntholder = Tholder(sith=state.ked["nt"])
-        self.verfers = [Verfer(qb64=key) for key in state.ked["k"]]
-        self.nexter = coring.Nexter(digs=state.ked["n"])
-        self.toader = Number(num=state.ked["bt"])  # auto converts from hex num
+        self._kt = state.ked["kt"]
+        self._nt = state.ked["nt"]
+        self._keys = state.ked["k"]
+        self._ndigs = state.ked["n"]
+        self._bt = int(state.ked["bt"], 16)
         self.wits = state.ked["b"]
         self.cuts = state.ked["ee"]["br"]
         self.adds = state.ked["ee"]["ba"]
@@ -1733,13 +1758,134 @@ class Kever:
         self.delegator = state.ked['di'] if state.ked['di'] else None
         self.delegated = True if self.delegator else False
 
-        if (raw := self.db.getEvt(key=dgKey(pre=self.prefixer.qb64,
-                                            dig=state.ked['d']))) is None:
+        self._said = state.ked['d']
+        if self.db.getEvt(key=dgKey(pre=self._pre, dig=self._said)) is None:
             raise MissingEntryError("Corresponding event for state={} not found."
                                     "".format(state.pretty()))
-        self.serder = Serder(raw=bytes(raw))
         # May want to do additional checks here
 
+    @property
+    def prefixer(self):
+        """ Returns Prefixer of identifier prefix built on first access """
+        if self._prefixer is None and self._pre is not None:
+            self._prefixer = Prefixer(qb64=self._pre)
+        return self._prefixer
+
+    @prefixer.setter
+    def prefixer(self, prefixer):
+        self._prefixer = prefixer
+        self._pre = None
+
+    @property
+    def sner(self):
+        """ Returns Number of sequence number built on first access """
+        if self._sner is None and self._sn is not None:
+            self._sner = Number(num=self._sn)
+        return self._sner
+
+    @sner.setter
+    def sner(self, sner):
+        self._sner = sner
+        self._sn = None
+
+    @property
+    def fner(self):
+        """ Returns Number of first seen ordinal built on first access """
+        if self._fner is None:
+            self._fner = Number(num=self.fn)
+        return self._fner
+
+    @fner.setter
+    def fner(self, fner):
+        self._fner = fner
+
+    @property
+    def dater(self):
+        """ Returns Dater of first seen datetime built on first access """
+        if self._dater is None and self._dts is not None:
+            self._dater = Dater(dts=self._dts)
+        return self._dater
+
+    @dater.setter
+    def dater(self, dater):
+        self._dater = dater
+        self._dts = None
+
+    @property
+    def tholder(self):
+        """ Returns Tholder of current signing threshold built on first access """
+        if self._tholder is None and self._kt is not None:
+            self._tholder = Tholder(sith=self._kt)
+        return self._tholder
+
+    @tholder.setter
+    def tholder(self, tholder):
+        self._tholder = tholder
+        self._kt = None
+
+    @property
+    def ntholder(self):
+        """ Returns Tholder of next signing threshold built on first access """
+        if self._ntholder is None and self._nt is not None:
+            self._ntholder = Tholder(sith=self._nt)
+        return self._ntholder
+
+    @ntholder.setter
+    def ntholder(self, ntholder):
+        self._ntholder = ntholder
+        self._nt = None
+
+    @property
+    def verfers(self):
+        """ Returns list of Verfers of current signing keys built on first access """
+        if self._verfers is None and self._keys is not None:
+            self._verfers = [Verfer(qb64=key) for key in self._keys]
+        return self._verfers
+
+    @verfers.setter
+    def verfers(self, verfers):
+        self._verfers = verfers
+        self._keys = None
+
+    @property
+    def nexter(self):
+        """ Returns Nexter of next key digests built on first access """
+        if self._nexter is None and self._ndigs is not None:
+            self._nexter = coring.Nexter(digs=self._ndigs)
+        return self._nexter
+
+    @nexter.setter
+    def nexter(self, nexter):
+        self._nexter = nexter
+        self._ndigs = None
+
+    @property
+    def toader(self):
+        """ Returns Number of witness threshold built on first access """
+        if self._toader is None and self._bt is not None:
+            self._toader = Number(num=self._bt)
+        return self._toader
+
+    @toader.setter
+    def toader(self, toader):
+        self._toader = toader
+        self._bt = None
+
+    @property
+    def serder(self):
+        """ Returns Serder of latest event loaded from .db on first access """
+        if self._serder is None and self._said is not None:
+            if (raw := self.db.getEvt(key=dgKey(pre=self._pre, dig=self._said))) is None:
+                raise MissingEntryError(f"Missing event said={self._said} of "
+                                        f"state for pre={self._pre}.")
+            self._serder = Serder(raw=bytes(raw))
+        return self._serder
+
+    @serder.setter
+    def serder(self, serder):
+        self._serder = serder
+        self._said = None
+
 
     def incept(self, serder, estOnly=None):
         """
@@ -1927,31 +2073,32 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                    first=True if not check else False, seqner=seqner, saider=saider,
-                                    firner=firner, dater=dater)
-
-            # nxt and signatures verify so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            # update .nexter
-            self.nexter = serder.nexter
-            self.ntholder = serder.ntholder
-
-            self.toader = toader
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.saider.qb64)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fn = fn
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            with self.db.txn():  # log event and key state in one write transaction
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                        first=True if not check else False, seqner=seqner, saider=saider,
+                                        firner=firner, dater=dater)
+
+                # nxt and signatures verify so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need whole serder for digest agility compare
+                self.ilk = ilk
+                self.tholder = tholder
+                self.verfers = serder.verfers
+                # update .nexter
+                self.nexter = serder.nexter
+                self.ntholder = serder.ntholder
+
+                self.toader = toader
+                self.wits = wits
+                self.cuts = cuts
+                self.adds = adds
+
+                # last establishment event location need this to recognize recovery events
+                self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.saider.qb64)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fn = fn
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -1988,17 +2135,18 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
-
-            # validates so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fn = fn
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            with self.db.txn():  # log event and key state in one write transaction
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False)  # First seen accepted
+
+                # validates so update state
+                self.sner = sner  # sequence number Number instance
+                self.serder = serder  # need for digest agility includes .serder.diger
+                self.ilk = ilk
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    self.fn = fn
+                    self.dater = Dater(dts=dts)
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2363,39 +2511,76 @@ class Kever:
                 If cloned mode then dater maybe provided (not None)
                 When dater provided then use dater for first seen datetime
         """
-        fn = None  # None means not a first seen log event so does not return an fn
-        dgkey = dgKey(serder.preb, serder.saidb)
-        dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        if first:  # append event dig to first seen database in order
-            if seqner and saider:  # authorized delegated or issued event
-                couple = seqner.qb64b + saider.qb64b
-                self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
-            fn = self.db.appendFe(serder.preb, serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:
-                    self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
-                                          fn=fn, firner=firner, dater=dater))
-                logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
-                            serder.preb, fn, firner.sn, serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
-                        serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
-        logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
-                    serder.preb, serder.pretty())
-        return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
+        with self.db.txn():
+            fn = None  # None means not a first seen log event so does not return an fn
+            dgkey = dgKey(serder.preb, serder.saidb)
+            dtsb = helping.nowIso8601().encode("utf-8")
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            if first:  # append event dig to first seen database in order
+                if seqner and saider:  # authorized delegated or issued event
+                    couple = seqner.qb64b + saider.qb64b
+                    self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:
+                        self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
+                                              fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
+                                serder.preb, fn, firner.sn, serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                if serder.est:  # index latest est event wrt sn of event
+                    self.db.setEst(serder.preb, serder.sn, Seqner(sn=serder.sn), serder.saider)
+                    self.db.delEsts(serder.preb, serder.sn)  # superseded by recovery if any
+                else:  # first seen non est event is in order so .lastEst is current
+                    self.db.setEst(serder.preb, serder.sn, Seqner(sn=self.lastEst.s),
+                                   Saider(qb64=self.lastEst.d))
+                self.db.addAnchors(serder)
+                self.wakeEscrows(serder)
+                logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
+                            serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+            logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
+                        serder.preb, serder.pretty())
+            return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
+
+    def wakeEscrows(self, serder):
+        """
+        Mark escrowed entries that depend on first seen event serder as ready
+        for the next pass of their escrow processor.
+
+        Out of order events wait on the prior event so wake the next sn.
+        Receipts and unverified witness or query entries wait on the event
+        itself so wake at its sn or its prefix. Partial signature and witness
+        entries at its sn are stale once it is accepted so wake them to be
+        removed. Delegation and validator
+        dependencies are not keyed by the dependent event so seals in serder
+        sweep the partial escrows and establishment events sweep the
+        validator receipt escrow.
+
+        Parameters:
+            serder (Serder): first seen accepted event
+        """
+        self.db.wakeEscrow(self.db.ooes, snKey(serder.preb, serder.sn + 1))
+        sn = snKey(serder.preb, serder.sn)
+        for db in (self.db.uwes, self.db.ures, self.db.vres, self.db.pses, self.db.pwes):
+            self.db.wakeEscrow(db, sn)
+        self.db.wakeEscrowPre(self.db.qnfs, serder.preb)
+        if serder.ked.get("a"):  # seals may anchor delegated events
+            self.db.sweepEscrow(self.db.pses)
+            self.db.sweepEscrow(self.db.pwes)
+        if serder.ked["t"] in (Ilks.icp, Ilks.rot, Ilks.dip, Ilks.drt):
+            self.db.sweepEscrow(self.db.vres)
 
     def escrowPSEvent(self, serder, sigers, wigers=None):
         """
@@ -2407,16 +2592,21 @@ class Kever:
             sigers is list of Siger instances of indexed controller sigs
             wigers is optional list of Siger instance of indexed witness sigs
         """
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        self.db.putEvt(dgkey, serder.raw)
-        snkey = snKey(serder.preb, serder.sn)
-        self.db.addPse(snkey, serder.saidb)  # b'EOWwyMU3XA7RtWdelFt-6waurOTH_aW_Z9VTaU-CshGk.00000000000000000000000000000001'
-        logger.info("Kever state: Escrowed partially signed or delegated "
-                    "event = %s\n", serder.ked)
+        with self.db.txn():
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+            cnt = self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey)
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putEvt(dgkey, serder.raw)
+            snkey = snKey(serder.preb, serder.sn)
+            # new entry wakes itself so only wake existing entry on new sigs
+            if (not self.db.addPse(snkey, serder.saidb) and  # b'EOWwyMU3XA7RtWdelFt-6waurOTH_aW_Z9VTaU-CshGk.00000000000000000000000000000001'
+                    self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey) > cnt):
+                self.db.wakeEscrow(self.db.pses, snkey)  # new sigs may complete escrowed event
+            logger.info("Kever state: Escrowed partially signed or delegated "
+                        "event = %s\n", serder.ked)
 
     def escrowPACouple(self, serder, seqner, saider):
         """
@@ -2436,7 +2626,8 @@ class Kever:
         """
         dgkey = dgKey(serder.preb, serder.saidb)
         couple = seqner.qb64b + saider.qb64b
-        self.db.putPde(dgkey, couple)  # idempotent
+        if self.db.putPde(dgkey, couple):  # idempotent so only wake when new
+            self.db.wakeEscrow(self.db.pses, snKey(serder.preb, serder.sn))
         logger.info("Kever state: Escrowed source couple for partially signed "
                     "or delegated event = %s\n", serder.ked)
 
@@ -2451,20 +2642,29 @@ class Kever:
             seqner is Seqner instance of sn of seal source event of delegator/issuer
             saider is Diger instance of digest of delegator/issuer
         """
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if seqner and saider:
-            couple = seqner.qb64b + saider.qb64b
-            self.db.putPde(dgkey, couple)
+        with self.db.txn():
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+            cnt = self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            fresh = self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey) > cnt
+            if seqner and saider:
+                couple = seqner.qb64b + saider.qb64b
+                fresh = self.db.putPde(dgkey, couple) or fresh
 
-        self.db.putEvt(dgkey, serder.raw)
-        logger.info("Kever state: Escrowed partially witnessed "
-                    "event = %s\n", serder.ked)
-        return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+            self.db.putEvt(dgkey, serder.raw)
+            logger.info("Kever state: Escrowed partially witnessed "
+                        "event = %s\n", serder.ked)
+            snkey = snKey(serder.preb, serder.sn)
+            if (added := self.db.addPwe(snkey, serder.saidb)):  # wakes itself
+                for db in (self.db.uwes, self.db.ures):  # escrowed receipts may now find event
+                    self.db.wakeEscrow(db, snkey)
+            elif fresh:  # only wake existing entry on new wigs
+                self.db.wakeEscrow(self.db.pwes, snkey)  # new wigs may complete escrowed event
+            return added
 
 
     def state(self, kind=Serials.json):
@@ -2541,6 +2741,12 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+        checkpoint (bool): True means bootstrap key state of a remote prefix
+                from a key state checkpoint of a trusted source plus the tail
+                and verify the events up to the checkpoint in the background
+                False means always verify from inception
+        ckvys (dict): of verification Kevery keyed by pre of each checkpoint
+                being verified in the background
 
 
     Properties:
@@ -2559,9 +2765,16 @@ class Kevery:
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    # errors processEvent raises after it escrowed the event
+    Escrowed = (OutOfOrderError, MissingSignatureError, MissingWitnessSignatureError,
+                MissingDelegationError, LikelyDuplicitousError)
+    # key state labels a verified checkpoint must match
+    CheckpointLabels = ["i", "s", "p", "d", "et", "kt", "k", "nt", "n",
+                        "bt", "b", "c", "ee", "di"]
 
     def __init__(self, *, evts=None, cues=None, db=None, rvy=None,
-                 lax=True, local=False, cloned=False, direct=True, check=False):
+                 lax=True, local=False, cloned=False, direct=True, check=False,
+                 checkpoint=False):
         """
         Initialize instance:
 
@@ -2584,6 +2797,9 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            checkpoint (bool): True means bootstrap key state of a remote prefix
+                from a key state checkpoint of a trusted source plus the tail
+                False means always verify from inception
         """
         self.evts = evts if evts is not None else decking.Deck()  # subclass of deque
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
@@ -2596,6 +2812,10 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.checkpoint = True if checkpoint else False  # bootstrap from checkpoints
+        self.ckvys = dict()  # background verification Kevery keyed by pre
+        if self.checkpoint:
+            self.resumeCheckpoints()
 
     @property
     def kevers(self):
@@ -2652,6 +2872,83 @@ class Kevery:
         while evts:
             self.processEvent(**evts.pull())
 
+    def processEventBatch(self, evts=None):
+        """
+        Returns number of events in batch processed without error.
+
+        Process event dicts in evts or if evts is None in .evts as one batch.
+        Groups the events by prefix in order of first appearance and processes
+        each group in order of sn so that a catch up replay or bulk import
+        whose events arrive out of order is accepted in order against the
+        evolving key state of .kevers instead of churning the out of order
+        escrow. Duplicate sns such as recovery rotations keep their order of
+        arrival.
+
+        The whole batch is written in one write transaction committed once.
+        Each event is a savepoint so an event that fails validation is logged
+        and its writes up to the error are rolled back without losing the rest
+        of the batch. An event that raises after it was escrowed keeps its
+        escrow writes as with .processEvent.
+
+        An event dict may also carry the receipt couples cigars and receipt
+        quadruples trqs attached to the event. They are processed in their own
+        savepoint once the event is accepted in the same way Parser processes
+        them after the event when not in batch mode.
+
+        Parameters:
+            evts (Deck): each entry is dict that matches call signature of
+                .processEvent plus optional cigars and trqs
+        """
+        if evts is None:
+            evts = self.evts
+
+        groups = {}  # event dicts keyed by pre in order of first appearance
+        while evts:
+            evt = evts.pull()
+            groups.setdefault(evt["serder"].pre, []).append(evt)
+
+        count = 0
+        with self.db.txn():
+            for group in groups.values():
+                group.sort(key=lambda evt: evt["serder"].sn)  # stable sort
+                for evt in group:
+                    cigars = evt.pop("cigars", None)
+                    trqs = evt.pop("trqs", None)
+                    escrowed = None
+                    try:
+                        with self.db.txn(nested=True):
+                            try:
+                                self.processEvent(**evt)
+                            except self.Escrowed as ex:  # keep escrow writes of savepoint
+                                escrowed = ex
+                    except Exception as ex:  # log and continue with rest of batch
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.exception("Kevery batch event error: %s\n", ex)
+                        else:
+                            logger.error("Kevery batch event error: %s\n", ex)
+                        continue
+
+                    if escrowed is not None:
+                        logger.info("Kevery batch event escrowed: %s\n", escrowed)
+                        continue
+                    count += 1
+
+                    if cigars or trqs:
+                        serder, firner = evt["serder"], evt.get("firner")
+                        try:
+                            with self.db.txn(nested=True):
+                                if cigars:
+                                    self.processReceiptCouples(serder, cigars, firner=firner)
+                                if trqs:
+                                    self.processReceiptQuadruples(serder, trqs, firner=firner)
+                        except Exception as ex:  # event stays accepted
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.exception("Kevery batch receipt error: %s\n", ex)
+                            else:
+                                logger.error("Kevery batch receipt error: %s\n", ex)
+
+        return count
+
     def processEvent(self, serder, sigers, *, wigers=None,
                      seqner=None, saider=None,
                      firner=None, dater=None):
@@ -2722,13 +3019,25 @@ class Kevery:
                     #  receipt of actual type is dependent on own type of identifier
                     self.cues.push(dict(kin="receipt", serder=serder))
 
+            elif self.checkpoint and self.bootstrapCheckpoint(serder=serder, sigers=sigers,
+                                                               wigers=wigers):
+                # checkpoint event of trusted checkpoint so key state bootstrapped
+                if self.direct or self.lax or pre not in self.prefixes:
+                    self.cues.push(dict(kin="receipt", serder=serder))
+
             else:  # not inception so can't verify sigs etc, add to out-of-order escrow
                 self.escrowOOEvent(serder=serder, sigers=sigers,
                                    seqner=seqner, saider=saider, wigers=wigers)
                 raise OutOfOrderError("Out-of-order event={}.".format(ked))
 
         else:  # already accepted inception event for pre so already first seen
-            if ilk in (Ilks.icp, Ilks.dip):  # another inception event so maybe duplicitous
+            if self.checkpoint and (ckp := self.db.ckps.get(keys=pre)) is not None \
+                    and ckp.status == "trusted" and sn <= ckp.sn:
+                # event at or before trusted checkpoint so verify in background
+                self.verifyCheckpoint(ckp=ckp, serder=serder, sigers=sigers,
+                                      wigers=wigers, seqner=seqner, saider=saider)
+
+            elif ilk in (Ilks.icp, Ilks.dip):  # another inception event so maybe duplicitous
                 if sn != 0:
                     raise ValueError("Invalid sn={} for inception event={}."
                                      "".format(sn, serder.ked))
@@ -2751,7 +3060,8 @@ class Kevery:
                         # not first seen inception so ignore return
                         kever.logEvent(serder, sigers=sigers, wigers=wigers)  # idempotent update db logs
 
-                else:  # escrow likely duplicitous event
+                elif not self.duplicity(serder=serder, sigers=sigers):
+                    # escrow likely duplicitous event
                     self.escrowLDEvent(serder=serder, sigers=sigers)
                     raise LikelyDuplicitousError("Likely Duplicitous event={}.".format(ked))
 
@@ -2810,10 +3120,232 @@ class Kevery:
                             # not first seen update so ignore return
                             kever.logEvent(serder, sigers=sigers, wigers=wigers)  # idempotent update db logs
 
-                    else:  # escrow likely duplicitous event
+                    elif not self.duplicity(serder=serder, sigers=sigers):
+                        # escrow likely duplicitous event
                         self.escrowLDEvent(serder=serder, sigers=sigers)
                         raise LikelyDuplicitousError("Likely Duplicitous event={}.".format(ked))
 
+    def recordCheckpoint(self, aid, kserder):
+        """
+        Returns True if key state notice kserder from trusted source aid is
+        recorded as pending checkpoint of its prefix Else False.
+
+        A checkpoint is only recorded for a prefix without key state and
+        without a checkpoint already bootstrapped or verified. Delegated
+        prefixes always verify from inception because their delegation seals
+        can not be verified from a checkpoint.
+
+        Parameters:
+            aid (str): identifier prefix qb64 of trusted source of kserder
+            kserder (Serder): key state notice body signed by aid
+        """
+        pre = kserder.pre
+        if pre in self.kevers or kserder.ked["di"]:
+            return False
+        ckp = self.db.ckps.get(keys=pre)
+        if ckp is not None and (ckp.status != "pending" or ckp.sn > kserder.sn):
+            return False
+        ckp = basing.CheckpointRecord(sn=kserder.sn, said=kserder.ked["d"], aid=aid,
+                                      ksn=kserder.ked)
+        self.db.ckps.pin(keys=pre, val=ckp)
+        logger.info("Kevery checkpoint: recorded pending checkpoint of %s at "
+                    "sn %s from %s\n", pre, ckp.sn, aid)
+        return True
+
+    def bootstrapCheckpoint(self, serder, sigers, wigers=None):
+        """
+        Returns True if first seen event serder is the checkpoint event of a
+        pending checkpoint of its prefix and key state is bootstrapped from
+        the checkpoint Else False.
+
+        Verifies the signatures of serder against the keys of the checkpoint
+        key state. Witness signatures are kept but not required because the
+        trusted source already verified witnessing. Raises ValidationError if
+        the signatures do not satisfy the signing threshold.
+
+        Parameters:
+            serder (Serder): instance of first seen event
+            sigers (list): of Siger instances of controller indexed sigs
+            wigers (list): of Siger instances of witness indexed sigs
+        """
+        pre = serder.pre
+        ckp = self.db.ckps.get(keys=pre)
+        if (ckp is None or ckp.status != "pending" or ckp.sn != serder.sn
+                or ckp.said != serder.said):
+            return False
+
+        if not serder.saider.verify(sad=serder.ked):
+            raise ValidationError("Invalid SAID {} for event {}".format(serder.said, serder.ked))
+
+        state = Serder(ked=ckp.ksn)
+        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers,
+                                     verfers=[Verfer(qb64=key) for key in ckp.ksn["k"]])
+        if not Tholder(sith=ckp.ksn["kt"]).satisfy(indices):
+            raise ValidationError("Failure satisfying sith = {} on sigs for {}"
+                                  " of checkpoint event={}.".format(ckp.ksn["kt"],
+                                                                    [siger.qb64 for siger in sigers],
+                                                                    serder.ked))
+        wigers, _ = verifySigs(raw=serder.raw, sigers=wigers,
+                               verfers=[Verfer(qb64=wit) for wit in ckp.ksn["b"]])
+
+        with self.db.txn():
+            self.db.putEvt(dgKey(serder.preb, serder.saidb), serder.raw)
+            kever = Kever(state=state, db=self.db, cues=self.cues,
+                          prefixes=self.prefixes, local=self.local)
+            fn, dts = kever.logEvent(serder, sigers=sigers, wigers=wigers,
+                                     wits=ckp.ksn["b"] if serder.est else None,
+                                     first=True)
+            kever.fn = fn
+            kever.dater = Dater(dts=dts)
+            self.db.states.pin(keys=pre, val=kever.state())
+            ckp.status = "trusted"
+            self.db.ckps.pin(keys=pre, val=ckp)
+            self.kevers[pre] = kever
+
+        logger.info("Kevery checkpoint: bootstrapped key state of %s at sn %s "
+                    "from checkpoint of %s\n", pre, ckp.sn, ckp.aid)
+        return True
+
+    def openCheckpointKevery(self, pre):
+        """
+        Returns verification Kevery of the checkpoint of prefix pre on its
+        verification database. The database is kept on disk beside .db unless
+        .db is temporary so background verification survives a restart.
+
+        Parameters:
+            pre (str): identifier prefix qb64 of checkpoint
+        """
+        db = basing.Baser(name=pre,
+                          base=os.path.join(self.db.base, "checkpoint", self.db.name),
+                          headDirPath=self.db.headDirPath, temp=self.db.temp,
+                          reopen=True)
+        return Kevery(db=db, lax=True, local=False, direct=False)
+
+    def resumeCheckpoints(self):
+        """
+        Resumes background verification of each trusted checkpoint in .db.ckps
+        after a restart on its verification database kept on disk. Cues a
+        query of the KEL of each so the events up to the checkpoint that did
+        not reach the verification database before the restart are requested
+        again. Otherwise the checkpoint would stay trusted without ever being
+        verified.
+        """
+        for (pre,), ckp in self.db.ckps.getItemIter():
+            if ckp.status != "trusted" or pre in self.ckvys:
+                continue
+            self.ckvys[pre] = self.openCheckpointKevery(pre)
+            self.cues.push(dict(kin="query", q=dict(pre=pre)))
+            logger.info("Kevery checkpoint: resumed verification of checkpoint "
+                        "of %s at sn %s\n", pre, ckp.sn)
+
+    def verifyCheckpoint(self, ckp, serder, sigers, wigers=None, seqner=None, saider=None):
+        """
+        Process event serder at or before sn of trusted checkpoint ckp of its
+        prefix with the verification Kevery of the checkpoint that verifies the
+        KEL from inception in its own temporary database. Escrowed events wait
+        for .processCheckpoints.
+
+        Parameters:
+            ckp (CheckpointRecord): trusted checkpoint of prefix of serder
+            serder (Serder): instance of event at or before sn of ckp
+            sigers (list): of Siger instances of controller indexed sigs
+            wigers (list): of Siger instances of witness indexed sigs
+            seqner (Seqner): sequence number of delegating event if any
+            saider (Saider): SAID of delegating event if any
+        """
+        pre = serder.pre
+        if (ckvy := self.ckvys.get(pre)) is None:
+            ckvy = self.ckvys[pre] = self.openCheckpointKevery(pre)
+
+        try:
+            ckvy.processEvent(serder=serder, sigers=sigers, wigers=wigers,
+                              seqner=seqner, saider=saider)
+        except ckvy.Escrowed as ex:
+            logger.info("Kevery checkpoint: escrowed verification event: %s\n", ex)
+
+        self.checkCheckpoint(ckp=ckp)
+
+    def checkCheckpoint(self, ckp):
+        """
+        Completes background verification of trusted checkpoint ckp once its
+        verification Kevery accepted the KEL up to the sn of ckp.
+
+        When the verified key state at sn matches the checkpoint the events
+        before the checkpoint event are added to the KEL in .db and the
+        checkpoint is verified. Otherwise the checkpoint failed so the key
+        state and every event logged since bootstrapping from it are dropped
+        and a checkpointFailed cue is pushed to .cues.
+
+        Parameters:
+            ckp (CheckpointRecord): trusted checkpoint
+        """
+        pre = ckp.ksn["i"]
+        ckvy = self.ckvys[pre]
+        kever = ckvy.kevers.get(pre)
+        if kever is None or kever.sner.num < ckp.sn:  # not yet verified up to sn
+            return
+
+        state = kever.state().ked
+        if all(state[label] == ckp.ksn[label] for label in self.CheckpointLabels):
+            self.adoptCheckpoint(ckp=ckp, db=ckvy.db)
+            ckp.status = "verified"
+            logger.info("Kevery checkpoint: verified checkpoint of %s at sn %s\n",
+                        pre, ckp.sn)
+        else:  # downgrade trust and drop KEL bootstrapped from checkpoint
+            self.kevers.pop(pre, None)
+            self.db.delKel(pre)
+            ckp.status = "failed"
+            self.cues.push(dict(kin="checkpointFailed", pre=pre, ckp=ckp))
+            logger.error("Kevery checkpoint: failed checkpoint of %s at sn %s "
+                         "from %s\n", pre, ckp.sn, ckp.aid)
+
+        self.db.ckps.pin(keys=pre, val=ckp)
+        del self.ckvys[pre]
+        ckvy.db.close(clear=True)
+
+    def adoptCheckpoint(self, ckp, db):
+        """
+        Adds the events before the checkpoint event of verified checkpoint ckp
+        from database db of its verification Kevery to the KEL in .db in their
+        order of first seen in db.
+
+        Parameters:
+            ckp (CheckpointRecord): checkpoint verified by db
+            db (Baser): database of verification Kevery
+        """
+        pre = ckp.ksn["i"]
+        preb = pre.encode("utf-8")
+        kever = self.kevers[pre]
+        with self.db.txn():
+            for _, dig in db.getFelItemPreIter(preb):
+                if bytes(dig).decode("utf-8") == ckp.said:  # already in .db
+                    continue
+                dgkey = dgKey(preb, dig)
+                serder = Serder(raw=bytes(db.getEvt(dgkey)))
+                sigers = [Siger(qb64b=bytes(sig)) for sig in db.getSigs(dgkey)]
+                wigers = [Siger(qb64b=bytes(wig)) for wig in db.getWigs(dgkey)]
+                wits = [wit.qb64 for wit in db.wits.get(keys=dgkey)]
+                kever.logEvent(serder, sigers=sigers, wigers=wigers, wits=wits)
+                fn = self.db.appendFe(preb, serder.saidb)
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                if (est := db.getEst(preb, serder.sn)) is not None:
+                    self.db.setEst(preb, serder.sn, *est)
+                self.db.addAnchors(serder)
+        self.db.wakeEscrowPre(self.db.qnfs, preb)  # queries waiting on verification
+
+    def processCheckpoints(self):
+        """
+        Process escrows of each verification Kevery in .ckvys and complete the
+        background verification of its checkpoint when done
+        """
+        for pre, ckvy in list(self.ckvys.items()):
+            ckvy.processEscrows()
+            if (ckp := self.db.ckps.get(keys=pre)) is None or ckp.status != "trusted":
+                del self.ckvys[pre]
+                ckvy.db.close(clear=True)
+                continue
+            self.checkCheckpoint(ckp=ckp)
+
     def processReceiptWitness(self, serder, wigers):
         """
         Process one witness receipt serder with attached witness sigers
@@ -2974,7 +3506,7 @@ class Kevery:
         # Only accept receipt if event is latest event at sn. Means its been
         # first seen and is the most recent first seen with that sn
         if firner:
-            ldig = self.db.getFe(key=fnKey(pre=pre, sn=firner.sn))
+            ldig = self.db.getFe(key=self.db.ordKey(self.db.fels, pre=pre, on=firner.sn))
         else:
             ldig = self.db.getKeLast(key=snKey(pre=pre, sn=sn))  # retrieve dig of last event at sn.
 
@@ -3128,7 +3660,7 @@ class Kevery:
         sn = serder.sn
 
         if firner:  # retrieve last event by fn ordinal
-            ldig = self.db.getFe(key=fnKey(pre=pre, sn=firner.sn))
+            ldig = self.db.getFe(key=self.db.ordKey(self.db.fels, pre=pre, on=firner.sn))
         else:
             # Only accept receipt if for last seen version of receipted event at sn
             ldig = self.db.getKeLast(key=snKey(pre=pre, sn=sn))  # retrieve dig of last event at sn.
@@ -3540,6 +4072,8 @@ class Kevery:
 
         # Only accept key state if for last seen version of event at sn
         if ldig is None:  # escrow because event does not yet exist in database
+            if self.checkpoint and (self.lax or aid in wats):  # trusted source
+                self.recordCheckpoint(aid=aid, kserder=kserder)
             if self.escrowKeyStateNotice(pre=pre, aid=aid, serder=serder, saider=saider, dater=dater,
                                          cigars=cigars, tsgs=tsgs):
                 self.cues.append(dict(kin="query", q=dict(pre=pre)))
@@ -3767,14 +4301,10 @@ class Kevery:
                     self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
                     raise QueryNotFoundError("Query not found error={}.".format(ked))
 
-            msgs = list()  # outgoing messages
-            for msg in self.db.clonePreIter(pre=pre, fn=0):
-                msgs.append(msg)
+            msgs = list(self.db.replay(pre=pre, fn=0))  # outgoing messages from cache
 
             if kever.delegator:
-                cloner = self.db.clonePreIter(pre=kever.delegator, fn=0)  # create iterator at 0
-                for msg in cloner:
-                    msgs.append(msg)
+                msgs.extend(self.db.replay(pre=kever.delegator, fn=0))
 
             if msgs:
                 self.cues.push(dict(kin="replay", src=src, msgs=msgs, dest=source.qb64))
@@ -3787,8 +4317,13 @@ class Kevery:
                 self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
                 raise QueryNotFoundError("Query not found error={}.".format(ked))
 
+            if self.checkpoint and (ckp := self.db.ckps.get(keys=pre)) is not None \
+                    and ckp.status == "trusted":  # do not vouch for unverified key state
+                self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
+                raise QueryNotFoundError("Unverified checkpoint for query={}.".format(ked))
+
             kever = self.kevers[pre]
-            ksn = kever.state()
+            ksn = self.db.response(pre, ("ksn",), kever.state)  # cached until new event
             self.cues.push(dict(kin="reply", src=src, route="/ksn", serder=ksn, dest=source.qb64))
 
         elif route == "mbx":
@@ -3815,23 +4350,30 @@ class Kevery:
         event in KEL for pre at sn.
         Returns None if no event at sn accepted in KEL for pre
 
+        Looks up est event in establishment event index .db.ests. Walks back
+        the KEL from sn when event at sn was accepted before the index existed.
+
         Parameters:
             pre is qb64 of identifier prefix for KEL
             sn is int sequence number of event in KEL of pre
         """
+        if (couple := self.db.getEst(pre, sn)) is not None:
+            seqner, saider = couple
+            if (raw := self.db.getEvt(key=dgKey(pre=pre, dig=saider.qb64b))) is not None:
+                return Serder(raw=bytes(raw))
 
         found = False
         while not found:
-            dig = bytes(self.db.getKeLast(key=snKey(pre, sn)))
+            dig = self.db.getKeLast(key=snKey(pre, sn))
             if not dig:
                 return None
 
             # retrieve event by dig
-            raw = bytes(self.db.getEvt(key=dgKey(pre=pre, dig=dig)))
+            raw = self.db.getEvt(key=dgKey(pre=pre, dig=bytes(dig)))
             if not raw:
                 return None
 
-            serder = Serder(raw=raw)  # deserialize event raw
+            serder = Serder(raw=bytes(raw))  # deserialize event raw
             if serder.ked["t"] in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):
                 return serder  # establishment event so return
 
@@ -3850,19 +4392,20 @@ class Kevery:
             saider (Saider): instance of dig of event delegatint/issuing event if any
             wigers (list): of witness signatures
         """
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            couple = seqner.qb64b + saider.qb64b
-            self.db.putPde(dgkey, couple)  # idempotent
-        # log escrowed
-        logger.info("Kevery process: escrowed out of order event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+        with self.db.txn():
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                couple = seqner.qb64b + saider.qb64b
+                self.db.putPde(dgkey, couple)  # idempotent
+            # log escrowed
+            logger.info("Kevery process: escrowed out of order event=\n%s\n",
+                        json.dumps(serder.ked, indent=1))
 
     def escrowQueryNotFoundEvent(self, prefixer, serder, sigers, cigars=None):
         """
@@ -3874,19 +4417,20 @@ class Kevery:
             sigers (list): of Siger instance for  event
             cigars (list): of non-transferable receipts
         """
-        cigars = cigars if cigars is not None else []
-        dgkey = dgKey(prefixer.qb64b, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addQnf(dgkey, serder.saidb)
+        with self.db.txn():
+            cigars = cigars if cigars is not None else []
+            dgkey = dgKey(prefixer.qb64b, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addQnf(dgkey, serder.saidb)
 
-        for cigar in cigars:
-            self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
+            for cigar in cigars:
+                self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
 
-        # log escrowed
-        logger.info("Kevery process: escrowed query not found event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+            # log escrowed
+            logger.info("Kevery process: escrowed query not found event=\n%s\n",
+                        json.dumps(serder.ked, indent=1))
 
     def escrowLDEvent(self, serder, sigers):
         """
@@ -3896,14 +4440,15 @@ class Kevery:
             serder is Serder instance of  event
             sigers is list of Siger instance for  event
         """
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
-        # log duplicitous
-        logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
-                    json.dumps(serder.ked, indent=1))
+        with self.db.txn():
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+            # log duplicitous
+            logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
+                        json.dumps(serder.ked, indent=1))
 
     def escrowUWReceipt(self, serder, wigers, said):
         """
@@ -4109,6 +4654,7 @@ class Kevery:
             self.processEscrowDuplicitous()
             self.processEscrowKeyState()
             self.processQueryNotFound()
+            self.processCheckpoints()
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -4117,6 +4663,20 @@ class Kevery:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
             raise ex
 
+    def _expireEscrows(self, db, timeout):
+        """
+        Removes stale entries of indexed escrow sub db db escrowed more than
+        timeout seconds ago by range scan of the escrow expiry index so the
+        escrow walk of each processor need not check staleness per entry.
+
+        Parameters:
+            db (lmdb._Database): indexed escrow sub db of .db such as .db.ooes
+            timeout (float): seconds after which an escrow entry is stale
+        """
+        for ekey, eval in self.db.expireIoEscrows(db, timeout=timeout):
+            logger.info("Kevery unescrow error: Stale event escrow "
+                        " at key = %s val = %s\n", ekey, eval)
+
     def processEscrowOutOfOrders(self):
         """
         Process events escrowed by Kever that are recieved out-of-order.
@@ -4155,32 +4715,13 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        self._expireEscrows(self.db.ooes, timeout=self.TimeoutOOE)
+
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getOoeItemsNextIter(key=key):
+            for ekey, edig in self.db.getReadyIoItemsNextIter(self.db.ooes, key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
                     if eraw is None:
@@ -4288,34 +4829,15 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        self._expireEscrows(self.db.pses, timeout=self.TimeoutPSE)
+
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getPseItemsNextIter(key=key):
+            for ekey, edig in self.db.getReadyIoItemsNextIter(self.db.pses, key=key):
                 eserder = None
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     dgkey = dgKey(pre, bytes(edig))
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgkey)
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgkey)
                     if eraw is None:
@@ -4449,32 +4971,13 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        self._expireEscrows(self.db.pwes, timeout=self.TimeoutPWE)
+
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getPweItemsNextIter(key=key):
+            for ekey, edig in self.db.getReadyIoItemsNextIter(self.db.pwes, key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
                     if eraw is None:
@@ -4616,37 +5119,18 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        self._expireEscrows(self.db.uwes, timeout=self.TimeoutUWE)
+
         ims = bytearray()
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
+            for ekey, ecouple in self.db.getReadyIoItemsNextIter(self.db.uwes, key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
                     #  get escrowed receipt's rdiger of receipted event and
                     # wiger indexed signature of receipted event
                     rdiger, wiger = deWitnessCouple(ecouple)
 
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(rdiger.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", rdiger.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(rdiger.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutUWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", rdiger.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(rdiger.qb64b))
-
                     # lookup database dig of the receipted event in pwes escrow
                     # using pre and sn lastEvt
                     found = self._processEscrowFindUnver(pre=pre,
@@ -4737,36 +5221,17 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        self._expireEscrows(self.db.ures, timeout=self.TimeoutURE)
+
         ims = bytearray()
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
+            for ekey, etriplet in self.db.getReadyIoItemsNextIter(self.db.ures, key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
                     cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
 
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(rsaider.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", rsaider.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(rsaider.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", rsaider.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(rsaider.qb64b))
-
                     # Is receipt for unverified witnessed event in .Pwes escrow
                     # if found then try else clause will remove from escrow
                     found = self._processEscrowFindUnver(pre=pre,
@@ -4829,7 +5294,8 @@ class Kevery:
                             index = wits.index(rpre)
                             # create witness indexed signature and write to db
                             wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                            self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
+                            if self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b):
+                                self.db.wakeEscrow(self.db.pwes, snKey(pre, sn))
                         else:  # write receipt couple to database
                             couple = cigar.verfer.qb64b + cigar.qb64b
                             self.db.addRct(key=dgKey(pre, serder.said), val=couple)
@@ -4888,34 +5354,15 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        self._expireEscrows(self.db.qnfs, timeout=self.TimeoutQNF)
+
         key = ekey = b''  # both start same. when not same means escrows found
         pre = b''
         sn = 0
         while True:  # break when done
-            for ekey, edig in self.db.getQnfItemsNextIter(key=key):
+            for ekey, edig in self.db.getReadyIoItemsNextIter(self.db.qnfs, key=key):
                 try:
                     pre, _ = splitKey(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutQNF):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale qry event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale qry event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
                     if eraw is None:
@@ -5080,7 +5527,8 @@ class Kevery:
                 raise ValidationError("Bad escrowed witness receipt wig"
                                       " at pre={} sn={:x}."
                                       "".format(pre, sn))
-            self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
+            if self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b):
+                self.db.wakeEscrow(self.db.pwes, snKey(pre, sn))
             # processEscrowPartialWigs removes from this .Pwes escrow
             # when fully witnessed using self.db.delPwe(snkey, dig)
 
@@ -5131,35 +5579,16 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        self._expireEscrows(self.db.vres, timeout=self.TimeoutVRE)
+
         ims = bytearray()
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
+            for ekey, equinlet in self.db.getReadyIoItemsNextIter(self.db.vres, key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
                     esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
 
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(esaider.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", esaider.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(esaider.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutVRE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", esaider.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(esaider.qb64b))
-
                     # get dig of the receipted event using pre and sn lastEvt
                     raw = self.db.getKeLast(snKey(pre, sn))
                     if raw is None:
@@ -5302,33 +5731,17 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        An escrowed event is successful once .duplicity proves it duplicitous
+        so it leaves the escrow as duplicity evidence in .db.dups.
         """
+        self._expireEscrows(self.db.ldes, timeout=self.TimeoutLDE)
+
         key = ekey = b''  # both start same. when not same means escrows found
         while True:  # break when done
-            for ekey, edig in self.db.getLdeItemsNextIter(key=key):
+            for ekey, edig in self.db.getReadyIoItemsNextIter(self.db.ldes, key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                    " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
                     if eraw is None:
@@ -5397,15 +5810,73 @@ class Kevery:
 
     def duplicity(self, serder, sigers):
         """
-        PlaceHolder Reminder
-        Processes potential duplicitous events in PDELs
-
-        Handles duplicity detection and logging if duplicitous
-
-        Placeholder here for logic need to move
+        Returns True if event serder that differs from the latest accepted
+        event at its sn is proven duplicitous or is an accepted event that a
+        recovery rotation superseded Else False so it stays likely duplicitous.
+
+        Proven means the sigers of serder satisfy the keys in effect at its sn
+        given by the accepted KEL. For inception these are its own keys. For
+        rotation these are its own keys that must also satisfy the next key
+        digests of the prior establishment event. For interaction these are
+        the keys of the prior establishment event. Proven duplicitous events
+        are logged with their verified signatures and their SAID is added to
+        the duplicity evidence record in .db.dups at (pre, sn). Detection
+        reads only the prior establishment event and the evidence record so
+        it costs the same for every event. A kin duplicitous cue is pushed
+        once per duplicitous event.
 
+        Parameters:
+            serder (Serder): instance of event that differs from accepted event
+            sigers (list): of Siger instances of controller indexed sigs
         """
-        pass
+        pre = serder.pre
+        sn = serder.sn
+        said = serder.said
+        ilk = serder.ked["t"]
+        keys = (pre, "%032x" % sn)
+        accepted = [bytes(dig).decode("utf-8") for dig in self.db.getKes(snKey(pre, sn))]
+        if not accepted:  # no accepted event at sn to be duplicitous of
+            return False
+        if said in accepted:  # superseded by recovery so not duplicitous
+            return True
+        duper = self.db.dups.get(keys=keys)
+
+        if ilk in (Ilks.icp, Ilks.dip):
+            verfers, tholder = serder.verfers, serder.tholder
+            eserder = None
+        else:
+            if sn < 1 or (eserder := self.fetchEstEvent(pre, sn - 1)) is None:
+                return False  # prior key state not known
+            if ilk in (Ilks.rot, Ilks.drt):
+                verfers, tholder = serder.verfers, serder.tholder
+            else:
+                verfers, tholder = eserder.verfers, eserder.tholder
+
+        if not serder.saider.verify(sad=serder.ked):
+            return False
+        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+        if not tholder.satisfy(indices):
+            return False
+        if ilk in (Ilks.rot, Ilks.drt) and (eserder.ntholder is None or
+                                            not eserder.ntholder.satisfy(
+                                                indices=eserder.nexter.matches(sigers=sigers))):
+            return False
+
+        with self.db.txn():
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            if duper is None:
+                duper = basing.DuplicityRecord(accepted=accepted[0], dt=helping.nowIso8601())
+            if said not in duper.saids:
+                duper.saids.append(said)
+                self.db.dups.pin(keys=keys, val=duper)
+                self.cues.push(dict(kin="duplicitous", serder=serder))
+                logger.info("Kevery process: duplicitous event of %s at sn %s "
+                            "accepted %s\nEvent=\n%s\n", pre, sn, duper.accepted,
+                            serder.pretty())
+        return True
 
 
 def loadEvent(db, preb, dig):
@@ -89,10 +89,14 @@ class Parser:
                 whenever stream includes pipelined count codes.
         kvy (Kevery): route KEL message types to this instance
         tvy (Tevery): route TEL message types to this instance
+        batch (bool): True means push event messages onto .kvy.evts for
+                Kevery.processEventBatch instead of processing each one
+                as it is parsed
 
     """
 
-    def __init__(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
+    def __init__(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None, exc=None, rvy=None, vry=None,
+                 batch=False):
         """
         Initialize instance:
 
@@ -107,6 +111,8 @@ class Parser:
             exc (Exchanger): route EXN message types to this instance
             rvy (Revery): reply (RPY) message handler
             vry (Verfifier): credential verifier with wallet storage
+            batch (bool): True means push event messages onto kvy.evts for
+                Kevery.processEventBatch instead of processing each one
         """
         self.ims = ims if ims is not None else bytearray()
         self.framed = True if framed else False  # extract until end-of-stream
@@ -116,6 +122,7 @@ class Parser:
         self.exc = exc
         self.rvy = rvy
         self.vry = vry
+        self.batch = True if batch else False
 
     @staticmethod
     def sniff(ims):
@@ -656,6 +663,52 @@ class Parser:
 
         return True  # should never return
 
+    def chunkParsator(self, chunks, pipeline=None, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
+        """
+        Returns generator to parse all messages from a large stream provided as
+        an iterable of chunks such as memoryview slices of a memory mapped file.
+        Each chunk is appended to a small working buffer that is parsed as far
+        as possible before the next chunk is appended so the stream is never
+        copied into memory as a whole and the buffer stays small. Messages may
+        span chunks so the stream is always parsed as not framed. Yields once
+        after each chunk is parsed.
+
+        Parameters:
+            chunks (Iterable): of bytes like chunks of stream in order
+
+            pipeline is Boolean, True means use pipeline processor to process
+                ims msgs when stream includes pipelined count codes.
+
+            kvy (Kevery): route KERI KEL message types to this instance
+            tvy (Tevery): route TEL message types to this instance
+            exc (Exchanger) route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verifier): credential processor
+
+        Yields:
+            size (int): number of bytes of stream not yet parsed after chunk
+
+        A final message without attachments counted in a pipelined group stays
+        unparsed at end of stream since it may be followed by more attachments.
+        Messages cloned by Baser.cloneEvtMsg are pipelined.
+        """
+        ims = bytearray()
+        parsator = self.parsator(ims=ims,
+                                 framed=False,
+                                 pipeline=pipeline,
+                                 kvy=kvy,
+                                 tvy=tvy,
+                                 exc=exc,
+                                 rvy=rvy,
+                                 vry=vry)
+        for chunk in chunks:
+            ims.extend(chunk)
+            size = None
+            while ims and len(ims) != size:  # until empty or waiting for more
+                size = len(ims)
+                next(parsator)
+            yield len(ims)
+
     def msgParsator(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None, exc=None, rvy=None, vry=None):
         """
         Returns generator that upon each iteration extracts and parses msg
@@ -982,18 +1035,29 @@ class Parser:
                     raise kering.ValidationError("Missing attached signature(s) for evt "
                                                  "= {}.".format(serder.ked))
                 try:
-                    kvy.processEvent(serder=serder,
-                                     sigers=sigers,
-                                     wigers=wigers,
-                                     seqner=seqner,
-                                     saider=saider,
-                                     firner=firner,
-                                     dater=dater)
-
-                    if cigars:
-                        kvy.processReceiptCouples(serder, cigars, firner=firner)
-                    if trqs:
-                        kvy.processReceiptQuadruples(serder, trqs, firner=firner)
+                    if self.batch:  # receipts are processed after event by batch
+                        kvy.evts.push(dict(serder=serder,
+                                           sigers=sigers,
+                                           wigers=wigers,
+                                           seqner=seqner,
+                                           saider=saider,
+                                           firner=firner,
+                                           dater=dater,
+                                           cigars=cigars,
+                                           trqs=trqs))
+                    else:
+                        kvy.processEvent(serder=serder,
+                                         sigers=sigers,
+                                         wigers=wigers,
+                                         seqner=seqner,
+                                         saider=saider,
+                                         firner=firner,
+                                         dater=dater)
+
+                        if cigars:
+                            kvy.processReceiptCouples(serder, cigars, firner=firner)
+                        if trqs:
+                            kvy.processReceiptQuadruples(serder, trqs, firner=firner)
 
                 except AttributeError as e:
                     raise kering.ValidationError("No kevery to process so dropped msg"
@@ -3,7 +3,6 @@
 keri.core.routing module
 
 """
-import datetime
 import logging
 import re
 
@@ -12,7 +11,6 @@ from hio.help import decking
 from . import eventing, coring
 from .. import help, kering
 from ..db import dbing
-from ..help import helping
 
 logger = help.ogler.getLogger()
 
@@ -449,6 +447,19 @@ class Revery:
         quadkeys = (saider.qb64, prefixer.qb64, f"{seqner.sn:032x}", ssaider.qb64)
         self.db.ssgs.put(keys=quadkeys, vals=sigers)
         self.db.rpes.put(keys=(route,), vals=[saider])
+        self.db.rpxs.put(route, saider.qb64b)  # index escrow time for expiry
+
+    def removeEscrowReply(self, route, ion, saider):
+        """ Remove reply escrow entry at route and ion and its expiry index entry
+
+        Parameters:
+            route (str): reply route
+            ion (int): insertion ordinal of entry at route
+            saider (Saider): instance from said in serder (SAD)
+
+        """
+        self.db.rpes.remIokey(iokeys=(route, ion))
+        self.db.rpxs.rem(route, saider.qb64b)
 
     def processEscrowReply(self):
         """ Process escrows for reply messages.
@@ -459,27 +470,25 @@ class Revery:
         quadruple (prefixer, seqner, diger, siger)
 
         """
+        for route, said in self.db.rpxs.expire(timeout=self.TimeoutRPE):
+            # escrow stale so unescrow with its escrow artifacts
+            saider = coring.Saider(qb64b=said)
+            self.db.rpes.rem(keys=route, val=saider)
+            self.removeReply(saider)
+            logger.info("Kevery unescrow error: Stale reply escrow "
+                        " at route = %s\n", route.decode("utf-8"))
+
         for (route, ion), saider in self.db.rpes.getIoItemIter():
             try:
                 tsgs = eventing.fetchTsgs(db=self.db.ssgs, saider=saider)
 
                 keys = (saider.qb64,)
-                dater = self.db.sdts.get(keys=keys)
                 serder = self.db.rpys.get(keys=keys)
                 try:
-                    if not (dater and serder and tsgs):
+                    if not (serder and tsgs):
                         raise ValueError(f"Missing escrow artifacts at said={saider.qb64}"
                                          f"for route={route}.")
 
-                    # do date math for stale escrow
-                    if ((helping.nowUTC() - dater.datetime) >
-                            datetime.timedelta(seconds=self.TimeoutRPE)):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale reply escrow "
-                                    " at route = %s\n", route)
-
-                        raise kering.ValidationError(f"Stale reply escrow at route = {route}.")
-
                     self.processReply(serder=serder, tsgs=tsgs)
 
                 except kering.UnverifiedReplyError as ex:
@@ -490,7 +499,7 @@ class Revery:
                         logger.error("Kevery unescrow attempt failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # other error so remove from reply escrow
-                    self.db.rpes.remIokey(iokeys=(route, ion))  # remove escrow
+                    self.removeEscrowReply(route, ion, saider)  # remove escrow
                     self.removeReply(saider)  # remove escrow reply artifacts
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrowed due to error: %s\n", ex.args[0])
@@ -498,12 +507,12 @@ class Revery:
                         logger.error("Kevery unescrowed due to error: %s\n", ex.args[0])
 
                 else:  # unescrow succeded
-                    self.db.rpes.remIokey(iokeys=(route, ion))  # remove escrow only
+                    self.removeEscrowReply(route, ion, saider)  # remove escrow only
                     logger.info("Kevery unescrow succeeded for reply=\n%s\n",
                                 serder.pretty())
 
             except Exception as ex:  # log diagnostics errors etc
-                self.db.rpes.remIokey(iokeys=(route, ion))  # remove escrow
+                self.removeEscrowReply(route, ion, saider)  # remove escrow
                 self.removeReply(saider)  # remove escrow reply artifacts
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Kevery unescrowed due to error: %s\n", ex.args[0])
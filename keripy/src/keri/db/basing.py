@@ -19,6 +19,8 @@ So only need to set dupsort first time opened each other opening does not
 need to call it
 """
 
+import datetime
+import multiprocessing
 import os
 import shutil
 from contextlib import contextmanager
@@ -33,40 +35,201 @@ from hio.base import doing
 from . import dbing, koming, subing
 from .. import kering
 
-from ..core import coring, eventing, parsing
+from ..core import coring, eventing
 
 from .. import help
+from ..help import helping
 
 logger = help.ogler.getLogger()
 
+Epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def expStamp(dt):
+    """
+    Returns fixed width hex bytes of microseconds since epoch of aware
+    datetime dt so stamps sort lexicographically in time order.
+    Used in keys of escrow expiry index Baser.exps
+
+    Parameters:
+        dt (datetime.datetime): timezone aware datetime
+    """
+    return b'%016x' % ((dt - Epoch) // datetime.timedelta(microseconds=1))
+
+
+def expDatetime(stamp):
+    """
+    Returns timezone aware datetime of escrow expiry index stamp made by
+    expStamp
+
+    Parameters:
+        stamp (bytes): fixed width hex microseconds since epoch
+    """
+    return Epoch + datetime.timedelta(microseconds=int(stamp, 16))
+
+
+
+class Expirer:
+    """
+    Escrow expiry index of a Suber based escrow sub db such as an IoSetSuber
+    of reply escrows. Shares the escrow expiry index sub dbs .exps and .exks
+    of .db with the indexed escrow sub dbs of Baser under its own label with
+    the same key layout as Baser.putExp so stale escrows are found by a range
+    scan up to the expiry time instead of a walk of the escrow.
+
+    Attributes:
+        db (dbing.LMDBer): database of escrow and index
+        label (bytes): label of escrow in index
+        exps (lmdb._Database): escrow expiry index keyed by label.stamp.key
+        exks (lmdb._Database): reverse index keyed by label.key.val
+    """
+
+    def __init__(self, db, label):
+        """
+        Parameters:
+            db (dbing.LMDBer): database of escrow and index
+            label (bytes | str): label of escrow in index
+        """
+        self.db = db
+        self.label = label.encode("utf-8") if hasattr(label, "encode") else label
+        self.exps = self.db.env.open_db(key=b'exps.', dupsort=True)
+        self.exks = self.db.env.open_db(key=b'exks.')
+
+    def put(self, key, val, dt=None):
+        """
+        Indexes escrow val at effective key at time dt. Returns True if
+        indexed else False if already indexed.
+
+        Parameters:
+            key (bytes | str): effective key of escrow entry
+            val (bytes | str): val of escrow entry
+            dt (datetime.datetime): escrow time. Default now
+        """
+        key, val = self._bytes(key), self._bytes(val)
+        stamp = expStamp(dt if dt is not None else helping.nowUTC())
+        with self.db.txn() as txn:
+            if not txn.put(b'%s.%s.%s' % (self.label, key, val), stamp,
+                           db=self.exks, overwrite=False):
+                return False
+            txn.put(b'%s.%s.%s' % (self.label, stamp, key), val, db=self.exps)
+        return True
+
+    def rem(self, key, val):
+        """
+        Deletes index entry of escrow val at effective key. Returns True if
+        deleted else False if not indexed.
+
+        Parameters:
+            key (bytes | str): effective key of escrow entry
+            val (bytes | str): val of escrow entry
+        """
+        key, val = self._bytes(key), self._bytes(val)
+        with self.db.txn() as txn:
+            rkey = b'%s.%s.%s' % (self.label, key, val)
+            if (stamp := txn.pop(rkey, db=self.exks)) is None:
+                return False
+            txn.delete(b'%s.%s.%s' % (self.label, stamp, key), val, db=self.exps)
+        return True
+
+    def expire(self, timeout, now=None):
+        """
+        Returns list of (key, val) duples of the escrow entries indexed more
+        than timeout seconds before now after deleting their index entries.
+        The caller removes the escrow entries themselves.
+
+        Parameters:
+            timeout (float): seconds after which an escrow entry is stale
+            now (datetime.datetime): time of expiry. Default now
+        """
+        now = now if now is not None else helping.nowUTC()
+        cutoff = b'%s.%s' % (self.label,
+                             expStamp(now - datetime.timedelta(seconds=timeout)))
+        expired = []
+        with self.db.txn() as txn:
+            cursor = txn.cursor(db=self.exps)
+            if cursor.set_range(b'%s.' % self.label):
+                # empty key means cursor is past last item
+                while (ikey := cursor.key()) and ikey < cutoff:
+                    val = bytes(cursor.value())
+                    key = bytes(ikey[len(cutoff) + 1:])  # strip label.stamp.
+                    txn.delete(b'%s.%s.%s' % (self.label, key, val), db=self.exks)
+                    expired.append((key, val))
+                    cursor.delete()  # moves to next item if any
+        return expired
+
+    @staticmethod
+    def _bytes(v):
+        return v.encode("utf-8") if hasattr(v, "encode") else bytes(v)
+
 
 class dbdict(dict):
     """
     Subclass of dict that has db as attribute and employs read through cash
     from db Baser.stts of kever states to reload kever from state in database
     if not in memory as dict item
+
+    When .limit is not None the cache is bounded to .limit items by evicting
+    the least recently used item. Items of local prefixes in .db.prefixes
+    are pinned and never evicted so the cache may exceed .limit when pinned
+    items alone exceed it. Eviction never loses key state because
+    .db.states is authoritative and is persisted on every accepted event so
+    an evicted kever is reloaded from its state on next access.
+
+    Kevers of local prefixes are not built when the database is opened but on
+    first access like any other kever. Those are read through as local.
+
+    Attributes:
+        db (Baser | None): database of read through cache
+        limit (int | None): maximum number of cached items. None is unbounded
+        hits (int): number of reads found in memory
+        misses (int): number of reads not found in memory
+        evictions (int): number of items evicted
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'limit', 'hits', 'misses', 'evictions')  # no .__dict__
 
     def __init__(self, *pa, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.limit = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            val = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
             if (state := self.db.states.get(keys=k)) is None:
                 raise ex  # reraise KeyError
+            local = k in self.db.prefixes
             try:
-                kever = eventing.Kever(state=state, db=self.db)
+                kever = eventing.Kever(state=state, db=self.db,
+                                       prefixes=self.db.prefixes, local=local)
+                if local:  # local kevers sign so load latest event now
+                    _ = kever.serder
             except kering.MissingEntryError:  # no kel event for keystate
                 raise ex  # reraise KeyError
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.limit is not None:  # move to most recently used end
+            super(dbdict, self).__delitem__(k)
+            super(dbdict, self).__setitem__(k, val)
+        return val
+
+    def __setitem__(self, k, v):
+        if self.limit is not None:
+            if super(dbdict, self).__contains__(k):  # move to most recently used end
+                super(dbdict, self).__delitem__(k)
+            super(dbdict, self).__setitem__(k, v)
+            self.evict()
+        else:
+            super(dbdict, self).__setitem__(k, v)
+
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
             try:
@@ -83,6 +246,22 @@ class dbdict(dict):
         else:
             return self.__getitem__(k)
 
+    def evict(self):
+        """
+        Evicts least recently used unpinned items until at most .limit items
+        remain or only pinned items remain
+        """
+        pinned = self.db.prefixes if self.db is not None else ()
+        scans = len(self)  # each item is visited at most once
+        while len(self) > self.limit and scans > 0:
+            scans -= 1
+            k = next(iter(self))  # least recently used
+            v = super(dbdict, self).pop(k)
+            if k in pinned:  # keep at most recently used end
+                super(dbdict, self).__setitem__(k, v)
+            else:
+                self.evictions += 1
+
 
 @dataclass
 class OobiQueryRecord:  # information for responding to OOBI query
@@ -159,6 +338,80 @@ class HabitatRecord:  # baser.habs
     watchers: list[str] = field(default_factory=list)  # id prefixes qb64 of watchers
 
 
+def anchorKeys(anchor):
+    """
+    Returns keys tuple of anchor index Baser.ancs for event seal anchor
+
+    Raises ValueError when anchor is not a valid event seal
+
+    Parameters:
+        anchor (dict): event seal with identifier prefix i, sequence number s
+            as int or hex str and digest d
+    """
+    if not isinstance(anchor["i"], str) or not isinstance(anchor["d"], str):
+        raise ValueError(f"Invalid event seal anchor={anchor}.")
+    sn = anchor["s"] if isinstance(anchor["s"], int) else int(anchor["s"], 16)
+    return (anchor["i"], "%032x" % sn, anchor["d"])
+
+
+@dataclass
+class StartupRecord:  # baser.strt
+    """
+    Compact startup snapshot of .habs (baser.strt) so that reload reads one
+    record instead of walking .habs and building a Kever for each hab.
+    Any write to .habs drops the snapshot and the next reload rebuilds it.
+
+    Attributes:
+        names (dict): hab name keyed by identifier prefix qb64 of each valid hab
+    """
+    names: dict = field(default_factory=dict)  # hab names keyed by hid
+
+
+@dataclass
+class CheckpointRecord:  # baser.ckps
+    """
+    Key state checkpoint of a remote identifier prefix keyed by that prefix
+    (baser.ckps). A trusted source fully verified the KEL up to sn and signed
+    the key state notice ksn at that sn. Key state bootstraps from the
+    checkpoint event plus the tail while the events up to sn are verified
+    in the background.
+
+    Attributes:
+        sn (int): sequence number of checkpoint event
+        said (str): SAID qb64 of checkpoint event
+        aid (str): identifier prefix qb64 of trusted source of checkpoint
+        ksn (dict): key state notice body at sn signed by aid
+        status (str): one of pending, trusted, verified or failed where
+            pending means checkpoint event not yet seen,
+            trusted means key state bootstrapped from checkpoint,
+            verified means full verification up to sn matched checkpoint,
+            failed means full verification did not match so key state dropped
+    """
+    sn: int
+    said: str
+    aid: str
+    ksn: dict = field(default_factory=dict)
+    status: str = "pending"
+
+
+@dataclass
+class DuplicityRecord:  # baser.dups
+    """
+    Compact duplicity evidence of a controller keyed by identifier prefix and
+    sn (baser.dups). Each SAID is of an event at sn signed by the keys in
+    effect at sn so the raw events and signatures in .evts and .sigs prove
+    the duplicity.
+
+    Attributes:
+        accepted (str): SAID qb64 of first seen event accepted into KEL at sn
+        saids (list[str]): SAIDs qb64 of duplicitous events at sn in order detected
+        dt (str): ISO-8601 datetime of first detection
+    """
+    accepted: str
+    saids: list[str] = field(default_factory=list)
+    dt: str = None
+
+
 @dataclass
 class RotateRecord:
     """
@@ -399,6 +652,95 @@ def reopenDB(db, clear=False, **kwa):
         db.close(clear=clear)
 
 
+def _cloneObjs(kvy, objs):
+    """
+    Process one event with attachments cloned as objects by Baser.cloneEvtObjs
+    into kvy. Errors are logged not raised as when parsed so one bad event
+    does not stop a clean. Event already first seen in db of kvy is skipped so
+    an interrupted clean may be resumed.
+
+    Parameters:
+        kvy (Kevery): Kevery of clean copy
+        objs (tuple): from Baser.cloneEvtObjs
+
+    Returns:
+        result (bool): True means processed False means already first seen
+    """
+    serder, sigers, wigers, (seqner, saider), (cigars, trqs), (firner, dater) = objs
+    if kvy.db.fons.get(keys=(serder.pre, serder.said)) is not None:
+        return False  # already cloned by interrupted clean
+
+    try:
+        kvy.processEvent(serder=serder,
+                         sigers=sigers,
+                         wigers=wigers,
+                         seqner=seqner,
+                         saider=saider,
+                         firner=firner,
+                         dater=dater)
+        if cigars:
+            kvy.processReceiptCouples(serder, cigars, firner=firner)
+        if trqs:
+            kvy.processReceiptQuadruples(serder, trqs, firner=firner)
+    except Exception as ex:  # same as parser so clean detects by missing event
+        logger.error("Baser clean error on event pre=%s sn=%s: %s",
+                     serder.pre, serder.sn, ex.args[0] if ex.args else ex)
+    return True
+
+
+def _cleanPres(name, base, path, clean, mapSize, pres):
+    """
+    Worker process of parallel Baser.clean that clones the KELs of pres from
+    database at path into clean copy at clean. Top level function so it may be
+    run in a spawned process.
+
+    Parameters:
+        name (str): name of Baser
+        base (str): base of Baser
+        path (str): directory path of original database
+        clean (str): directory path of clean copy
+        mapSize (int): map size of clean copy
+        pres (list): of str qb64 identifier prefixes to clone
+
+    Returns:
+        count (int): number of events processed
+    """
+    orig = Baser(name=name, base=base, temp=False, reopen=False)
+    orig.path = path
+    copy = Baser(name=name, base=base, temp=False, mapSize=mapSize, reopen=False)
+    copy.path = clean
+    count = 0
+    with reopenDB(db=orig, reuse=True, readonly=True), reopenDB(db=copy, reuse=True):
+        kvy = eventing.Kevery(db=copy)  # promiscuous mode
+        for pre in pres:
+            for objs in orig.cloneObjPreIter(pre=pre):
+                count += _cloneObjs(kvy=kvy, objs=objs)
+    return count
+
+
+class HabitatKomer(koming.Komer):
+    """
+    Komer of habitat records (baser.habs) that drops the startup snapshot of
+    .db.strt on every write so that a stale snapshot is never reloaded
+    """
+
+    def put(self, keys, val):
+        self.db.strt.rem(keys="habs")
+        return super(HabitatKomer, self).put(keys=keys, val=val)
+
+    def pin(self, keys, val):
+        self.db.strt.rem(keys="habs")
+        return super(HabitatKomer, self).pin(keys=keys, val=val)
+
+    def rem(self, keys):
+        self.db.strt.rem(keys="habs")
+        return super(HabitatKomer, self).rem(keys=keys)
+
+    def trim(self, keys=b""):
+        self.db.strt.rem(keys="habs")
+        return super(HabitatKomer, self).trim(keys=keys)
+
+
 class Baser(dbing.LMDBer):
     """
     Baser sets up named sub databases with Keri Event Logs within main database
@@ -406,8 +748,16 @@ class Baser(dbing.LMDBer):
     Attributes:
         see superclass LMDBer for inherited attributes
 
-        kevers (dict): Kever instances indexed by identifier prefix qb64
+        kevers (dbdict): Kever instances indexed by identifier prefix qb64.
+            Bounded read through cache of .states of at most .KeverLimit
+            kevers that pins the kevers of local .prefixes
         prefixes (OrderedSet): local prefixes corresponding to habitats for this db
+        wakes (dict): in memory sets of ready escrow keys keyed by indexed
+            escrow sub db. Shared by every Kevery of this db
+        sweeps (set): indexed escrow sub dbs due a full walk
+        tallies (dict): in memory counts of entries tried, retried, unescrowed
+            and expired keyed by indexed escrow sub db since .tallied
+        tallied (datetime.datetime): when .tallies were last reset
 
         .evts is named sub DB whose values are serialized events
             dgKey
@@ -419,7 +769,7 @@ class Baser(dbing.LMDBer):
             cloning of event log. Only one value per DB key is allowed.
             Provides append only ordering of accepted first seen events.
             Uses first seen order number or fn.
-            fnKey
+            ordKey
             DB is keyed by identifier prefix plus monotonically increasing first
             seen order number fn.
             Value is digest of serialized event used to lookup event in .evts sub DB
@@ -563,6 +913,21 @@ class Baser(dbing.LMDBer):
             DB is keyed by identifer prefix plus sequence number of key event
             More than one value per DB key is allowed
 
+        .exps is named sub DB of escrow expiry index that maps the label of an
+            escrow sub DB plus escrow time stamp plus escrow key to the escrow
+            vals inserted at that time so stale escrows are found by a range
+            scan up to the expiry time instead of a walk of the escrow.
+            Label is the name of the escrow sub DB without trailing dot
+            Stamp is expStamp of insertion time
+            DB is keyed by label.stamp.key
+            More than one value per DB key is allowed
+
+        .exks is named sub DB of reverse escrow expiry index that maps the
+            label of an escrow sub DB plus escrow key plus escrow val to the
+            expStamp of its entry in .exps so deleting an escrow deletes its
+            index entry.
+            DB is keyed by label.key.val
+
         .fons is named subDB instance of MatterSuber that maps
             (prefix, digest) e.g. dgKey to fn value (first seen ordinal number) of
             the associated event. So one can lookup event digest, get its fn here
@@ -608,6 +973,9 @@ class Baser(dbing.LMDBer):
             Routes such as '/end/role/' and '/loc/scheme'
             key is route bytes,  vals = saider.qb64b of reply 'rpy' msg
 
+        .rpxs is Expirer of .rpes that indexes each escrowed reply by route
+            and said under label 'rpes' in escrow expiry index .exps
+
         .eans is named subDB instance of CesrSuber with klas=Saider that maps
             cid.role.eid to said of reply SAD as auth:  authN by controller cid
             of authZ that designates endpoint provider eid in role
@@ -648,6 +1016,11 @@ class Baser(dbing.LMDBer):
 
 
     """
+    Migrations = dbing.Migrator()  # registry of schema migrations
+    KeverLimit = 10000  # maximum cached kevers, kevers of .prefixes are never evicted
+    VerifierLimit = 1024  # maximum cached verifiers of establishment events
+    ResponseLimit = 256  # maximum prefixes with cached query responses
+    ChunkSize = 65536  # default bytes per chunk of streamed replays
 
     def __init__(self, headDirPath=None, reopen=False, **kwa):
         """
@@ -670,6 +1043,11 @@ class Baser(dbing.LMDBer):
         self.prefixes = oset()
         self._kevers = dbdict()
         self._kevers.db = self  # assign db for read thorugh cache of kevers
+        self._kevers.limit = self.KeverLimit
+        # (tholder, verfers) keyed by (pre, dig) of establishment event
+        self._verifiers = dict()
+        # query responses keyed by response key in dicts keyed by pre
+        self._responses = dict()
 
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -703,7 +1081,10 @@ class Baser(dbing.LMDBer):
         # to avoid namespace collisions with Base64 identifier prefixes.
 
         self.evts = self.env.open_db(key=b'evts.')
-        self.fels = self.env.open_db(key=b'fels.')
+        self.fels = self.openOrdDB(key=b'fels.')
+        # latest establishment event couple Seqner+Saider at or before sn of
+        # each accepted event keyed by ordinal pre and sn
+        self.ests = self.openOrdDB(key=b'ests.')
         self.dtss = self.env.open_db(key=b'dtss.')
         self.aess = self.env.open_db(key=b'aess.')
         self.sigs = self.env.open_db(key=b'sigs.', dupsort=True)
@@ -721,18 +1102,44 @@ class Baser(dbing.LMDBer):
         self.dels = self.env.open_db(key=b'dels.', dupsort=True)
         self.ldes = self.env.open_db(key=b'ldes.', dupsort=True)
         self.qnfs = self.env.open_db(key=b'qnfs.', dupsort=True)
+        self.exps = self.env.open_db(key=b'exps.', dupsort=True)
+        self.exks = self.env.open_db(key=b'exks.')
+        # label in escrow expiry index of each indexed escrow sub db
+        self._exls = {self.ooes: b'ooes', self.pses: b'pses', self.pwes: b'pwes',
+                      self.uwes: b'uwes', self.ures: b'ures', self.vres: b'vres',
+                      self.ldes: b'ldes', self.qnfs: b'qnfs'}
+        # escrows persisted before this open are not ready so walk them once
+        self.wakes = {db: set() for db in self._exls}
+        self.sweeps = set(self._exls)
+        self._sweeping = set()  # indexed escrow sub dbs being walked in full
+        self.tallies = {db: dict(tries=0, retries=0, exits=0, expires=0)
+                        for db in self._exls}
+        self.tallied = helping.nowUTC()
 
         # events as ordered by first seen ordinals
         self.fons = subing.CesrSuber(db=self, subkey='fons.', klas=coring.Seqner)
+        # anchor index maps event seal keys (i, sn, d) of each seal in 'a' of an
+        # accepted event to set of (Prefixer, Seqner, Saider) of anchoring event
+        self.ancs = subing.CatCesrIoSetSuber(db=self, subkey='ancs.',
+                                             klas=(coring.Prefixer, coring.Seqner, coring.Saider))
         # Kever state
         self.states = subing.SerderSuber(db=self, subkey='stts.')  # key states
+        # key state checkpoints of remote prefixes from trusted sources
+        self.ckps = koming.Komer(db=self, subkey='ckps.', schema=CheckpointRecord, )
+        # duplicity evidence keyed by (pre, sn) where sn is 32 char hex
+        self.dups = koming.Komer(db=self, subkey='dups.', schema=DuplicityRecord, )
         self.wits = subing.CesrIoSetSuber(db=self, subkey="wits.", klas=coring.Prefixer)
 
         # habitat application state keyed by habitat name, includes prefix
-        self.habs = koming.Komer(db=self,
+        self.habs = HabitatKomer(db=self,
                                  subkey='habs.',
                                  schema=HabitatRecord, )
 
+        # startup snapshot of .habs keyed by "habs", dropped on write to .habs
+        self.strt = koming.Komer(db=self,
+                                 subkey='strt.',
+                                 schema=StartupRecord, )
+
         # SAD support datetime stamps and signatures indexed and not-indexed
         # all sad  sdts (sad datetime serializations) maps said to date-time
         self.sdts = subing.CesrSuber(db=self, subkey='sdts.', klas=coring.Dater)
@@ -759,6 +1166,8 @@ class Baser(dbing.LMDBer):
         # Routes such as /end/role  /loc/schema
         self.rpes = subing.CesrIoSetSuber(db=self, subkey='rpes.',
                                           klas=coring.Saider)
+        # escrow expiry index of reply escrows keyed by route and said
+        self.rpxs = Expirer(db=self, label=b'rpes')
 
         # auth AuthN/AuthZ by controller at cid of endpoint provider at eid
         # maps key=cid.role.eid to val=said of end reply
@@ -935,9 +1344,28 @@ class Baser(dbing.LMDBer):
 
     def reload(self):
         """
-        Reload stored prefixes and Kevers from .habs
+        Reload stored prefixes of local habs from startup snapshot in .strt so
+        opening takes constant time regardless of the number of habs. Kevers
+        are not built here but read through .kevers from .states on first access.
+
+        When there is no snapshot, walks .habs once to rebuild it. Walk removes
+        bare .habs records without key state or KEL event unless readonly.
+
+        """
+        if (snap := self.strt.get(keys="habs")) is None:
+            snap = self.startup()
+        self.prefixes.update(snap.names)
 
+    def startup(self):
         """
+        Returns:
+            snap (StartupRecord): snapshot of .habs rebuilt by walking .habs
+
+        Persists snapshot in .strt unless readonly. Validates key state of each
+        hab by building its Kever which stays cached in .kevers.
+
+        """
+        snap = StartupRecord()
         removes = []
         for keys, data in self.habs.getItemIter():
             if (state := self.states.get(keys=data.hid)) is not None:
@@ -945,18 +1373,25 @@ class Baser(dbing.LMDBer):
                     kever = eventing.Kever(state=state, db=self,
                                            prefixes=self.prefixes,
                                            local=True)
+                    _ = kever.serder  # local kevers sign so load latest event now
                 except kering.MissingEntryError as ex:  # no kel event for keystate
                     removes.append(keys)  # remove from .habs
                     continue
                 self.kevers[kever.prefixer.qb64] = kever
-                self.prefixes.add(kever.prefixer.qb64)
             elif data.mid is None:  # in .habs but no corresponding key state and not a group so remove
                 removes.append(keys)  # no key state or KEL event for .hab record
+                continue
+            snap.names[data.hid] = keys[0]  # group habs pending key state included
+            self.prefixes.add(data.hid)  # pin kevers of local prefixes while walking
+
+        if not self.readonly:  # readonly replica leaves cleanup to writer
+            for keys in removes:  # remove bare .habs records
+                self.habs.rem(keys=keys)
+            self.strt.pin(keys="habs", val=snap)
 
-        for keys in removes:  # remove bare .habs records
-            self.habs.rem(keys=keys)
+        return snap
 
-    def clean(self):
+    def clean(self, workers=0, resume=False):
         """
         Clean database by creating re-verified cleaned cloned copy
         and then replacing original with cleaned cloned copy
@@ -964,29 +1399,67 @@ class Baser(dbing.LMDBer):
         Database usage should be offline during cleaning as it will be cloned in
         readonly mode
 
-        """
-        # create copy to clone into
-        with openDB(name=self.name,
-                    temp=self.temp,
-                    headDirPath=self.headDirPath,
-                    perm=self.perm,
-                    clean=True) as copy:
+        Events are cloned as objects from .cloneObjAllPreIter straight into
+        Kevery.processEvent of the copy so not serialized and reparsed.
+        Each accepted event is first seen in the copy atomically so the copy
+        is itself the checkpoint of progress. An interrupted clean resumed with
+        resume=True reuses the copy and skips events already first seen in it.
 
+        Parameters:
+            workers (int): number of worker processes that clone prefixes in
+                parallel into the copy. 0 means clone in this process
+            resume (bool): True means resume interrupted clean from its copy
+                False means start over with empty copy
+
+        """
+        marker = self.path + ".clean"  # path of copy of interrupted clean
+        copy = Baser(name=self.name,
+                     base=self.base,
+                     temp=self.temp,
+                     headDirPath=self.headDirPath,
+                     perm=self.perm,
+                     mapSize=self.mapSize,
+                     reopen=False)
+        path = None
+        if resume and os.path.exists(marker):
+            with open(marker, "r") as f:
+                path = f.read()
+        if path and os.path.exists(path):
+            copy.path = path
+            copy.reopen(reuse=True)  # resume into existing copy
+        else:
+            copy.reopen(clean=True)  # create copy to clone into
+            with open(marker, "w") as f:
+                f.write(copy.path)
+
+        try:
             with reopenDB(db=self, reuse=True, readonly=True):  # reopen as readonly
                 if not os.path.exists(self.path):
                     raise ValueError("Error while cleaning, no orig at {}."
                                      "".format(self.path))
 
-                kvy = eventing.Kevery(db=copy)  # promiscuous mode
-
-                # Revise in future to NOT parse msgs but to extract the processed
-                # objects so can pass directly to kvy.processEvent()
-                # need new method cloneObjAllPreIter()
-                # process event doesn't capture exceptions so we can more easily
-                # detect in the cloning that some events did not make it through
-                psr = parsing.Parser(kvy=kvy)
-                for msg in self.cloneAllPreIter():  # clone into copy
-                    psr.parseOne(ims=msg)
+                if workers > 0:
+                    pres = [keys[0] for keys, _ in self.states.getRawItemIter()]
+                    ctx = multiprocessing.get_context("spawn")  # fork unsafe with lmdb
+                    with ctx.Pool(processes=workers) as pool:
+                        args = [(self.name, self.base, self.path, copy.path,
+                                 copy.mapSize, pres[i::workers])
+                                for i in range(workers)]
+                        pool.starmap(_cleanPres, args)
+                    # load read through cache with kevers cloned by workers
+                    cloned = [pre for pre in pres if pre in copy.kevers]
+                    logger.info("Baser clean cloned %s of %s prefixes.",
+                                len(cloned), len(pres))
+                    kvy = eventing.Kevery(db=copy)  # promiscuous mode
+                else:
+                    kvy = eventing.Kevery(db=copy)  # promiscuous mode
+                    for objs in self.cloneObjAllPreIter():  # clone into copy
+                        _cloneObjs(kvy=kvy, objs=objs)
+
+                try:  # events escrowed on a not yet cloned delegator or receiptor
+                    kvy.processEscrows()
+                except Exception as ex:
+                    logger.error("Baser clean escrow error: %s", ex.args[0])
 
                 # clone .habs  habitat name prefix Komer subdb
                 # copy.habs = koming.Komer(db=copy, schema=HabitatRecord, subkey='habs.')  # copy
@@ -1018,11 +1491,14 @@ class Baser(dbing.LMDBer):
             if not dst:  # move failed leave new in place so can manually fix
                 raise ValueError("Error cloning, unable to move {} to {}."
                                  "".format(copy.path, self.path))
+            os.remove(marker)  # clean complete so nothing to resume
 
             # replace own kevers with copy kevers by clear and copy
             # future do this by loading kever from .stts  key state subdb
             self.kevers.clear()
             for pre, kever in copy.kevers.items():
+                kever.db = self  # copy is moved to self so lazy loads read self
+                kever.prefixes = self.prefixes
                 self.kevers[pre] = kever
 
             # replace prefixes with cloned copy prefixes
@@ -1031,11 +1507,14 @@ class Baser(dbing.LMDBer):
             self.prefixes.clear()
             self.prefixes.update(copy.prefixes)
 
-            with reopenDB(db=self, reuse=True):  # make sure can reopen
+            with reopenDB(db=self, reuse=True, readonly=False):  # make sure can reopen
                 if not isinstance(self.env, lmdb.Environment):
                     raise ValueError("Error cloning, unable to reopen."
                                      "".format(self.path))
 
+        finally:
+            copy.close()
+
         # clone success so remove if still there
         if os.path.exists(copy.path):
             shutil.rmtree(copy.path)
@@ -1056,6 +1535,123 @@ class Baser(dbing.LMDBer):
                 continue  # skip this event
             yield msg
 
+    def streamPreIter(self, pre, fn=0, size=None):
+        """
+        Returns iterator of chunks of the first seen event messages with
+        attachments for identifier prefix pre starting at first seen order
+        number fn. Each chunk is a bytearray of whole messages that ends with
+        the message that reaches size bytes so a message larger than size is
+        a chunk of its own.
+
+        Each chunk is read in its own snapshot that resumes after the last
+        message of the prior chunk. So a consumer that pulls the next chunk
+        only once it sent the prior one holds one chunk in memory and no read
+        transaction between pulls.
+
+        Parameters:
+            pre (bytes | str): identifier prefix of replay
+            fn (int): first seen order number to start replay
+            size (int | None): bytes per chunk, default .ChunkSize
+        """
+        size = size if size is not None else self.ChunkSize
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+
+        while True:
+            chunk = bytearray()
+            with self.snapshot():
+                for fn, dig in self.getFelItemPreIter(pre, fn=fn):
+                    try:
+                        chunk.extend(self.cloneEvtMsg(pre=pre, fn=fn, dig=dig))
+                    except Exception:
+                        continue  # skip this event
+                    if len(chunk) >= size:
+                        break
+            if not chunk:
+                return
+            yield chunk
+            fn += 1  # resume after last message of chunk
+
+    def streamAllPreIter(self, key=b'', size=None):
+        """
+        Returns iterator of chunks of the first seen event messages with
+        attachments for all identifier prefixes starting at key. Chunks are
+        made and read as with .streamPreIter.
+
+        Parameters:
+            key (bytes): .ordKey(.fels, pre, fn) to resume replay, empty is first key
+            size (int | None): bytes per chunk, default .ChunkSize
+        """
+        size = size if size is not None else self.ChunkSize
+
+        while True:
+            chunk = bytearray()
+            with self.snapshot():
+                for pre, fn, dig in self.getFelItemAllPreIter(key=key):
+                    key = self.ordKey(self.fels, pre, fn + 1)  # resume after
+                    try:
+                        chunk.extend(self.cloneEvtMsg(pre=pre, fn=fn, dig=dig))
+                    except Exception:
+                        continue  # skip this event
+                    if len(chunk) >= size:
+                        break
+            if not chunk:
+                return
+            yield chunk
+
+    def response(self, pre, key, make):
+        """
+        Returns query response at key for identifier prefix pre from cache.
+        On miss builds the response with make and caches it. Cached responses
+        of pre are dropped on any write to the logs that make up a replay of
+        pre such as a first seen event or a new signature or receipt. Up to
+        .ResponseLimit prefixes are cached in least recently used order.
+
+        Parameters:
+            pre (bytes | str): identifier prefix of response
+            key (tuple): response key such as (route, fn)
+            make (Callable): returns response to cache on miss
+        """
+        if hasattr(pre, "decode"):
+            pre = pre.decode("utf-8")
+        responses = self._responses.pop(pre, None)
+        if responses is None:
+            responses = dict()
+            while len(self._responses) >= self.ResponseLimit:  # evict least recent
+                del self._responses[next(iter(self._responses))]
+        self._responses[pre] = responses  # most recently used at end
+        if key not in responses:
+            responses[key] = make()
+        return responses[key]
+
+    def dropResponses(self, key):
+        """
+        Drops cached query responses of identifier prefix at start of key
+
+        Parameters:
+            key (bytes | str): identifier prefix or key that starts with
+                identifier prefix such as dgKey or .ordKey(.fels, pre, fn)
+        """
+        if not self._responses:
+            return
+        if hasattr(key, "encode"):
+            key = key.encode("utf-8")
+        # split before decode as compact ordinal keys end in a binary ordinal
+        self._responses.pop(bytes(key).split(b".", 1)[0].decode("utf-8"), None)
+
+    def replay(self, pre, fn=0):
+        """
+        Returns tuple of first seen event messages as bytes with attachments
+        for identifier prefix pre starting at first seen order number fn.
+        Cached as query response until a log of pre changes.
+
+        Parameters:
+            pre (bytes | str): identifier prefix of replay
+            fn (int): first seen order number to start replay
+        """
+        return self.response(pre, ("logs", fn),
+                             lambda: tuple(bytes(msg) for msg in self.clonePreIter(pre=pre, fn=fn)))
+
     def cloneAllPreIter(self, key=b''):
         """
         Returns iterator of first seen event messages with attachments for all
@@ -1065,7 +1661,7 @@ class Baser(dbing.LMDBer):
         set of FELs.
 
         Parameters:
-            key (bytes): fnKey(pre, fn)
+            key (bytes): .ordKey(.fels, pre, fn)
         """
         for pre, fn, dig in self.getFelItemAllPreIter(key=key):
             try:
@@ -1085,93 +1681,209 @@ class Baser(dbing.LMDBer):
 
         Returns:
             bytearray: message body with attachments
+
+        Attachments are gathered as db buffers and each byte is copied only
+        once into the returned message. Call within .snapshot() so buffers
+        are zero copy views.
         """
-        msg = bytearray()  # message
-        atc = bytearray()  # attachments
+        atc = []  # attachments as list of buffers copied once into msg below
         dgkey = dbing.dgKey(pre, dig)  # get message
         if not (raw := self.getEvt(key=dgkey)):
             raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-        msg.extend(raw)
+        msg = bytearray(raw)  # message
 
         # add indexed signatures to attachments
         if not (sigs := self.getSigs(key=dgkey)):
             raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
-        atc.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
+        atc.append(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
                                   count=len(sigs)).qb64b)
-        for sig in sigs:
-            atc.extend(sig)
+        atc.extend(sigs)
 
         # add indexed witness signatures to attachments
         if wigs := self.getWigs(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
+            atc.append(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
                                       count=len(wigs)).qb64b)
-            for wig in wigs:
-                atc.extend(wig)
+            atc.extend(wigs)
 
         # add authorizer (delegator/issure) source seal event couple to attachments
         couple = self.getAes(dgkey)
         if couple is not None:
-            atc.extend(coring.Counter(code=coring.CtrDex.SealSourceCouples,
+            atc.append(coring.Counter(code=coring.CtrDex.SealSourceCouples,
                                       count=1).qb64b)
-            atc.extend(couple)
+            atc.append(couple)
 
         # add trans receipts quadruples to attachments
         if quads := self.getVrcs(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.TransReceiptQuadruples,
+            atc.append(coring.Counter(code=coring.CtrDex.TransReceiptQuadruples,
                                       count=len(quads)).qb64b)
-            for quad in quads:
-                atc.extend(quad)
+            atc.extend(quads)
 
         # add nontrans receipts couples to attachments
         if coups := self.getRcts(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples,
+            atc.append(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples,
                                       count=len(coups)).qb64b)
-            for coup in coups:
-                atc.extend(coup)
+            atc.extend(coups)
 
         # add first seen replay couple to attachments
         if not (dts := self.getDts(key=dgkey)):
             raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
-        atc.extend(coring.Counter(code=coring.CtrDex.FirstSeenReplayCouples,
+        atc.append(coring.Counter(code=coring.CtrDex.FirstSeenReplayCouples,
                                   count=1).qb64b)
-        atc.extend(coring.Seqner(sn=fn).qb64b)
-        atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
+        atc.append(coring.Seqner(sn=fn).qb64b)
+        atc.append(coring.Dater(dts=bytes(dts)).qb64b)
 
         # prepend pipelining counter to attachments
-        if len(atc) % 4:
+        size = sum(len(buf) for buf in atc)
+        if size % 4:
             raise ValueError("Invalid attachments size={}, nonintegral"
-                             " quadlets.".format(len(atc)))
+                             " quadlets.".format(size))
         pcnt = coring.Counter(code=coring.CtrDex.AttachedMaterialQuadlets,
-                              count=(len(atc) // 4)).qb64b
+                              count=(size // 4)).qb64b
         msg.extend(pcnt)
-        msg.extend(atc)
+        for buf in atc:
+            msg.extend(buf)
         return msg
 
+    def cloneObjPreIter(self, pre, fn=0):
+        """
+        Returns iterator of first seen events with attachments as objects for
+        the identifier prefix pre starting at first seen order number, fn.
+        Like .clonePreIter but each item is the tuple of .cloneEvtObjs
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix
+            fn (int): first seen ordinal number to start at
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+
+        for fn, dig in self.getFelItemPreIter(pre, fn=fn):
+            try:
+                objs = self.cloneEvtObjs(pre=pre, fn=fn, dig=dig)
+            except Exception:
+                continue  # skip this event
+            yield objs
+
+    def cloneObjAllPreIter(self, key=b''):
+        """
+        Returns iterator of first seen events with attachments as objects for
+        all identifier prefixes starting at key. If key == b'' then start at
+        first key in database. Use key to resume.
+        Like .cloneAllPreIter but each item is the tuple of .cloneEvtObjs so
+        may be passed directly to Kevery.processEvent without serializing and
+        reparsing.
+
+        Parameters:
+            key (bytes): .ordKey(.fels, pre, fn)
+        """
+        for pre, fn, dig in self.getFelItemAllPreIter(key=key):
+            try:
+                objs = self.cloneEvtObjs(pre=pre, fn=fn, dig=dig)
+            except Exception:
+                continue  # skip this event
+            yield objs
+
+    def cloneEvtObjs(self, pre, fn, dig):
+        """
+        Clones Event with its attachments as the objects that the parser would
+        extract from the message of .cloneEvtMsg
+
+        Parameters:
+            pre (bytes): identifier prefix of event
+            fn (int): first seen number (ordinal) of event
+            dig (bytes): digest of event
+
+        Returns:
+            objs (tuple): (serder, sigers, wigers, seal, receipts, first) where
+                serder (Serder): event
+                sigers (list): of Siger controller indexed signatures
+                wigers (list): of Siger witness indexed signatures
+                seal (tuple): (seqner, saider) of authorizer (delegator/issuer)
+                    source seal event couple else (None, None)
+                receipts (tuple): (cigars, trqs) where cigars is list of Cigar
+                    nontrans receipt signatures with .verfer of receiptor and
+                    trqs is list of (prefixer, seqner, saider, siger) trans
+                    receipt quadruples
+                first (tuple): (firner, dater) first seen replay couple
+        """
+        dgkey = dbing.dgKey(pre, dig)
+        if not (raw := self.getEvt(key=dgkey)):
+            raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
+        serder = coring.Serder(raw=bytes(raw))
+
+        if not (sigs := self.getSigs(key=dgkey)):
+            raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
+        sigers = [coring.Siger(qb64b=bytes(sig)) for sig in sigs]
+        wigers = [coring.Siger(qb64b=bytes(wig)) for wig in self.getWigs(key=dgkey)]
+
+        seal = (None, None)
+        if (couple := self.getAes(dgkey)) is not None:
+            seal = eventing.deSourceCouple(couple)
+
+        cigars = []
+        for coup in self.getRcts(key=dgkey):
+            prefixer, cigar = eventing.deReceiptCouple(coup)
+            cigar.verfer = coring.Verfer(qb64b=prefixer.qb64b)
+            cigars.append(cigar)
+        trqs = [eventing.deTransReceiptQuadruple(quad)
+                for quad in self.getVrcs(key=dgkey)]
+
+        if not (dts := self.getDts(key=dgkey)):
+            raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
+        first = (coring.Seqner(sn=fn), coring.Dater(dts=bytes(dts)))
+
+        return (serder, sigers, wigers, seal, (cigars, trqs), first)
+
     def findAnchoringEvent(self, pre, anchor):
         """
-        Search through a KEL for the event that contains a specific anchor.
-        Returns the Serder of the first event with the anchor, None if not found
+        Look up in anchor index .ancs the event in a KEL that contains a
+        specific anchor.
+        Returns the Serder of the first fully witnessed event with the anchor,
+        None if not found
 
         Parameters:
             pre is qb64 identifier of the KEL to search
             anchor is dict of anchor to find
 
         """
-        for evt in self.clonePreIter(pre=pre):
-            srdr = coring.Serder(raw=evt)
-            if "a" in srdr.ked:
-                ancs = srdr.ked["a"]
-                for anc in ancs:
-                    spre = anc["i"]
-                    ssn = int(anc["s"])
-                    sdig = anc["d"]
-
-                    if spre == anchor["i"] and ssn == int(anchor["s"]) \
-                            and anchor["d"] == sdig and self.fullyWitnessed(srdr):
-                        return srdr
+        try:
+            keys = anchorKeys(anchor)
+        except (KeyError, TypeError, ValueError):  # not an event seal
+            return None
+
+        for prefixer, seqner, saider in self.ancs.getIter(keys=keys):
+            if prefixer.qb64 != pre:  # anchored in other KEL
+                continue
+            if (raw := self.getEvt(key=dbing.dgKey(prefixer.qb64b, saider.qb64b))) is None:
+                continue
+            srdr = coring.Serder(raw=bytes(raw))
+            if self.fullyWitnessed(srdr):
+                return srdr
 
         return None
 
+    def addAnchors(self, serder):
+        """
+        Index each event seal in 'a' of accepted event serder in .ancs
+        Returns number of seals newly indexed
+
+        Parameters:
+            serder (Serder): accepted event
+        """
+        count = 0
+        anchoring = None
+        for seal in serder.ked.get("a", []):
+            try:
+                keys = anchorKeys(seal)
+            except (KeyError, TypeError, ValueError):  # only event seals anchor events
+                continue
+            if anchoring is None:
+                anchoring = (coring.Prefixer(qb64=serder.pre),
+                             coring.Seqner(sn=serder.sn), serder.saider)
+            if self.ancs.add(keys=keys, val=anchoring):
+                count += 1
+        return count
+
     def fullyWitnessed(self, serder):
         """ Verify the witness threshold on the event
 
@@ -1197,6 +1909,10 @@ class Baser(dbing.LMDBer):
         Returns the Tholder and Verfers for the provided identifier prefix.
         Default pre is own .pre
 
+        Parsed verifiers of transferable est events are cached by (pre, dig) in
+        least recently used order up to .VerifierLimit. Est events are immutable
+        so cached verifiers never go stale.
+
         Parameters:
             pre(str) is qb64 str of bytes of identifier prefix.
             sn(int) is the sequence number of the est event
@@ -1214,17 +1930,23 @@ class Baser(dbing.LMDBer):
                 # receipter's est event not yet in receipters's KEL
                 raise kering.ValidationError("key event sn {} for pre {} is not yet in KEL"
                                              "".format(sn, pre))
-            # retrieve last event itself of receipter est evt from sdig
-            sraw = self.getEvt(key=dbing.dgKey(pre=prefixer.qb64b, dig=bytes(sdig)))
-            # assumes db ensures that sraw must not be none because sdig was in KE
-            sserder = coring.Serder(raw=bytes(sraw))
-            if dig is not None and not sserder.compare(said=dig):  # endorser's dig not match event
-                raise kering.ValidationError("Bad proof sig group at sn = {}"
-                                             " for ksn = {}."
-                                             "".format(sn, sserder.ked))
-
-            verfers = sserder.verfers
-            tholder = sserder.tholder
+            key = (prefixer.qb64, bytes(sdig).decode("utf-8"))
+            verifiers = self._verifiers.pop(key, None)
+            if verifiers is None or (dig is not None and dig != key[1]):  # maybe other digest code
+                # retrieve last event itself of receipter est evt from sdig
+                sraw = self.getEvt(key=dbing.dgKey(pre=prefixer.qb64b, dig=bytes(sdig)))
+                # assumes db ensures that sraw must not be none because sdig was in KE
+                sserder = coring.Serder(raw=bytes(sraw))
+                if dig is not None and not sserder.compare(said=dig):  # endorser's dig not match event
+                    raise kering.ValidationError("Bad proof sig group at sn = {}"
+                                                 " for ksn = {}."
+                                                 "".format(sn, sserder.ked))
+                verifiers = (sserder.tholder, sserder.verfers)
+                while len(self._verifiers) >= self.VerifierLimit:  # evict least recent
+                    del self._verifiers[next(iter(self._verifiers))]
+
+            self._verifiers[key] = verifiers  # most recently used at end
+            tholder, verfers = verifiers
 
         else:
             verfers = [coring.Verfer(qb64=pre)]
@@ -1269,7 +1991,7 @@ class Baser(dbing.LMDBer):
 
     def putFe(self, key, val):
         """
-        Use fnKey()
+        Use .ordKey(.fels, pre, fn)
         Write event digest bytes val to key
         Does not overwrite existing val if any
         Returns True If val successfully written Else False
@@ -1279,16 +2001,17 @@ class Baser(dbing.LMDBer):
 
     def setFe(self, key, val):
         """
-        Use fnKey()
+        Use .ordKey(.fels, pre, fn)
         Write event digest bytes val to key
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
+        self.dropResponses(key)
         return self.setVal(self.fels, key, val)
 
     def getFe(self, key):
         """
-        Use fnKey()
+        Use .ordKey(.fels, pre, fn)
         Return event digest at key
         Returns None if no entry at key
         """
@@ -1296,17 +2019,18 @@ class Baser(dbing.LMDBer):
 
     def delFe(self, key):
         """
-        Use snKey()
+        Use .ordKey(.fels, pre, fn)
         Deletes value at key.
         Returns True If key exists in database Else False
         """
+        self.dropResponses(key)
         return self.delVal(self.fels, key)
 
     def appendFe(self, pre, val):
         """
         Return first seen order number int, fn, of appended entry.
         Computes fn as next fn after last entry.
-        Uses fnKey(pre, fn) for entries.
+        Uses .ordKey(.fels, pre, fn) for entries.
 
         Append val to end of db entries with same pre but with fn incremented by
         1 relative to last preexisting entry at pre.
@@ -1315,12 +2039,147 @@ class Baser(dbing.LMDBer):
             pre is bytes identifier prefix for event
             val is event digest
         """
+        self.dropResponses(pre)
         return self.appendOrdValPre(db=self.fels, pre=pre, val=val)
 
+    def setEst(self, pre, sn, seqner, saider):
+        """
+        Write couple of latest establishment event at or before sn for pre
+        Overwrites existing val if any such as at sn of recovery rotation
+        Returns True If val successfully written Else False
+
+        Parameters:
+            pre (bytes | str): identifier prefix of KEL
+            sn (int): sequence number of accepted event in KEL
+            seqner (Seqner): sequence number of establishment event
+            saider (Saider): digest of establishment event
+        """
+        return self.setVal(self.ests, self.ordKey(self.ests, pre, sn),
+                           seqner.qb64b + saider.qb64b)
+
+    def delEsts(self, pre, sn):
+        """
+        Deletes entries after sn for pre such as those of events superseded
+        by a recovery rotation at sn that would otherwise point at the
+        establishment event it superseded.
+        Returns True If any entry deleted Else False
+
+        Parameters:
+            pre (bytes | str): identifier prefix of KEL
+            sn (int): sequence number of last entry to keep
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        with self.txn():
+            ons = [on for on, _ in self.getAllOrdItemPreIter(self.ests, pre, on=sn + 1)]
+            for on in ons:
+                self.delVal(self.ests, self.ordKey(self.ests, pre, on))
+        return bool(ons)
+
+    def delKel(self, pre):
+        """
+        Deletes the KEL of pre, such as one bootstrapped from a checkpoint
+        that failed verification. Removes every first seen event of pre with
+        its signatures, receipts and other attachments and its entries in
+        .kels, .fels, .ests and .ancs, then drops the key state of pre.
+        Returns number of first seen events deleted
+
+        Parameters:
+            pre (bytes | str): identifier prefix of KEL
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        with self.txn():
+            items = [(fn, bytes(dig)) for fn, dig in self.getFelItemPreIter(pre)]
+            sns = set()
+            for fn, dig in items:
+                dgkey = dbing.dgKey(pre, dig)
+                if (raw := self.getEvt(dgkey)) is not None:
+                    serder = coring.Serder(raw=bytes(raw))
+                    sns.add(serder.sn)
+                    for seal in serder.ked.get("a", []):
+                        try:
+                            keys = anchorKeys(seal)
+                        except (KeyError, TypeError, ValueError):
+                            continue
+                        self.ancs.rem(keys=keys, val=(coring.Prefixer(qb64=serder.pre),
+                                                      coring.Seqner(sn=serder.sn),
+                                                      serder.saider))
+                for delete in (self.delEvt, self.delSigs, self.delWigs, self.delRcts,
+                               self.delVrcs, self.delDts, self.delAes):
+                    delete(dgkey)
+                self.fons.rem(keys=dgkey)
+                self.wits.rem(keys=dgkey)
+                self.delFe(self.ordKey(self.fels, pre, fn))
+                self._verifiers.pop((pre.decode("utf-8"), dig.decode("utf-8")), None)
+            for sn in sns:
+                self.delKes(dbing.snKey(pre, sn))
+            self.delEsts(pre, -1)
+            self.states.rem(keys=pre.decode("utf-8"))
+        self.dropResponses(pre)
+        return len(items)
+
+    def getEst(self, pre, sn):
+        """
+        Returns couple (Seqner, Saider) of latest establishment event at or
+        before sn for pre. Returns None if no entry at sn
+
+        Parameters:
+            pre (bytes | str): identifier prefix of KEL
+            sn (int): sequence number of accepted event in KEL
+        """
+        if (val := self.getVal(self.ests, self.ordKey(self.ests, pre, sn))) is None:
+            return None
+        val = bytearray(val)
+        return coring.Seqner(qb64b=val, strip=True), coring.Saider(qb64b=val, strip=True)
+
+    def getSeen(self, pre, sn):
+        """
+        Returns list of SAIDs qb64 of every verified event seen at sn for pre
+        in order seen. These are the accepted events in .kels including
+        superseded ones followed by the duplicitous events in .dups
+
+        Parameters:
+            pre (bytes | str): identifier prefix of KEL
+            sn (int): sequence number of events
+        """
+        if hasattr(pre, "decode"):
+            pre = pre.decode("utf-8")
+        saids = [bytes(dig).decode("utf-8") for dig in self.getKes(dbing.snKey(pre, sn))]
+        if (duper := self.dups.get(keys=(pre, "%032x" % sn))) is not None:
+            saids.extend(duper.saids)
+        return saids
+
+    def getDuplicity(self, pre, sn):
+        """
+        Returns DuplicityRecord of duplicity evidence at sn for pre or None
+
+        Parameters:
+            pre (bytes | str): identifier prefix of KEL
+            sn (int): sequence number of duplicitous events
+        """
+        if hasattr(pre, "decode"):
+            pre = pre.decode("utf-8")
+        return self.dups.get(keys=(pre, "%032x" % sn))
+
+    def getDuplicityItemIter(self, pre=""):
+        """
+        Returns iterator of (pre, sn, DuplicityRecord) triples of duplicity
+        evidence for pre in order of sn or of every prefix when pre is empty
+
+        Parameters:
+            pre (bytes | str): identifier prefix of KEL or empty for all
+        """
+        if hasattr(pre, "decode"):
+            pre = pre.decode("utf-8")
+        keys = (pre, "") if pre else ""
+        for (epre, snh), duper in self.dups.getItemIter(keys=keys):
+            yield epre, int(snh, 16), duper
+
     def getFelItemPreIter(self, pre, fn=0):
         """
         Returns iterator of all (fn, dig) duples in first seen order for all events
-        with same prefix, pre, in database. Items are sorted by fnKey(pre, fn)
+        with same prefix, pre, in database. Items are sorted by .ordKey(.fels, pre, fn)
         where fn is first seen order number int.
         Returns a First Seen Event Log FEL.
         Returned items are duples of (fn, dig): Where fn is first seen order
@@ -1338,7 +2197,7 @@ class Baser(dbing.LMDBer):
         """
         Returns iterator of all (pre, fn, dig) triples in first seen order for
         all events for all prefixes in database. Items are sorted by
-        fnKey(pre, fn) where fn is first seen order number int.
+        .ordKey(.fels, pre, fn) where fn is first seen order number int.
         Returns all First Seen Event Logs FELs.
         Returned items are tripes of (pre, fn, dig): Where pre is identifier prefix,
         fn is first seen order number int and dig is event digest for lookup
@@ -1352,6 +2211,265 @@ class Baser(dbing.LMDBer):
         """
         return self.getAllOrdItemAllPreIter(db=self.fels, key=key)
 
+    def putExp(self, db, key, val, dt=None):
+        """
+        Indexes escrow val at key of escrow sub db db in escrow expiry index
+        at time dt. Returns True if indexed else False if already indexed.
+
+        Parameters:
+            db (lmdb._Database): indexed escrow sub db such as .ooes
+            key (bytes): key of escrow entry
+            val (bytes): val of escrow entry without proem
+            dt (datetime.datetime): escrow time. Default now
+        """
+        label = self._exls[db]
+        stamp = expStamp(dt if dt is not None else helping.nowUTC())
+        with self.txn() as txn:
+            if not txn.put(b'%s.%s.%s' % (label, key, val), stamp, db=self.exks,
+                           overwrite=False):
+                return False
+            txn.put(b'%s.%s.%s' % (label, stamp, key), val, db=self.exps)
+        return True
+
+    def delExp(self, db, key, val):
+        """
+        Deletes index entry of escrow val at key of escrow sub db db from
+        escrow expiry index. Returns True if deleted else False if not indexed.
+
+        Parameters:
+            db (lmdb._Database): indexed escrow sub db such as .ooes
+            key (bytes): key of escrow entry
+            val (bytes): val of escrow entry without proem
+        """
+        label = self._exls[db]
+        with self.txn() as txn:
+            rkey = b'%s.%s.%s' % (label, key, val)
+            if (stamp := txn.pop(rkey, db=self.exks)) is None:
+                return False
+            txn.delete(b'%s.%s.%s' % (label, stamp, key), val, db=self.exps)
+        return True
+
+    def putIoEscrows(self, db, key, vals):
+        """
+        Returns True if at least one of vals is added as dup to key of indexed
+        escrow sub db db and indexes each added val. See .putIoVals
+        """
+        with self.txn():
+            result = False
+            for val in vals:
+                result = self.addIoEscrow(db, key, val) or result
+        return result
+
+    def addIoEscrow(self, db, key, val):
+        """
+        Returns True if val is added as dup to key of indexed escrow sub db db
+        and indexes it. See .addIoVal
+        """
+        with self.txn():
+            if (result := self.addIoVal(db, key, val)):
+                self.putExp(db, key, val)
+        if result:  # new entry may already be processable
+            self.wakeEscrow(db, key)
+        return result
+
+    def delIoEscrows(self, db, key):
+        """
+        Returns True if any vals at key of indexed escrow sub db db are deleted
+        and deletes their index entries. See .delIoVals
+        """
+        with self.txn():
+            vals = self.getIoVals(db, key)
+            for val in vals:
+                self.delExp(db, key, val)
+            self.tallies[db]["exits"] += len(vals)
+            return self.delIoVals(db, key)
+
+    def delIoEscrow(self, db, key, val):
+        """
+        Returns True if dup val at key of indexed escrow sub db db is deleted
+        and deletes its index entry. See .delIoVal
+        """
+        with self.txn():
+            if (result := self.delIoVal(db, key, val)):
+                self.delExp(db, key, bytes(val))
+                self.tallies[db]["exits"] += 1
+        return result
+
+    def wakeEscrow(self, db, key):
+        """
+        Marks entries at key of indexed escrow sub db db ready so the next
+        escrow pass processes them
+
+        Parameters:
+            db (lmdb._Database): indexed escrow sub db such as .ooes
+            key (bytes): key of escrow entries
+        """
+        self.wakes[db].add(bytes(key))
+
+    def wakeEscrowPre(self, db, pre):
+        """
+        Marks entries at every key of indexed escrow sub db db that starts with
+        identifier prefix pre ready so the next escrow pass processes them
+
+        Parameters:
+            db (lmdb._Database): indexed escrow sub db such as .qnfs
+            pre (bytes | str): identifier prefix of keys
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        for key, _ in self.getTopItemIter(db, key=pre + b'.'):
+            self.wakes[db].add(bytes(key))
+
+    def sweepEscrow(self, db):
+        """
+        Marks every entry of indexed escrow sub db db ready so the next escrow
+        pass walks db in full
+
+        Parameters:
+            db (lmdb._Database): indexed escrow sub db such as .pses
+        """
+        self.sweeps.add(db)
+
+    def getReadyIoItemsNextIter(self, db, key=b''):
+        """
+        Returns iterator of ready items of indexed escrow sub db db at the next
+        ready key after key in the manner of .getIoItemsNextIter. An empty key
+        starts an escrow pass. When a full walk of db is due the pass walks
+        every key otherwise only the keys marked ready by .wakeEscrow in key
+        order. Each ready key is consumed when its items are returned so escrow
+        work is proportional to what became ready instead of escrow size.
+
+        Tallies each item tried and each item still escrowed after the caller
+        processed it as retried.
+
+        Parameters:
+            db (lmdb._Database): indexed escrow sub db such as .ooes
+            key (bytes): key of items of last iteration or empty to start pass
+        """
+        tally = self.tallies[db]
+        for item in self._readyIoItemsNextIter(db, key=key):
+            exits = tally["exits"]
+            tally["tries"] += 1
+            yield item
+            if tally["exits"] == exits:  # caller left item in escrow
+                tally["retries"] += 1
+
+    def _readyIoItemsNextIter(self, db, key=b''):
+        """
+        Returns iterator of ready items for .getReadyIoItemsNextIter
+        """
+        if not key and db in self.sweeps:  # start full walk
+            self.sweeps.discard(db)
+            self.wakes[db].clear()  # full walk covers ready keys
+            self._sweeping.add(db)
+
+        if db in self._sweeping:
+            found = False
+            for item in self.getIoItemsNextIter(db, key):
+                found = True
+                yield item
+            if not found:  # full walk done
+                self._sweeping.discard(db)
+            return
+
+        ready = self.wakes[db]
+        while ready:
+            rkey = min(ready)
+            ready.discard(rkey)
+            found = False
+            for ekey, val in self.getIoItemsNextIter(db, rkey, skip=False):
+                if bytes(ekey) != rkey:  # ready key no longer escrowed
+                    break
+                found = True
+                yield (ekey, val)
+            if found:
+                return
+
+    def expireIoEscrows(self, db, timeout, now=None):
+        """
+        Returns list of (key, val) duples of the entries of indexed escrow sub
+        db db escrowed more than timeout seconds before now after deleting them
+        and their index entries. Range scans only the expired entries of the
+        escrow expiry index .exps so cost is independent of escrow size.
+
+        Parameters:
+            db (lmdb._Database): indexed escrow sub db such as .ooes
+            timeout (float): seconds after which an escrow entry is stale
+            now (datetime.datetime): time of expiry. Default now
+        """
+        now = now if now is not None else helping.nowUTC()
+        label = self._exls[db]
+        cutoff = b'%s.%s' % (label, expStamp(now - datetime.timedelta(seconds=timeout)))
+        expired = []
+        with self.txn() as txn:
+            cursor = txn.cursor(db=self.exps)
+            if cursor.set_range(b'%s.' % label):
+                # empty key means cursor is past last item
+                while (ikey := cursor.key()) and ikey < cutoff:
+                    val = cursor.value()
+                    key = ikey[len(cutoff) + 1:]  # strip label.stamp.
+                    self.delIoVal(db, key, val)
+                    txn.delete(b'%s.%s.%s' % (label, key, val), db=self.exks)
+                    expired.append((key, val))
+                    cursor.delete()  # moves to next item if any
+        self.tallies[db]["expires"] += len(expired)
+        return expired
+
+    def escrowStats(self, now=None):
+        """
+        Returns dict of gauges of each indexed escrow keyed by its label.
+        Sizes are read from sub db statistics and oldest from the first entry
+        of the escrow expiry index so gauges are cheap at any escrow size.
+
+        Gauges of each escrow:
+            size (int): number of escrowed entries
+            oldest (float | None): age in seconds of oldest entry if any
+            tries (int): entries tried by escrow passes since .tallied
+            retries (int): entries tried and left in escrow since .tallied
+            unescrowed (int): entries removed other than by expiry since .tallied
+            expired (int): entries expired since .tallied
+            throughput (float): unescrowed entries per second since .tallied
+
+        Parameters:
+            now (datetime.datetime): time of gauges. Default now
+        """
+        now = now if now is not None else helping.nowUTC()
+        secs = max((now - self.tallied).total_seconds(), 1e-6)
+        stats = {}
+        with self._trans(db=self.exps, write=False) as txn:
+            cursor = txn.cursor(db=self.exps)
+            for db, label in self._exls.items():
+                oldest = None
+                if cursor.set_range(b'%s.' % label):
+                    ikey = bytes(cursor.key())
+                    if ikey.startswith(b'%s.' % label):
+                        stamp = ikey[len(label) + 1:len(label) + 17]
+                        oldest = (now - expDatetime(stamp)).total_seconds()
+                tally = self.tallies[db]
+                stats[label.decode("utf-8")] = dict(size=txn.stat(db)["entries"],
+                                                    oldest=oldest,
+                                                    tries=tally["tries"],
+                                                    retries=tally["retries"],
+                                                    unescrowed=tally["exits"],
+                                                    expired=tally["expires"],
+                                                    throughput=tally["exits"] / secs)
+        return stats
+
+    def stats(self):
+        """
+        Returns capacity statistics of .env and its sub dbs as LMDBer.stats
+        with escrow gauges of .escrowStats added at field escrows and kever
+        cache statistics added at field kevers
+        """
+        data = super(Baser, self).stats()
+        data["escrows"] = self.escrowStats()
+        data["kevers"] = dict(size=len(self.kevers),
+                              limit=self.kevers.limit,
+                              hits=self.kevers.hits,
+                              misses=self.kevers.misses,
+                              evictions=self.kevers.evictions)
+        return data
+
     def putDts(self, key, val):
         """
         Use dgKey()
@@ -1369,6 +2487,7 @@ class Baser(dbing.LMDBer):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
+        self.dropResponses(key)
         return self.setVal(self.dtss, key, val)
 
     def getDts(self, key):
@@ -1395,6 +2514,7 @@ class Baser(dbing.LMDBer):
         Returns True If val successfully written Else False
         Returns False if key already exists
         """
+        self.dropResponses(key)
         return self.putVal(self.aess, key, val)
 
     def setAes(self, key, val):
@@ -1404,6 +2524,7 @@ class Baser(dbing.LMDBer):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
+        self.dropResponses(key)
         return self.setVal(self.aess, key, val)
 
     def getAes(self, key):
@@ -1449,6 +2570,7 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self.dropResponses(key)
         return self.putVals(self.sigs, key, vals)
 
     def addSig(self, key, val):
@@ -1459,6 +2581,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self.dropResponses(key)
         return self.addVal(self.sigs, key, val)
 
     def cntSigs(self, key):
@@ -1475,6 +2598,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
+        self.dropResponses(key)
         return self.delVals(self.sigs, key, val)
 
     def getWigs(self, key):
@@ -1504,6 +2628,7 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self.dropResponses(key)
         return self.putVals(self.wigs, key, vals)
 
     def addWig(self, key, val):
@@ -1514,6 +2639,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self.dropResponses(key)
         return self.addVal(self.wigs, key, val)
 
     def cntWigs(self, key):
@@ -1530,6 +2656,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
+        self.dropResponses(key)
         return self.delVals(self.wigs, key, val)
 
     def putRcts(self, key, vals):
@@ -1542,6 +2669,7 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self.dropResponses(key)
         return self.putVals(self.rcts, key, vals)
 
     def addRct(self, key, val):
@@ -1553,6 +2681,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self.dropResponses(key)
         return self.addVal(self.rcts, key, val)
 
     def getRcts(self, key):
@@ -1590,6 +2719,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
+        self.dropResponses(key)
         return self.delVals(self.rcts, key, val)
 
     def putUres(self, key, vals):
@@ -1601,7 +2731,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.ures, key, vals)
+        return self.putIoEscrows(self.ures, key, vals)
 
     def addUre(self, key, val):
         """
@@ -1612,7 +2742,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.ures, key, val)
+        return self.addIoEscrow(self.ures, key, val)
 
     def getUres(self, key):
         """
@@ -1686,7 +2816,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key in db.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.ures, key)
+        return self.delIoEscrows(self.ures, key)
 
     def delUre(self, key, val):
         """
@@ -1698,7 +2828,7 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.ures, key, val)
+        return self.delIoEscrow(self.ures, key, val)
 
     def putVrcs(self, key, vals):
         """
@@ -1710,6 +2840,7 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self.dropResponses(key)
         return self.putVals(self.vrcs, key, vals)
 
     def addVrc(self, key, val):
@@ -1721,6 +2852,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self.dropResponses(key)
         return self.addVal(self.vrcs, key, val)
 
     def getVrcs(self, key):
@@ -1757,6 +2889,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
+        self.dropResponses(key)
         return self.delVals(self.vrcs, key, val)
 
     def putVres(self, key, vals):
@@ -1768,7 +2901,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.vres, key, vals)
+        return self.putIoEscrows(self.vres, key, vals)
 
     def addVre(self, key, val):
         """
@@ -1779,7 +2912,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.vres, key, val)
+        return self.addIoEscrow(self.vres, key, val)
 
     def getVres(self, key):
         """
@@ -1853,7 +2986,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key in db.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.vres, key)
+        return self.delIoEscrows(self.vres, key)
 
     def delVre(self, key, val):
         """
@@ -1865,7 +2998,7 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.vres, key, val)
+        return self.delIoEscrow(self.vres, key, val)
 
     def putKes(self, key, vals):
         """
@@ -1989,7 +3122,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.pses, key, vals)
+        return self.putIoEscrows(self.pses, key, vals)
 
     def addPse(self, key, val):
         """
@@ -1999,7 +3132,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.pses, key, val)
+        return self.addIoEscrow(self.pses, key, val)
 
     def getPses(self, key):
         """
@@ -2066,7 +3199,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key in db.
         Returns True If key  exists in db Else False
         """
-        return self.delIoVals(self.pses, key)
+        return self.delIoEscrows(self.pses, key)
 
     def delPse(self, key, val):
         """
@@ -2078,7 +3211,7 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.pses, key, val)
+        return self.delIoEscrow(self.pses, key, val)
 
     def putPde(self, key, val):
         """
@@ -2123,7 +3256,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.pwes, key, vals)
+        return self.putIoEscrows(self.pwes, key, vals)
 
     def addPwe(self, key, val):
         """
@@ -2133,7 +3266,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.pwes, key, val)
+        return self.addIoEscrow(self.pwes, key, val)
 
     def getPwes(self, key):
         """
@@ -2200,7 +3333,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key in db.
         Returns True If key  exists in db Else False
         """
-        return self.delIoVals(self.pwes, key)
+        return self.delIoEscrows(self.pwes, key)
 
     def delPwe(self, key, val):
         """
@@ -2212,7 +3345,7 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.pwes, key, val)
+        return self.delIoEscrow(self.pwes, key, val)
 
     def putUwes(self, key, vals):
         """
@@ -2223,7 +3356,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.uwes, key, vals)
+        return self.putIoEscrows(self.uwes, key, vals)
 
     def addUwe(self, key, val):
         """
@@ -2234,7 +3367,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.uwes, key, val)
+        return self.addIoEscrow(self.uwes, key, val)
 
     def getUwes(self, key):
         """
@@ -2308,7 +3441,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key in db.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.uwes, key)
+        return self.delIoEscrows(self.uwes, key)
 
     def delUwe(self, key, val):
         """
@@ -2320,7 +3453,7 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.uwes, key, val)
+        return self.delIoEscrow(self.uwes, key, val)
 
     def putOoes(self, key, vals):
         """
@@ -2330,7 +3463,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.ooes, key, vals)
+        return self.putIoEscrows(self.ooes, key, vals)
 
     def addOoe(self, key, val):
         """
@@ -2340,7 +3473,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.ooes, key, val)
+        return self.addIoEscrow(self.ooes, key, val)
 
     def getOoes(self, key):
         """
@@ -2398,7 +3531,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.ooes, key)
+        return self.delIoEscrows(self.ooes, key)
 
     def delOoe(self, key, val):
         """
@@ -2411,7 +3544,7 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.ooes, key, val)
+        return self.delIoEscrow(self.ooes, key, val)
 
     def putQnfs(self, key, vals):
         """
@@ -2421,7 +3554,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.qnfs, key, vals)
+        return self.putIoEscrows(self.qnfs, key, vals)
 
     def addQnf(self, key, val):
         """
@@ -2431,7 +3564,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.qnfs, key, val)
+        return self.addIoEscrow(self.qnfs, key, val)
 
     def getQnfs(self, key):
         """
@@ -2489,7 +3622,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.qnfs, key)
+        return self.delIoEscrows(self.qnfs, key)
 
     def delQnf(self, key, val):
         """
@@ -2502,7 +3635,7 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.qnfs, key, val)
+        return self.delIoEscrow(self.qnfs, key, val)
 
     def putDes(self, key, vals):
         """
@@ -2586,7 +3719,7 @@ class Baser(dbing.LMDBer):
         Returns True If at least one of vals is added as dup, False otherwise
         Duplicates are inserted in insertion order.
         """
-        return self.putIoVals(self.ldes, key, vals)
+        return self.putIoEscrows(self.ldes, key, vals)
 
     def addLde(self, key, val):
         """
@@ -2596,7 +3729,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in insertion order.
         """
-        return self.addIoVal(self.ldes, key, val)
+        return self.addIoEscrow(self.ldes, key, val)
 
     def getLdes(self, key):
         """
@@ -2654,7 +3787,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key.
         Returns True If key exists in database Else False
         """
-        return self.delIoVals(self.ldes, key)
+        return self.delIoEscrows(self.ldes, key)
 
     def delLde(self, key, val):
         """
@@ -2667,7 +3800,90 @@ class Baser(dbing.LMDBer):
             key is bytes of key within sub db's keyspace
             val is dup val (does not include insertion ordering proem)
         """
-        return self.delIoVal(self.ldes, key, val)
+        return self.delIoEscrow(self.ldes, key, val)
+
+
+@Baser.Migrations.register(ver=0, tables=("ooes.", "pses.", "pwes.", "uwes.",
+                                           "ures.", "vres.", "ldes.", "qnfs."))
+def indexEscrows(db, batch):
+    """
+    Backfills escrow expiry index .exps with the entries of the indexed escrow
+    sub dbs escrowed before the index existed. They are indexed at the time of
+    migration so each gets a full timeout before it is stale.
+
+    Parameters:
+        db (Baser): database to migrate
+        batch (int): max entries indexed per write transaction
+    """
+    dt = helping.nowUTC()
+    for esc in db._exls:
+        def index(txn, key, val):
+            db.putExp(esc, key, val[33:], dt=dt)  # slice off ordering proem
+
+        db.streamItems(esc, index, ckey=b'indexEscrows.%s' % db._exls[esc], batch=batch)
+
+
+@Baser.Migrations.register(ver=1, tables=("kels.",))
+def indexEstablishments(db, batch):
+    """
+    Backfills establishment event index .ests from the KELs in .kels accepted
+    before the index existed. Keys of .kels sort by sn within each prefix so
+    the entry at sn - 1 is indexed before the entry at sn. The last event at
+    sn such as a recovery rotation is indexed last so it wins.
+
+    Parameters:
+        db (Baser): database to migrate
+        batch (int): max entries indexed per write transaction
+    """
+    def index(txn, key, val):
+        pre, sn = dbing.splitKeySN(key)
+        if (raw := db.getEvt(dbing.dgKey(pre, val[33:]))) is None:  # slice off proem
+            return
+        serder = coring.Serder(raw=bytes(raw))
+        if serder.est:
+            db.setEst(pre, sn, coring.Seqner(sn=sn), serder.saider)
+        elif sn > 0 and (couple := db.getEst(pre, sn - 1)) is not None:
+            db.setEst(pre, sn, *couple)
+
+    db.streamItems(db.kels, index, ckey=b'indexEstablishments', batch=batch)
+
+
+@Baser.Migrations.register(ver=2, tables=("kels.",))
+def indexAnchors(db, batch):
+    """
+    Backfills anchor index .ancs with the seals of events in the KELs in
+    .kels accepted before the index existed.
+
+    Parameters:
+        db (Baser): database to migrate
+        batch (int): max entries indexed per write transaction
+    """
+    def index(txn, key, val):
+        pre, sn = dbing.splitKeySN(key)
+        if (raw := db.getEvt(dbing.dgKey(pre, val[33:]))) is not None:  # slice off proem
+            db.addAnchors(coring.Serder(raw=bytes(raw)))
+
+    db.streamItems(db.kels, index, ckey=b'indexAnchors', batch=batch)
+
+
+@Baser.Migrations.register(ver=3, tables=("rpes.",))
+def indexReplyEscrows(db, batch):
+    """
+    Backfills escrow expiry index .exps with the reply escrows in .rpes
+    escrowed before they were indexed. They are indexed at the time of
+    migration so each gets a full timeout before it is stale.
+
+    Parameters:
+        db (Baser): database to migrate
+        batch (int): max entries indexed per write transaction
+    """
+    dt = helping.nowUTC()
+
+    def index(txn, key, val):
+        route, _ = dbing.unsuffix(key, sep=db.rpes.sep)  # strip insertion ordinal
+        db.rpxs.put(route, val, dt=dt)
+
+    db.streamItems(db.rpes.sdb, index, ckey=b'indexReplyEscrows', batch=batch)
 
 
 class BaserDoer(doing.Doer):
@@ -2727,6 +3943,11 @@ class BaserDoer(doing.Doer):
         if not self.baser.opened:
             self.baser.reopen()
 
+    def recur(self, tyme):
+        """"""
+        self.baser.tick()  # commit group commit batch when due
+        return False
+
     def exit(self):
         """"""
         self.baser.close(clear=self.baser.temp)
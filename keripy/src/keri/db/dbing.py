@@ -45,10 +45,12 @@ l
 
 """
 
+import fcntl
 import os
 import shutil
 import stat
-from collections import abc
+import time
+from collections import abc, namedtuple
 from contextlib import contextmanager
 from typing import Union
 
@@ -59,15 +61,34 @@ from hio.base import filing
 
 from hio.base import filing
 
+from .. import help, kering
 from ..help import helping
 
+logger = help.ogler.getLogger()
+
 ProemSize = 32  # does not include trailing separator
 MaxProem = int("f"*(ProemSize), 16)
 MaxON = int("f"*32, 16)  # largest possible ordinal number, sequence or first seen
 
+_OpenPaths = {}  # count of LMDBer envs open in this process keyed by real path
+
 SuffixSize = 32  # does not include trailing separator
 MaxSuffix = int("f"*(SuffixSize), 16)
 
+OnBinSize = 16  # bytes of fixed width big endian binary ordinal in compact keys
+
+KeyVerHex = 1  # key version of ordinal keys with 32 char hex ordinal
+KeyVerBin = 2  # key version of compact ordinal keys with binary ordinal
+
+SchemaKey = b'schema'  # key in .meta of stored schema version of database
+
+# Migration of database schema from stored schema version ver to ver + 1
+# ver (int): schema version migrated from
+# name (str): name of migration
+# tables (tuple): names of sub dbs streamed by migration to estimate duration
+# run (Callable): run(dber, batch) resumable migration of LMDBer dber
+Migration = namedtuple("Migration", "ver name tables run")
+
 def dgKey(pre, dig):
     """
     Returns bytes DB key from concatenation of '.' with qualified Base64 prefix
@@ -95,6 +116,18 @@ snKey = onKey  # alias so intent is clear, sn vs fn
 fnKey = onKey  # alias so intent is clear, sn vs fn
 
 
+def onKeyBin(pre, on, *, sep=b'.'):
+    """
+    Returns compact bytes DB key from concatenation with sep of qualified
+    Base64 prefix bytes pre and int ordinal number on as fixed width big endian
+    binary of OnBinSize bytes. Keys with same pre sort in numeric order of on.
+    Compact key version KeyVerBin of onKey.
+    """
+    if hasattr(pre, "encode"):
+        pre = pre.encode("utf-8")  # convert str to bytes
+    return (b'%s%s%s' % (pre, sep, on.to_bytes(OnBinSize, "big")))
+
+
 def dtKey(pre, dts):
     """
     Returns bytes DB key from concatenation of '|' qualified Base64 prefix
@@ -152,6 +185,22 @@ splitKeySN = splitKeyON  # alias so intent is clear, sn vs fn
 splitKeyFN = splitKeyON  # alias so intent is clear, sn vs fn
 
 
+def splitKeyONBin(key, *, sep=b'.'):
+    """
+    Returns duple of bytes pre and int on from compact key made by onKeyBin.
+    Splits by slicing off fixed width binary ordinal so no search or hex parse.
+    Accepts bytes or memoryview key.
+    Raises ValueError if key is not a compact key
+
+    Parameters:
+       key is database key from onKeyBin
+       sep is bytes separator character. default is b'.'
+    """
+    if len(key) <= OnBinSize or key[-OnBinSize - 1:-OnBinSize] != sep:
+        raise ValueError("Unsplittable key = {}".format(bytes(key)))
+    return (bytes(key[:-OnBinSize - 1]), int.from_bytes(key[-OnBinSize:], "big"))
+
+
 def splitKeyDT(key):
     """
     Returns list of pre and dts converted to datetime from key
@@ -220,6 +269,78 @@ def clearDatabaserDir(path):
         shutil.rmtree(path)
 
 
+class Migrator:
+    """
+    Migrator is registry of schema migrations of an LMDBer subclass keyed by
+    the stored schema version each migration migrates from. The schema version
+    of the subclass is one more than the highest registered version.
+
+    Migrations stream entries with LMDBer.streamItems so they run in batched
+    write transactions and resume after interruption.
+
+    Usage:
+        class Baser(LMDBer):
+            Migrations = Migrator()
+
+        @Baser.Migrations.register(ver=0, tables=("evts.",))
+        def indexEvents(dber, batch):
+            ...
+
+    Attributes:
+        migrations (dict): Migration keyed by schema version it migrates from
+
+    Properties:
+        version (int): current schema version, 0 when none registered
+
+    """
+
+    def __init__(self):
+        """ Setup empty registry """
+        self.migrations = {}
+
+    @property
+    def version(self):
+        """ Returns current schema version """
+        return max(self.migrations) + 1 if self.migrations else 0
+
+    def register(self, ver, tables=(), name=None):
+        """
+        Returns decorator that registers run function as Migration from schema
+        version ver to ver + 1
+
+        Parameters:
+            ver (int): schema version migrated from
+            tables (Iterable): names of sub dbs streamed by migration
+            name (str): name of migration, default name of run function
+        """
+        if ver in self.migrations:
+            raise ValueError(f"Duplicate migration from schema version {ver}.")
+
+        def decorator(run):
+            self.migrations[ver] = Migration(ver=ver, name=name or run.__name__,
+                                             tables=tuple(tables), run=run)
+            return run
+
+        return decorator
+
+    def pending(self, ver):
+        """
+        Returns list of Migrations in order that migrate schema version ver to
+        .version
+
+        Parameters:
+            ver (int): stored schema version
+        """
+        if ver > self.version:
+            raise kering.DatabaseError(f"Stored schema version {ver} newer than"
+                                       f" supported version {self.version}.")
+        try:
+            return [self.migrations[v] for v in range(ver, self.version)]
+        except KeyError as ex:
+            raise kering.DatabaseError(f"Missing migration from schema version"
+                                       f" {ex.args[0]}.") from ex
+
+
 @contextmanager
 def openLMDB(*, cls=None, name="test", temp=True, **kwa):
     """
@@ -279,8 +400,83 @@ class LMDBer(filing.Filer):
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
+        sync (bool): True means LMDB flushes to disk on every commit
+                     False means disk flush only on .flush() so durability
+                     window is time between flushes
+        batchSize (int): group commit mode when > 0. Max number of write
+                         operations accumulated in one open write transaction
+                         before it is committed
+        batchPeriod (float): max seconds an open group commit write transaction
+                             may accumulate writes before it is committed
+        mapSize (int): current LMDB map size in bytes
+        mapGrowth (int): bytes by which map size is grown when it nears full
+        mapFill (float): fraction of map size used that triggers growth
+        meta (lmdb._Database): named sub db of database metadata such as key
+                               versions. None when readonly and not yet created
 
     Properties:
+        batchDue (bool): True means open group commit batch should be committed
+        schemaVer (int): stored schema version of database
+
+    Map Size Notes:
+        LMDB preallocates a fixed size memory map and raises MapFullError when
+        a write would exceed it. Before beginning a write transaction LMDBer
+        checks the used pages against .mapFill of .mapSize and when reached
+        grows the map by .mapGrowth. LMDB only allows resizing when this
+        process has no open transaction on the environment so growth waits for
+        a quiescent moment, that is, no open .txn(), .snapshot(), group commit
+        batch or partially consumed iterator. A MapFullError forces growth at
+        the next quiescent moment so that a retry of the write succeeds.
+
+    Ordinal Append Notes:
+        .appendOrdValPre and .appendIoSetVal cache in memory the last ordinal
+        appended at each pre or key so the next append is a single put instead
+        of a cursor walk back from the max ordinal. The cache of a sub db is
+        filled from the db on first append at a pre or key, dropped by any
+        delete in that sub db and cleared by any aborted transaction. The
+        put does not overwrite so a stale cache from an append by another
+        process falls back to the walk.
+
+    Key Version Notes:
+        Ordinal sub dbs opened with .openOrdDB key entries by prefix and
+        ordinal number. Key version KeyVerHex keys are onKey with a 32 char hex
+        ordinal and KeyVerBin keys are compact onKeyBin with a 16 byte big
+        endian binary ordinal that is split by slicing. The version of each
+        ordinal sub db is stored in .meta so new sub dbs use .KeyVer and
+        existing sub dbs keep their version until .migrateKeys converts them.
+        Use .ordKey and .splitOrdKey instead of onKey and splitKeyON to make
+        or split keys of an ordinal sub db.
+
+    Schema Migration Notes:
+        .Migrations of each subclass registers the Migrations of its schema
+        keyed by the stored schema version they migrate from. A newly created
+        database stores the current schema version .Migrations.version in
+        .meta while a database created before schema versions were stored has
+        version 0. .migrate runs the pending migrations in order and stores the
+        new version after each one. Migrations stream entries with .streamItems
+        in write transactions of a batch of entries that checkpoint progress in
+        .meta so an interrupted migration resumes where it stopped. A dry run
+        estimates the duration from the entry counts of the streamed sub dbs.
+
+    Backup and Compaction Notes:
+        .backup makes a consistent hot copy of .env from a read snapshot while
+        the database keeps serving. .compact makes a compacted copy the same
+        way into the staging directory .path + '.compact' that is swapped in
+        place of .path on the next .reopen. The swap is only made when no
+        process, this one included, has .env open and no write was committed
+        since the snapshot
+        of the copy otherwise those writes would be lost so a stale copy is
+        discarded. The swap is a pair of directory renames and is completed
+        or undone on the next .reopen if interrupted by a crash.
+
+    Group Commit Notes:
+        When .batchSize > 0 writes are not committed one by one but accumulate
+        in one open write transaction that is committed once it holds
+        .batchSize writes or is .batchPeriod seconds old, whichever is first.
+        Reads join the open batch so they see its uncommitted writes. An open
+        batch is lost on crash unless committed so call .flush as a durability
+        barrier before any response that promises durability and .tick once
+        per Doist tick so a quiet batch is committed on time.
 
     File/Directory Creation Mode Notes:
         .Perm provides default restricted access permissions to directory and/or files
@@ -306,9 +502,16 @@ class LMDBer(filing.Filer):
     TempSuffix = "_test"
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
     MaxNamedDBs = 96
+    MapSize = 104857600  # 100 MiB initial map size
+    MapGrowth = 104857600  # grow map by 100 MiB
+    MapFill = 0.8  # grow map when 80% full
+    KeyVer = KeyVerHex  # key version of newly created ordinal sub dbs
+    Migrations = Migrator()  # registry of schema migrations
+    MigrateRate = 20000  # estimated entries per second streamed by migrations
 
 
-    def __init__(self, readonly=False, **kwa):
+    def __init__(self, readonly=False, sync=True, batchSize=0, batchPeriod=0.05,
+                 mapSize=None, mapGrowth=None, mapFill=None, **kwa):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .path.
@@ -342,14 +545,45 @@ class LMDBer(filing.Filer):
 
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            sync (bool): True means flush to disk on every commit
+                         False means flush to disk only on .flush()
+            batchSize (int): group commit mode when > 0. Max number of write
+                operations per group commit write transaction
+            batchPeriod (float): max seconds before group commit write
+                transaction is committed
+            mapSize (int): initial LMDB map size in bytes. Default .MapSize
+            mapGrowth (int): bytes by which map size is grown. Default .MapGrowth
+            mapFill (float): fraction of map size used that triggers growth.
+                Default .MapFill
 
         """
         self.env = None
         self.readonly = True if readonly else False
+        self.sync = True if sync else False
+        self.batchSize = batchSize
+        self.batchPeriod = batchPeriod
+        self._txn = None  # shared write transaction when inside .txn() context
+        self._batch = None  # open group commit write transaction if any
+        self._batchOps = 0  # count of write operations in ._batch
+        self._batchStamp = 0.0  # monotonic time ._batch was begun
+        self._readers = 0  # count of open read iterators using ._batch
+        self._snap = None  # shared read transaction when inside .snapshot()
+        self._cursors = {}  # reusable cursors of ._snap keyed by sub db
+        self.mapSize = mapSize if mapSize is not None else self.MapSize
+        self.mapGrowth = mapGrowth if mapGrowth is not None else self.MapGrowth
+        self.mapFill = mapFill if mapFill is not None else self.MapFill
+        self._active = 0  # count of open own transactions of ._trans
+        self._full = False  # True means MapFullError so grow when quiescent
+        self._psize = 4096  # LMDB page size of .env set on reopen
+        self._ons = {}  # last appended ordinal by key or pre keyed by sub db
+        self.meta = None  # metadata sub db
+        self._ords = {}  # name of ordinal sub db keyed by sub db
+        self._bins = set()  # ordinal sub dbs with compact key version
+        self.stale = False  # True means last swap discarded stale compacted copy
         super(LMDBer, self).__init__(**kwa)
 
 
-    def reopen(self, readonly=False, **kwa):
+    def reopen(self, readonly=None, sync=None, **kwa):
         """
         Open if closed or close and reopen if opened or create and open if not
         if not preexistent, directory path for lmdb at .path and then
@@ -373,15 +607,39 @@ class LMDBer(filing.Filer):
             fext (str): File extension when .filed
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+                                None means use existing .readonly
+            sync (bool): True means flush to disk on every commit
+                         False means flush to disk only on .flush()
+                         None means use existing .sync
         """
         opened = super(LMDBer, self).reopen(**kwa)
         if readonly is not None:
-            self.readonly = readonly
+            self.readonly = True if readonly else False
+        if sync is not None:
+            self.sync = True if sync else False
+        if not self.readonly:
+            self._swap()  # swap in staged compacted copy if any
 
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
-        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=104857600,
-                             mode=self.perm, readonly=self.readonly)
+        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=self.mapSize,
+                             mode=self.perm, readonly=self.readonly, sync=self.sync)
+        path = os.path.realpath(self.path)
+        _OpenPaths[path] = _OpenPaths.get(path, 0) + 1
+        self.mapSize = self.env.info()["map_size"]  # existing env may be larger
+        self._psize = self.env.stat()["psize"]
+        self._ords = {}
+        self._bins = set()
+        try:  # metadata such as key versions of ordinal sub dbs
+            self.meta = self.env.open_db(key=b'meta.', create=not self.readonly)
+        except lmdb.NotFoundError:  # readonly and not yet created by writer
+            self.meta = None
+        if self.meta is not None and not self.readonly:
+            with self.env.begin(write=True) as txn:
+                if txn.get(SchemaKey, db=self.meta) is None:
+                    cursor = txn.cursor()  # main db keys are names of sub dbs
+                    if not any(key != b'meta.' for key in cursor.iternext(values=False)):
+                        txn.put(SchemaKey, b'%d' % self.Migrations.version, db=self.meta)
         self.opened = True if opened and self.env else False
         return self.opened
 
@@ -393,16 +651,547 @@ class LMDBer(filing.Filer):
            clear is boolean, True means clear lmdb directory
         """
         if self.env:
+            try:
+                self.flush()  # commit and sync any group commit batch
+            except (ValueError, lmdb.Error):  # close within .txn() block so abort
+                pass
             try:
                 self.env.close()
             except:
                 pass
+            path = os.path.realpath(self.path)
+            if _OpenPaths.get(path, 0) > 1:
+                _OpenPaths[path] -= 1
+            else:
+                _OpenPaths.pop(path, None)
 
         self.env = None
+        self._txn = None
+        self._batch = None
+        self._batchOps = 0
+        self._readers = 0
+        self._snap = None
+        self._cursors = {}
+        self._active = 0
+        self._full = False
+        self._ons = {}
 
         return(super(LMDBer, self).close(clear=clear))
 
 
+    @contextmanager
+    def txn(self, nested=False):
+        """
+        Context manager for an explicit multi-operation write transaction.
+        Every LMDBer method, and thereby every Suber and Komer method, called
+        within the 'with' block joins the one shared write transaction instead
+        of opening and committing its own. The transaction commits once on
+        normal exit of the outermost block and aborts if an exception is raised
+        so the grouped writes are applied atomically with a single commit.
+        Nested .txn() blocks join the outermost transaction unless nested is
+        True. Then the block is a savepoint, a child transaction of the
+        enclosing one that an exception aborts without losing the writes of the
+        enclosing block.
+
+        In group commit mode, .batchSize > 0, the transaction is a child
+        (nested) transaction of the open group commit batch. Exiting the block
+        commits the child into the batch not to disk and an exception aborts
+        only the child so the rest of the batch is unaffected.
+
+        The shared transaction is opened with buffers=False so reads within the
+        block return bytes not memoryviews. A memoryview into a write
+        transaction is invalidated by any subsequent write in that transaction.
+
+        Usage:
+
+        with db.txn():
+            db.putEvt(dgkey, raw)
+            db.states.pin(keys=pre, val=state)
+
+        Parameters:
+            nested (bool): True means block within a .txn() block is a child
+                transaction of it. False means join it
+
+        Yields:
+            txn (lmdb.Transaction): shared write transaction
+        """
+        if self._txn is not None and self._txn is not self._batch:
+            if not nested:
+                yield self._txn  # already in transaction so join it
+                return
+
+            parent = self._txn  # savepoint in enclosing transaction
+            self._txn = self._beginTxn(write=True, buffers=False, parent=parent)
+            try:
+                yield self._txn
+            except BaseException:
+                self._txn.abort()
+                self._ons = {}
+                raise
+            else:
+                self._txn.commit()
+            finally:
+                self._txn = parent
+            return
+
+        if self._txn is None:
+            self.grow()
+        parent = self._begin() if self.batchSize > 0 else self._batch
+        self._txn = self._beginTxn(write=True, buffers=False, parent=parent)
+        try:
+            yield self._txn
+        except lmdb.MapFullError:
+            self._txn.abort()
+            self._ons = {}
+            self._full = True
+            raise
+        except BaseException:
+            self._txn.abort()
+            self._ons = {}
+            raise
+        else:
+            self._txn.commit()
+            if parent is not None:
+                self._batchOps += 1
+        finally:
+            self._txn = parent  # parent is None when not in group commit mode
+
+        if self.batchDue:
+            self.commit()
+
+
+    @contextmanager
+    def snapshot(self):
+        """
+        Context manager for a long lived read snapshot. Every read by an LMDBer
+        method, and thereby by every Suber and Komer method, called within the
+        'with' block joins the one shared read transaction instead of beginning
+        its own. Point lookups also reuse one cursor per sub db. Iterators
+        created within the block read the snapshot and must be consumed within
+        the block.
+
+        The snapshot is a consistent view as of its start. Writes made within
+        the block commit in their own transactions as usual but are not visible
+        to reads in the block. So use a snapshot for read only work such as
+        serving a query or replay, not for read-modify-write processing.
+        Do not hold a snapshot across a Doist yield because every other doer
+        reading from this LMDBer in between would then read the stale snapshot.
+
+        When already inside a .txn() block or group commit batch then reads
+        already share that write transaction which is joined instead.
+        Nested .snapshot() blocks join the outermost snapshot.
+
+        Usage:
+
+        with db.snapshot():
+            for keys, val in db.states.getItemIter():
+                ...
+
+        Yields:
+            txn (lmdb.Transaction): shared read or write transaction
+        """
+        if self._txn is not None:  # reads join write transaction
+            yield self._txn
+            return
+        if self._snap is not None:  # already in snapshot so join it
+            yield self._snap
+            return
+
+        self._snap = self._beginTxn()
+        try:
+            yield self._snap
+        finally:
+            self._cursors = {}
+            self._snap.abort()  # read only so nothing to commit
+            self._snap = None
+
+
+    def _cursor(self, txn, db):
+        """
+        Returns cursor on db for a point lookup (not for an iterator). Within a
+        .snapshot() block reuses one cursor per db. Otherwise new cursor.
+
+        Parameters:
+            txn (lmdb.Transaction): transaction from ._trans
+            db (lmdb._Database): named sub db
+        """
+        if txn is not self._snap:
+            return txn.cursor(db=db)
+        if (cursor := self._cursors.get(db)) is None:
+            cursor = self._cursors[db] = txn.cursor(db=db)
+        return cursor
+
+
+    @contextmanager
+    def _trans(self, db, write=False):
+        """
+        Context manager that joins the shared transaction from .txn() if any
+        or for reads from .snapshot() if any otherwise begins and on exit
+        commits its own transaction on .env.
+        Because a joined transaction is not bound to db all operations on the
+        yielded transaction must provide db explicitly.
+
+        Parameters:
+            db (lmdb._Database): named sub db of operation
+            write (bool): True means own transaction is a write transaction
+                          False means own transaction is read only
+        """
+        if self._txn is not None:
+            if write or self._txn is not self._batch:
+                yield self._txn
+            else:  # reader of batch so hold off commit until reader is done
+                self._readers += 1
+                try:
+                    yield self._txn
+                finally:
+                    self._readers -= 1
+            if write and self._txn is self._batch:  # not nested in .txn()
+                self._batchOps += 1
+                if self.batchDue:
+                    self.commit()
+        elif write and self.batchSize > 0:  # group commit mode
+            try:
+                yield self._begin()
+            except lmdb.Error as ex:  # failed lmdb op may leave batch unusable
+                self._abort()
+                if isinstance(ex, lmdb.MapFullError):
+                    self._full = True
+                    self.grow()
+                raise
+            self._batchOps += 1
+            if self.batchDue:
+                self.commit()
+        elif not write and self._snap is not None:
+            yield self._snap
+        else:
+            if write:
+                self.grow()
+            txn = self._beginTxn(db=db, write=write)
+            self._active += 1
+            try:
+                with txn:
+                    yield txn
+            except BaseException as ex:  # own txn aborted
+                if write:
+                    self._ons = {}
+                    self._full = isinstance(ex, lmdb.MapFullError) or self._full
+                raise
+            finally:
+                self._active -= 1
+
+
+    def _beginTxn(self, db=None, write=False, buffers=True, parent=None):
+        """
+        Returns new transaction on .env. Once another process sharing .env such
+        as the writer of a readonly replica has grown the map size LMDB refuses
+        to begin a transaction until the new map size is adopted which is only
+        allowed when this process holds no other open transaction on .env.
+
+        Parameters:
+            db (lmdb._Database): default named sub db of transaction
+            write (bool): True means write transaction False means read only
+            buffers (bool): True means reads return memoryviews not bytes
+            parent (lmdb.Transaction): parent of nested write transaction if any
+        """
+        try:
+            return self.env.begin(db=db, write=write, buffers=buffers, parent=parent)
+        except lmdb.MapResizedError:
+            if self._active or self._txn is not None or self._snap is not None:
+                raise
+            self.env.set_mapsize(0)  # adopt map size grown by other process
+            self.mapSize = self.env.info()["map_size"]
+            return self.env.begin(db=db, write=write, buffers=buffers, parent=parent)
+
+
+    def _begin(self):
+        """
+        Returns open group commit write transaction, beginning one if needed
+        """
+        if self._batch is None:
+            self.grow()
+            self._batch = self._beginTxn(write=True, buffers=False)
+            self._batchOps = 0
+            self._batchStamp = time.monotonic()
+            self._txn = self._batch
+        return self._batch
+
+
+    def _abort(self):
+        """
+        Aborts open group commit write transaction if any losing its writes.
+        """
+        if self._batch is not None:
+            self._batch.abort()
+            self._ons = {}
+            logger.error("LMDBer %s: aborted group commit of %s writes.",
+                         self.name, self._batchOps)
+        self._batch = None
+        self._txn = None
+        self._batchOps = 0
+
+
+    @property
+    def batchDue(self):
+        """
+        Returns:
+            due (bool): True means open group commit batch has reached either
+                .batchSize write operations or is .batchPeriod seconds old and
+                no read iterator is still walking a cursor of the batch
+        """
+        return (self._batch is not None and self._readers == 0 and
+                (self._batchOps >= self.batchSize or
+                 time.monotonic() - self._batchStamp >= self.batchPeriod))
+
+
+    def commit(self):
+        """
+        Commits open group commit write transaction if any. When .sync is
+        False the commit is not flushed to disk. Use .flush for durability.
+        Raises ValueError if called from inside a .txn() block.
+
+        Returns:
+            result (bool): True if batch was committed False if no open batch
+        """
+        if self._txn is not self._batch:
+            raise ValueError("Commit of group batch within .txn() block.")
+        if self._batch is None:
+            return False
+        self._batch.commit()
+        self._batch = None
+        self._txn = None
+        self._batchOps = 0
+        return True
+
+
+    def flush(self):
+        """
+        Durability barrier. Commits open group commit write transaction if any
+        and when .sync is False forces a flush of the environment to disk.
+        Call before any response that promises the durability of prior writes
+        such as sending a receipt.
+        Raises ValueError if called from inside a .txn() block.
+        """
+        self.commit()
+        if self.env is not None and not self.sync and not self.readonly:
+            self.env.sync(True)
+
+
+    def tick(self):
+        """
+        Periodic group commit. Call once per Doist tick so an open group commit
+        batch is flushed once it is due even when no further writes arrive.
+        """
+        if self.batchDue:
+            self.flush()
+
+
+    def grow(self, force=False):
+        """
+        Grows LMDB map size by .mapGrowth increments until used bytes are below
+        .mapFill of map size. Only grows when this process holds no open
+        transaction on .env otherwise LMDB may not resize so returns False and
+        growth is retried on a later write.
+
+        Parameters:
+            force (bool): True means grow by at least one increment even when
+                          used is below .mapFill
+
+        Returns:
+            result (bool): True if map size was grown False otherwise
+        """
+        if (self.env is None or self.readonly or self._active or
+                self._txn is not None or self._snap is not None):
+            return False
+        info = self.env.info()
+        size = info["map_size"]
+        used = (info["last_pgno"] + 1) * self._psize
+        force = force or self._full
+        if not force and used < self.mapFill * size:
+            self.mapSize = size  # may have been grown by another process
+            return False
+
+        grown = size + self.mapGrowth
+        while used >= self.mapFill * grown:
+            grown += self.mapGrowth
+        self.env.set_mapsize(grown)
+        self.mapSize = grown
+        self._full = False
+        logger.info("LMDBer %s: grew map size from %s to %s bytes with %s used.",
+                    self.name, size, grown, used)
+        return True
+
+
+    def backup(self, path, compact=True):
+        """
+        Hot backup. Copies .env into directory at path from a consistent read
+        snapshot while the database keeps serving. Any open group commit batch
+        is committed first so its writes are included.
+        Raises ValueError if called from inside a .txn() block or if path is
+        not empty.
+
+        Parameters:
+            path (str): directory path of copy. Created if not existing
+            compact (bool): True means omit free pages and renumber pages so
+                            copy is compacted. False means plain page copy
+
+        Returns:
+            txnid (int): id of last transaction included in copy
+        """
+        self.commit()  # include group commit batch in copy
+        if os.path.exists(path) and os.listdir(path):
+            raise ValueError(f"Backup path={path} is not empty.")
+        os.makedirs(path, mode=self.perm, exist_ok=True)
+        with self.env.begin(write=False) as txn:
+            self.env.copy(path, compact=compact, txn=txn)
+            return txn.id()
+
+
+    def compact(self):
+        """
+        Online compaction. Makes compacted copy of .env from a read snapshot,
+        while the database keeps serving, into staging directory
+        .path + '.compact' to be swapped in place of .path on next .reopen.
+        Raises ValueError if called from inside a .txn() block.
+
+        Returns:
+            staged (str): path of staged compacted copy
+        """
+        staged = self.path + ".compact"
+        temp = staged + ".tmp"
+        for path in (temp, staged):
+            if os.path.exists(path):
+                shutil.rmtree(path)
+        txnid = self.backup(temp, compact=True)
+        with open(os.path.join(temp, "txnid"), "w") as f:
+            f.write(str(txnid))
+        os.replace(temp, staged)  # atomic so staged is always complete
+        return staged
+
+
+    def _swap(self):
+        """
+        Swaps staged compacted copy from .compact in place of .path when safe
+        and completes or undoes an interrupted swap. Called by .reopen before
+        .env is opened. When writes were made since the staged copy was taken
+        it is stale so is discarded and .env is compacted again here before it
+        is opened, while no process has it open, so the writes are kept.
+        Sets .stale True when stale copy discarded.
+
+        Returns:
+            result (bool): True means compacted copy swapped in False otherwise
+        """
+        self.stale = False
+        staged = self.path + ".compact"
+        old = self.path + ".old"
+        data = os.path.join(self.path, "data.mdb")
+        if os.path.exists(old):  # interrupted swap
+            if not os.path.exists(data):  # between renames so complete or undo
+                shutil.rmtree(self.path)
+                os.replace(staged if os.path.exists(staged) else old, self.path)
+            if os.path.exists(old):
+                shutil.rmtree(old)
+        if os.path.exists(staged + ".tmp"):  # interrupted copy
+            shutil.rmtree(staged + ".tmp")
+        if not os.path.exists(staged):
+            return False
+
+        if os.path.realpath(self.path) in _OpenPaths:
+            # POSIX record locks do not conflict within a process and closing
+            # any fd on lock.mdb drops all of them so never probe own env
+            logger.info("LMDBer %s: deferred swap of compacted copy as "
+                        "env is open in this process.", self.name)
+            return False
+
+        with open(os.path.join(staged, "txnid"), "r") as f:
+            txnid = int(f.read())
+        lock = os.path.join(self.path, "lock.mdb")
+        fd = os.open(lock, os.O_RDWR | os.O_CREAT, self.perm)
+        try:
+            try:  # lmdb holds shared lock on first byte while env is open
+                fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, 0)
+            except OSError:
+                logger.info("LMDBer %s: deferred swap of compacted copy as "
+                            "env is open in other process.", self.name)
+                return False
+
+            if os.path.exists(data):  # openers block on lock so env is quiet
+                env = lmdb.open(self.path, readonly=True, lock=False)
+                try:
+                    current = env.info()["last_txnid"]
+                    if current != txnid:  # stale copy so compact again now
+                        shutil.rmtree(staged)
+                        self.stale = True
+                        logger.info("LMDBer %s: discarded compacted copy at "
+                                    "txnid=%s as writes since at txnid=%s, "
+                                    "compacting again.", self.name, txnid,
+                                    current)
+                        os.makedirs(staged + ".tmp", mode=self.perm)
+                        env.copy(staged + ".tmp", compact=True)
+                        os.replace(staged + ".tmp", staged)
+                finally:
+                    env.close()
+
+            os.replace(self.path, old)
+            os.replace(staged, self.path)
+            txnid = os.path.join(self.path, "txnid")
+            if os.path.exists(txnid):
+                os.remove(txnid)
+            shutil.rmtree(old)
+        finally:
+            os.close(fd)
+
+        logger.info("LMDBer %s: swapped in compacted copy.", self.name)
+        return True
+
+
+    def stats(self):
+        """
+        Returns capacity statistics of .env and of each named sub db so disk
+        usage can be sized and dominant sub dbs identified.
+
+        Returns:
+            stats (dict): with fields
+                path (str): directory path of .env
+                mapSize (int): map size in bytes
+                used (int): bytes used by pages of map
+                fill (float): fraction of map size used
+                pageSize (int): bytes per page
+                readers (int): number of reader slots in use
+                dbs (dict): keyed by sub db name of dict with fields entries,
+                    depth, branchPages, leafPages, overflowPages, pages and bytes
+        """
+        info = self.env.info()
+        psize = self._psize
+        used = (info["last_pgno"] + 1) * psize
+        dbs = {}
+        with self._trans(db=None) as txn:
+            # keys of main db are names of sub dbs
+            names = [bytes(key) for key in txn.cursor().iternext(values=False)]
+            for name in names:
+                try:
+                    db = self.env.open_db(key=name, txn=txn, create=False)
+                except lmdb.Error:  # not a sub db
+                    continue
+                stat = txn.stat(db)
+                pages = (stat["branch_pages"] + stat["leaf_pages"] +
+                         stat["overflow_pages"])
+                dbs[name.decode("utf-8")] = dict(entries=stat["entries"],
+                                                 depth=stat["depth"],
+                                                 branchPages=stat["branch_pages"],
+                                                 leafPages=stat["leaf_pages"],
+                                                 overflowPages=stat["overflow_pages"],
+                                                 pages=pages,
+                                                 bytes=pages * psize)
+
+        return dict(path=self.path,
+                    mapSize=info["map_size"],
+                    used=used,
+                    fill=used / info["map_size"],
+                    pageSize=psize,
+                    readers=info["num_readers"],
+                    dbs=dbs)
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     def putVal(self, db, key, val):
         """
@@ -416,8 +1205,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.put(key, val, overwrite=False))
+        with self._trans(db=db, write=True) as txn:
+            return (txn.put(key, val, overwrite=False, db=db))
 
 
     def setVal(self, db, key, val):
@@ -431,8 +1220,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.put(key, val))
+        with self._trans(db=db, write=True) as txn:
+            return (txn.put(key, val, db=db))
 
 
     def getVal(self, db, key):
@@ -445,8 +1234,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            return( txn.get(key))
+        with self._trans(db=db, write=False) as txn:
+            return( txn.get(key, db=db))
 
 
     def delVal(self, db, key):
@@ -458,23 +1247,21 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key))
+        self._ons.pop(db, None)
+        with self._trans(db=db, write=True) as txn:
+            return (txn.delete(key, db=db))
 
 
     def cnt(self, db):
         """
         Return count of values in db, or zero otherwise
+        Reads the entry count from the sub db statistics so does not walk db.
 
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            count = 0
-            for _, _ in cursor:
-                count += 1
-            return count
+        with self._trans(db=db, write=False) as txn:
+            return txn.stat(db)["entries"]
 
 
     def getAllItemIter(self, db, key=b'', split=True, sep=b'.'):
@@ -495,8 +1282,8 @@ class LMDBer(filing.Filer):
             split (bool): True means split key at sep before returning
             sep (bytes): separator char for key
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
 
@@ -530,8 +1317,8 @@ class LMDBer(filing.Filer):
                         from multiple branches of the key space. If top key is
                         empty then gets all items in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             if cursor.set_range(key):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
                     ckey = bytes(ckey)
@@ -564,9 +1351,10 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        self._ons.pop(db, None)
+        with self._trans(db=db, write=True) as txn:
             result = False
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(key):  # move to val at key >= key if any
                 ckey, cval = cursor.item()
                 while ckey:  # end of database key == b''
@@ -578,15 +1366,242 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @property
+    def schemaVer(self):
+        """
+        Returns stored schema version of database. 0 means created before
+        schema versions were stored.
+        """
+        if self.meta is None:
+            return 0
+        with self.env.begin(buffers=False) as txn:
+            raw = txn.get(SchemaKey, db=self.meta)
+        return int(raw) if raw is not None else 0
+
+
+    def migrate(self, batch=1000, dry=False, rate=None):
+        """
+        Returns list of reports of pending schema migrations from .schemaVer to
+        .Migrations.version in order. Runs each migration unless dry and then
+        stores its new schema version so an interrupted migrate resumes with
+        the migration that was interrupted. No other process may use the
+        database while migrating.
+
+        Each report is a dict with fields:
+            ver (int): schema version migrated from
+            name (str): name of migration
+            entries (int): entries of sub dbs streamed by migration
+            secs (float): estimated duration in seconds
+
+        Parameters:
+            batch (int): max entries streamed per write transaction
+            dry (bool): True means only estimate duration without migrating
+            rate (float): estimated entries per second. Default .MigrateRate
+        """
+        rate = rate if rate is not None else self.MigrateRate
+        migrations = self.Migrations.pending(self.schemaVer)
+        if migrations and not dry and self.readonly:
+            raise kering.DatabaseError(f"Attempt to migrate readonly database"
+                                       f" {self.path}.")
+
+        reports = []
+        for migration in migrations:
+            entries = 0
+            for table in migration.tables:
+                try:
+                    db = self.env.open_db(key=table.encode("utf-8"), create=False)
+                except lmdb.NotFoundError:  # not yet created so empty
+                    continue
+                entries += self.cnt(db)
+            reports.append(dict(ver=migration.ver, name=migration.name,
+                                entries=entries, secs=entries / rate))
+
+        if not dry:
+            for migration, report in zip(migrations, reports):
+                logger.info("Migrating %s schema version %s with %s of %s entries"
+                            " estimated %.1f seconds.", self.path, migration.ver,
+                            migration.name, report["entries"], report["secs"])
+                migration.run(self, batch)
+                with self.txn() as txn:
+                    txn.put(SchemaKey, b'%d' % (migration.ver + 1), db=self.meta)
+
+        return reports
+
+
+    def streamItems(self, db, fn, ckey, batch=1000, done=None):
+        """
+        Returns number of entries streamed. Calls fn(txn, key, val) for each
+        entry of db in key order in write transactions of at most batch
+        entries. Checkpoints the last key of each transaction at ckey in .meta
+        so when interrupted a later call with same ckey resumes after it. When
+        all are streamed deletes the checkpoint and calls done(txn) if any in
+        the same transaction as the last entries so completion is atomic.
+
+        fn may write to other sub dbs or overwrite the val at key in db but
+        must not insert or delete entries of db. All dups at a key of a dupsort
+        db are streamed in the same transaction.
+
+        Parameters:
+            db (lmdb._Database): sub db to stream
+            fn (Callable): fn(txn, key, val) called with bytes key and val
+            ckey (bytes): key in .meta of checkpoint
+            batch (int): max entries per write transaction
+            done (Callable): optional done(txn) called when all are streamed
+        """
+        total = 0
+        while True:
+            with self.txn() as txn:
+                last = txn.get(ckey, db=self.meta)
+                last = bytes(last) if last is not None else b''
+                cursor = txn.cursor(db=db)
+                dups = db.flags(txn)["dupsort"]
+                found = cursor.set_range(last)  # empty last is first entry
+                if found and last and cursor.key() == last:  # already streamed
+                    found = cursor.next_nodup() if dups else cursor.next()
+                count = 0
+                while found and (count < batch or (dups and cursor.key() == last)):
+                    last, val = bytes(cursor.key()), bytes(cursor.value())
+                    fn(txn, last, val)
+                    count += 1
+                    found = cursor.next()
+                total += count
+
+                if found:  # checkpoint batch
+                    txn.put(ckey, last, db=self.meta)
+                else:
+                    txn.delete(ckey, db=self.meta)
+                    if done is not None:
+                        done(txn)
+                    return total
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     # and use keys with ordinal as monotonically increasing number part
     # such as sn or fn
+    def openOrdDB(self, key):
+        """
+        Returns named sub db at key whose entries are keyed by .ordKey. A newly
+        created sub db gets key version .KeyVer recorded in .meta otherwise
+        uses its recorded key version. A sub db created before key versions
+        were recorded has key version KeyVerHex.
+
+        Parameters:
+            key (bytes): name of sub db
+        """
+        ver = KeyVerHex
+        if self.meta is not None:
+            vkey = b'%skver' % key
+            with self.env.begin(write=not self.readonly, buffers=False) as txn:
+                if (raw := txn.get(vkey, db=self.meta)) is not None:
+                    ver = int(raw)
+                elif not self.readonly and txn.get(key) is None:  # new sub db
+                    ver = self.KeyVer
+                    txn.put(vkey, b'%d' % ver, db=self.meta)
+
+        db = self.env.open_db(key=key)
+        self._ords[db] = key
+        if ver == KeyVerBin:
+            self._bins.add(db)
+        return db
+
+
+    def ordKey(self, db, pre, on):
+        """
+        Returns key of ordinal sub db for pre and ordinal number on in the key
+        version of db, either onKey or compact onKeyBin.
+
+        Parameters:
+            db (lmdb._Database): ordinal sub db from .openOrdDB
+            pre (bytes | str): identifier prefix or other key
+            on (int): ordinal number
+        """
+        return onKeyBin(pre, on) if db in self._bins else onKey(pre, on)
+
+
+    def splitOrdKey(self, db, key):
+        """
+        Returns duple of pre and int on split from key of ordinal sub db in the
+        key version of db.
+
+        Parameters:
+            db (lmdb._Database): ordinal sub db from .openOrdDB
+            key (bytes | memoryview): key of db
+        """
+        return splitKeyONBin(key) if db in self._bins else splitKeyON(key)
+
+
+    def keyVers(self):
+        """
+        Returns:
+            vers (dict): key version keyed by name of each ordinal sub db
+        """
+        return {key.decode("utf-8"): KeyVerBin if db in self._bins else KeyVerHex
+                for db, key in self._ords.items()}
+
+
+    def migrateKeys(self, batch=1000):
+        """
+        Migrates every ordinal sub db opened by .openOrdDB that is not yet at
+        key version KeyVerBin to compact keys. Streams entries in write
+        transactions of at most batch entries and checkpoints progress in .meta
+        so an interrupted migration resumes where it stopped when called again.
+        No other process may use the database while migrating.
+
+        Returns:
+            counts (dict): number of entries keyed by name of migrated sub db
+
+        Parameters:
+            batch (int): max entries converted per write transaction
+        """
+        counts = {}
+        for db, key in list(self._ords.items()):
+            if db not in self._bins:
+                counts[key.decode("utf-8")] = self._migrateOrdDB(db, key, batch=batch)
+        return counts
+
+
+    def _migrateOrdDB(self, db, key, batch=1000):
+        """
+        Returns number of entries of ordinal sub db db named key after
+        migrating its keys to KeyVerBin. First streams all entries converted
+        into the staging sub db key + 'mig' then empties db and streams them
+        back in key order. The .meta checkpoint of the first phase is at key
+        + 'kmig' and of the second at key + 'kmig2'.
+        """
+        mkey, bkey = b'%skmig' % key, b'%skmig2' % key
+        tmp = self.env.open_db(key=b'%smig' % key)
+
+        def convert(txn, key, val):
+            txn.put(onKeyBin(*splitKeyON(key)), val, db=tmp)
+
+        def back(txn, key, val):  # in key order into emptied db so append
+            txn.put(key, val, db=db, append=True)
+
+        def converted(txn):  # empty db and start second phase
+            txn.drop(db, delete=False)
+            txn.put(bkey, b'', db=self.meta)
+
+        def done(txn):
+            txn.drop(tmp, delete=True)
+            txn.put(b'%skver' % key, b'%d' % KeyVerBin, db=self.meta)
+
+        with self.txn() as txn:
+            phase = 2 if txn.get(bkey, db=self.meta) is not None else 1
+        if phase == 1:
+            self.streamItems(db, convert, ckey=mkey, batch=batch, done=converted)
+        self.streamItems(tmp, back, ckey=bkey, batch=batch, done=done)
+
+        self._bins.add(db)
+        self._ons.pop(db, None)
+        return self.cnt(db)
+
+
     def appendOrdValPre(self, db, pre, val):
         """
         Appends val in order after last previous key with same pre in db.
         Returns ordinal number in, on, of appended entry. Appended on is 1 greater
         than previous latest on.
-        Uses onKey(pre, on) for entries.
+        Uses .ordKey(db, pre, on) for entries.
 
         Append val to end of db entries with same pre but with on incremented by
         1 relative to last preexisting entry at pre.
@@ -596,23 +1611,32 @@ class LMDBer(filing.Filer):
             pre is bytes identifier prefix for event
             val is event digest
         """
-        # set key with fn at max and then walk backwards to find last entry at pre
-        # if any otherwise zeroth entry at pre
-        key = onKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        ons = self._ons.setdefault(db, {})  # cached last on at pre
+        with self._trans(db=db, write=True) as txn:
+            cursor = txn.cursor(db=db)
+            if (on := ons.get(pre)) is not None and on < MaxON:
+                key = self.ordKey(db, pre, on + 1)
+                # cache hit only when no entry at pre at or after on + 1
+                if (not cursor.set_range(key) or
+                        self.splitOrdKey(db, cursor.key())[0] != pre):
+                    if cursor.put(key, val, overwrite=False):
+                        ons[pre] = on + 1
+                        return on + 1  # cache hit so single put
+            # cache miss or stale so set key with fn at max and then walk
+            # backwards to find last entry at pre if any otherwise zeroth entry
+            key = self.ordKey(db, pre, MaxON)
             on = 0  # unless other cases match then zeroth entry at pre
-            cursor = txn.cursor()
             if not cursor.set_range(key):  # max is past end of database
                 #  so either empty database or last is earlier pre or
                 #  last is last entry  at same pre
                 if cursor.last():  # not empty db. last entry earlier than max
                     ckey = cursor.key()
-                    cpre, cn = splitKeyON(ckey)
+                    cpre, cn = self.splitOrdKey(db, ckey)
                     if cpre == pre:  # last is last entry for same pre
                         on = cn + 1  # increment
             else:  # not past end so not empty either later pre or max entry at pre
                 ckey = cursor.key()
-                cpre, cn = splitKeyON(ckey)
+                cpre, cn = self.splitOrdKey(db, ckey)
                 if cpre == pre:  # last entry for pre is already at max
                     raise ValueError("Number part of key {}  exceeds maximum"
                                      " size.".format(ckey))
@@ -620,14 +1644,15 @@ class LMDBer(filing.Filer):
                     # either no entry before last or earlier pre with entry
                     if cursor.prev():  # prev entry, maybe same or earlier pre
                         ckey = cursor.key()
-                        cpre, cn = splitKeyON(ckey)
+                        cpre, cn = self.splitOrdKey(db, ckey)
                         if cpre == pre:  # last entry at pre
                             on = cn + 1  # increment
 
-            key = onKey(pre, on)
+            key = self.ordKey(db, pre, on)
 
             if not cursor.put(key, val, overwrite=False):
                 raise  ValueError("Failed appending {} at {}.".format(val, key))
+            ons[pre] = on
             return on
 
 
@@ -635,7 +1660,7 @@ class LMDBer(filing.Filer):
         """
         Returns iterator of duple item, (on, dig), at each key over all ordinal
         numbered keys with same prefix, pre, in db. Values are sorted by
-        onKey(pre, on) where on is ordinal number int.
+        .ordKey(db, pre, on) where on is ordinal number int.
         Returned items are duples of (on, dig) where on is ordinal number int
         and dig is event digest for lookup in .evts sub db.
 
@@ -646,14 +1671,14 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix
             on is int ordinal number to resume replay
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            key = onKey(pre, on)  # start replay at this enty 0 is earliest
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
+            key = self.ordKey(db, pre, on)  # start replay at this enty 0 is earliest
             if not cursor.set_range(key):  #  moves to val at key >= key
                 return  # no values end of db
 
             for key, val in cursor.iternext():  # get key, val at cursor
-                cpre, cn = splitKeyON(key)
+                cpre, cn = self.splitOrdKey(db, key)
                 if cpre != pre:  # prev is now the last event for pre
                     break  # done
                 yield (cn, val)  # (on, dig) of event
@@ -663,7 +1688,7 @@ class LMDBer(filing.Filer):
         """
         Returns iterator of triple item, (pre, on, dig), at each key over all
         ordinal numbered keys for all prefixes in db. Values are sorted by
-        onKey(pre, on) where on is ordinal number int.
+        .ordKey(db, pre, on) where on is ordinal number int.
         Each returned item is triple (pre, on, dig) where pre is identifier prefix,
         on is ordinal number int and dig is event digest for lookup in .evts sub db.
 
@@ -674,13 +1699,13 @@ class LMDBer(filing.Filer):
             key is key location in db to resume replay,
                    If empty then start at first key in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
 
             for key, val in cursor.iternext():  # return key, val at cursor
-                cpre, cn = splitKeyON(key)
+                cpre, cn = self.splitOrdKey(db, key)
                 yield (cpre, cn, val)  # (pre, on, dig) of event
 
 
@@ -711,10 +1736,10 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 pvals = oset()  # pre-existing vals at key
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
@@ -751,11 +1776,11 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -790,10 +1815,10 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
-                result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
+                result = txn.put(iokey, val, dupdata=False, overwrite=True, db=db) or result
             return result
 
 
@@ -812,10 +1837,20 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to append
         """
-        ion = 0  # default is zeroth insertion at key
-        iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            cursor = txn.cursor()  # create cursor to walk back
+        ions = self._ons.setdefault(db, {})  # cached last ion at key
+        with self._trans(db=db, write=True) as txn:
+            cursor = txn.cursor(db=db)  # create cursor to check or walk back
+            if (ion := ions.get(key)) is not None and ion < MaxSuffix:
+                iokey = suffix(key, ion=ion + 1, sep=sep)
+                # cache hit only when no entry at key at or after ion + 1
+                if (not cursor.set_range(iokey) or
+                        unsuffix(cursor.key(), sep=sep)[0] != key):
+                    if cursor.put(iokey, val, overwrite=False):
+                        ions[key] = ion + 1
+                        return ion + 1  # cache hit so single put
+            # cache miss or stale so make iokey at max and walk back
+            ion = 0  # default is zeroth insertion at key
+            iokey = suffix(key, ion=MaxSuffix, sep=sep)
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
                 # 1. last entry in db is for same key
@@ -846,6 +1881,7 @@ class LMDBer(filing.Filer):
             iokey = suffix(key, ion=ion, sep=sep)
             if not cursor.put(iokey, val, overwrite=False):
                 raise  ValueError("Failed appending {} at {}.".format(val, key))
+            ions[key] = ion
 
             return ion
 
@@ -864,10 +1900,10 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = self._cursor(txn, db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -892,9 +1928,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get key, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -920,8 +1956,8 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()  # create cursor to walk back
+        with self._trans(db=db, write=False) as txn:
+            cursor = self._cursor(txn, db)  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
                 # 1. last entry in db is for same key
@@ -986,9 +2022,10 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        self._ons.pop(db, None)
+        with self._trans(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 iokey, cval = cursor.item()
                 while iokey:  # end of database iokey == b'' cant internext.
@@ -1029,9 +2066,10 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        self._ons.pop(db, None)
+        with self._trans(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -1055,10 +2093,10 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             items = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = self._cursor(txn, db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -1083,9 +2121,9 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._trans(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get key, val at cursor
                     ckey, cion = unsuffix(iokey, sep=sep)
@@ -1107,8 +2145,9 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             iokey (bytes): actual key with ordinal key suffix
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return txn.delete(iokey)
+        self._ons.pop(db, None)
+        with self._trans(db=db, write=True) as txn:
+            return txn.delete(iokey, db=db)
 
 
     # For subdbs that support duplicates at each key (dupsort==True)
@@ -1128,10 +2167,10 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             result = True
             for val in vals:
-                result = result and txn.put(key, val, dupdata=True)
+                result = result and txn.put(key, val, dupdata=True, db=db)
             return result
 
 
@@ -1157,8 +2196,8 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
-                result = txn.put(key, val, dupdata=True)
+            with self._trans(db=db, write=True) as txn:
+                result = txn.put(key, val, dupdata=True, db=db)
         return result
 
 
@@ -1174,8 +2213,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = self._cursor(txn, db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 vals = [val for val in cursor.iternext_dup()]
@@ -1193,8 +2232,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = self._cursor(txn, db)
             val = None
             if cursor.set_key(key):  # move to first_dup
                 if cursor.last_dup(): # move to last_dup
@@ -1213,8 +2252,8 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -1229,8 +2268,8 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = self._cursor(txn, db)
             count = 0
             if cursor.set_key(key):  # moves to first_dup
                 count = cursor.count()
@@ -1248,15 +2287,15 @@ class LMDBer(filing.Filer):
             db is opened named sub db
             pre is bytes of key within sub db's keyspace pre.on
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            key = onKey(pre, on)  # start replay at this enty 0 is earliest
+        with self._trans(db=db, write=False) as txn:
+            cursor = self._cursor(txn, db)
+            key = self.ordKey(db, pre, on)  # start replay at this enty 0 is earliest
             count = 0
             if not cursor.set_range(key):  #  moves to val at key >= key
                 return count  # no values end of db
 
             for val in cursor.iternext(values=False):  # get key, val at cursor
-                cpre, cn = splitKeyON(val)
+                cpre, cn = self.splitOrdKey(db, val)
                 if cpre != pre:  # prev is now the last event for pre
                     break  # done
                 count = count+1
@@ -1274,8 +2313,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key, val))
+        with self._trans(db=db, write=True) as txn:
+            return (txn.delete(key, val, db=db))
 
 
     # For subdbs that support insertion order preserving duplicates at each key.
@@ -1306,9 +2345,9 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._trans(db=db, write=True) as txn:
             idx = 0
-            cursor = txn.cursor()
+            cursor = txn.cursor(db=db)
             if cursor.set_key(key): # move to key if any
                 if cursor.last_dup(): # move to last dup
                     idx = 1 + int(bytes(cursor.value()[:32]), 16)  # get last index as int
@@ -1316,7 +2355,7 @@ class LMDBer(filing.Filer):
             for val in vals:
                 if val not in dups:
                     val = (b'%032x.' % (idx)) +  val  # prepend ordering proem
-                    txn.put(key, val, dupdata=True)
+                    txn.put(key, val, dupdata=True, db=db)
                     idx += 1
                     result = True
         return result
@@ -1350,8 +2389,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = self._cursor(txn, db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 # slice off prepended ordering proem
@@ -1371,8 +2410,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -1391,8 +2430,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = self._cursor(txn, db)
             val = None
             if cursor.set_key(key):  # move to first_dup
                 if cursor.last_dup(): # move to last_dup
@@ -1421,8 +2460,8 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = self._cursor(txn, db)
             items = []
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
@@ -1455,8 +2494,8 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
                 if skip and key and cursor.key() == key:  # skip to next key
@@ -1476,14 +2515,89 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = self._cursor(txn, db)
             count = 0
             if cursor.set_key(key):  # moves to first_dup
                 count = cursor.count()
             return count
 
 
+    def cntIoValsTop(self, db, top=b""):
+        """
+        Return count of dup values at all keys in db that start with top,
+        or zero otherwise. Counts dups per key with cursor count so does not
+        walk the dups.
+        Assumes DB opened with dupsort=True
+
+        Parameters:
+            db is opened named sub db with dupsort=True
+            top is bytes prefix of keys to count. Empty counts all keys
+        """
+        if not top:
+            return self.cnt(db)
+
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
+            count = 0
+            if cursor.set_range(top):
+                while (key := cursor.key()) and bytes(key).startswith(top):
+                    count += cursor.count()
+                    if not cursor.next_nodup():
+                        break
+            return count
+
+
+    def getIoItemsPage(self, db, top=b"", key=b"", ioval=b"", limit=100):
+        """
+        Return duple (items, last) of page of at most limit dup items in db
+        after dup ioval at key in key then insertion order. Items are
+        (key, val) with proem stripped from val stored in db. Last is
+        duple (key, ioval) of last item of page with its proem, to resume at
+        in next call, or None when no items follow the page.
+        Only items at keys that start with top are returned.
+
+        Because ioval includes its ordering proem the resume point is exact
+        even when items before it are deleted between calls.
+
+        Assumes DB opened with dupsort=True
+
+        Parameters:
+            db is opened named sub db with dupsort=True
+            top is bytes prefix of keys of page. Empty means all keys
+            key is bytes key of last item of prior page or empty to start at top
+            ioval is bytes val with proem of last item of prior page or empty
+            limit is int maximum number of items of page, at least 1
+        """
+        if limit < 1:
+            raise ValueError(f"Invalid page limit = {limit}, must be at least 1.")
+
+        items = []
+        last = None
+        lkey = lval = b""  # key and val with proem of last item of page
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
+            if not key:
+                found = cursor.set_range(top)
+            elif ioval and cursor.set_range_dup(key, ioval):  # first dup >= ioval
+                found = cursor.next() if bytes(cursor.value()) == ioval else True
+            elif cursor.set_range(key):  # no dup >= ioval at key
+                found = cursor.next_nodup() if ioval and bytes(cursor.key()) == key else True
+            else:
+                found = False
+
+            if found:
+                for ckey, cval in cursor.iternext():
+                    if not bytes(ckey).startswith(top):
+                        break
+                    if len(items) == limit:  # more follow so resume at last
+                        last = (lkey, lval)
+                        break
+                    lkey, lval = bytes(ckey), bytes(cval)
+                    items.append((lkey, lval[33:]))
+            return (items, last)
+
+
     def delIoVals(self,db, key):
         """
         Deletes all values at key in db if key present.
@@ -1494,8 +2608,8 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            return (txn.delete(key))
+        with self._trans(db=db, write=True) as txn:
+            return (txn.delete(key, db=db))
 
 
     def delIoVal(self, db, key, val):
@@ -1527,8 +2641,8 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=True) as txn:
+            cursor = txn.cursor(db=db)
             if cursor.set_key(key):  # move to first_dup
                 for proval in cursor.iternext_dup():  #  value with proem
                     if val == proval[33:]:  #  strip of proem
@@ -1554,8 +2668,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -1581,8 +2695,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt := fn)
             while cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
@@ -1610,8 +2724,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 if cursor.last_dup(): # move to last_dup
@@ -1642,8 +2756,8 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
+        with self._trans(db=db, write=False) as txn:
+            cursor = txn.cursor(db=db)
             key = snKey(pre, cnt:=0)
             while cursor.set_range(key):  #  moves to first dup of key >= key
                 key = cursor.key()  # actual key
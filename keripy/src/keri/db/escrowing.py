@@ -3,7 +3,6 @@
 keri.core.escrowing module
 
 """
-import datetime
 import logging
 from typing import Type
 
@@ -11,8 +10,7 @@ from keri.core import coring
 from keri import help
 from keri import kering
 from keri.core import eventing
-from keri.db import subing
-from keri.help import helping
+from keri.db import basing, subing
 
 logger = help.ogler.getLogger()
 
@@ -49,6 +47,9 @@ class Broker:
         # Routes such as /ksn/{aid} or /tsn/registry/{aid}
         self.escrowdb = subing.CesrIoSetSuber(db=self.db, subkey=subkey + '-nes', klas=coring.Saider)
 
+        # escrow expiry index of state escrows keyed by (typ, pre, aid) and said
+        self.expirer = basing.Expirer(db=self.db, label=subkey + '-nes')
+
         # transaction state SAID database for successfully saved transaction state notices
         # maps key=(prefix, aid) to val=said of transaction state
         self.saiderdb = subing.CesrSuber(db=self.db, subkey=subkey + '-nas.', klas=coring.Saider)
@@ -71,17 +72,22 @@ class Broker:
             extype (Type[Exception]): the expected exception type if the message should remain in escrow
 
         """
+        for key, said in self.expirer.expire(timeout=self.timeout):
+            # escrow stale so remove escrow only as for other errors below
+            self.escrowdb.rem(keys=key, val=coring.Saider(qb64b=said))
+            logger.info("Kevery unescrow error: Stale txn state escrow "
+                        " at key = %s\n", key.decode("utf-8"))
+
         for (typ, pre, aid, ion), saider in self.escrowdb.getIoItemIter(keys=(typ,)):
             try:
                 tsgs = eventing.fetchTsgs(db=self.tigerdb, saider=saider)
 
                 keys = (saider.qb64,)
-                dater = self.daterdb.get(keys=keys)
                 serder = self.serderdb.get(keys=keys)
                 vcigars = self.cigardb.get(keys=keys)
 
                 try:
-                    if not (dater and serder and (tsgs or vcigars)):
+                    if not (serder and (tsgs or vcigars)):
                         raise ValueError(f"Missing escrow artifacts at said={saider.qb64}"
                                          f"for pre={pre}.")
 
@@ -91,15 +97,6 @@ class Broker:
                             cigar.verfer = verfer
                             cigars.append(cigar)
 
-                    # do date math for stale escrow
-                    if ((helping.nowUTC() - dater.datetime) >
-                            datetime.timedelta(seconds=self.timeout)):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale txn state escrow "
-                                    " at pre = %s\n", pre)
-
-                        raise kering.ValidationError(f"Stale txn state escrow at pre = {pre}.")
-
                     processReply(serder=serder, saider=saider, route=serder.ked["r"],
                                  cigars=cigars, tsgs=tsgs, aid=aid)
 
@@ -111,19 +108,19 @@ class Broker:
                         logger.error("Kevery unescrow attempt failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # other error so remove from reply escrow
-                    self.escrowdb.remIokey(iokeys=(typ, pre, aid, ion))  # remove escrow
+                    self.removeEscrowState(typ, pre, aid, ion, saider)  # remove escrow
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrowed due to error: %s\n", ex.args[0])
                     else:
                         logger.error("Kevery unescrowed due to error: %s\n", ex.args[0])
 
                 else:  # unescrow succeded
-                    self.escrowdb.remIokey(iokeys=(typ, pre, aid, ion))  # remove escrow only
+                    self.removeEscrowState(typ, pre, aid, ion, saider)  # remove escrow only
                     logger.info("Kevery unescrow succeeded for txn state=\n%s\n",
                                 serder.pretty())
 
             except Exception as ex:  # log diagnostics errors etc
-                self.escrowdb.remIokey(iokeys=(typ, pre, aid, ion))  # remove escrow
+                self.removeEscrowState(typ, pre, aid, ion, saider)  # remove escrow
                 self.removeState(saider)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Kevery unescrowed due to error: %s\n", ex.args[0])
@@ -163,8 +160,24 @@ class Broker:
         for cigar in cigars:  # process each couple to verify sig and write to db
             self.cigardb.put(keys=keys, vals=[(cigar.verfer, cigar)])
 
+        self.expirer.put(self.escrowdb.sep.join((typ, pre, aid)), saider.qb64b)
         return self.escrowdb.put(keys=(typ, pre, aid), vals=[saider])  # overwrite
 
+    def removeEscrowState(self, typ, pre, aid, ion, saider):
+        """
+        Remove state escrow entry at (typ, pre, aid) and ion and its expiry
+        index entry
+
+        Parameters:
+            typ (str): escrow type
+            pre (str): identifier of key state
+            aid (str): identifier of authorizer of key state
+            ion (int): insertion ordinal of entry at (typ, pre, aid)
+            saider (Saider): instance from said in serder (SAD)
+        """
+        self.escrowdb.remIokey(iokeys=(typ, pre, aid, ion))
+        self.expirer.rem(self.escrowdb.sep.join((typ, pre, aid)), saider.qb64b)
+
     def updateState(self, aid, serder, saider, dater):
         """
         Update Reply SAD in database given by by serder and associated databases
@@ -128,6 +128,26 @@ class KomerBase:
             yield (self._tokeys(key), self.deserializer(val))
 
 
+    def getRawItemIter(self, keys: Union[str, Iterable]=b""):
+        """
+        Same as .getItemIter but val is not deserialized into .schema instance.
+
+        Returns:
+            items (Iterator): of (key, val) tuples where val is memoryview
+            of raw serialization. Within a .db.snapshot() block val is a zero
+            copy view only valid until the end of the block.
+
+        Parameters:
+            keys (Iterator): tuple of bytes or strs that may be a truncation of
+                a full keys tuple in  in order to get all the items from
+                multiple branches of the key space. If keys is empty then gets
+                all items in database.
+
+        """
+        for key, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
+            yield (self._tokeys(key), val)
+
+
     def _serializer(self, kind):
         """
         Parameters:
@@ -282,6 +302,22 @@ class Komer(KomerBase):
                                   key=self._tokey(keys))))
 
 
+    def getRaw(self, keys: Union[str, Iterable]):
+        """
+        Gets raw serialization at keys without deserializing into .schema
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+
+        Returns:
+            val (memoryview): of raw serialization. Within a .db.snapshot()
+                block val is a zero copy view only valid until the end of
+                the block.
+            None if no entry at keys
+        """
+        return self.db.getVal(db=self.sdb, key=self._tokey(keys))
+
+
     def rem(self, keys: Union[str, Iterable]):
         """
         Removes entry at keys
@@ -172,6 +172,27 @@ class SuberBase():
             yield (self._tokeys(key), self._des(val))
 
 
+    def getRawItemIter(self, keys: Union[str, Iterable]=b""):
+        """
+        Same as .getItemIter but val is not deserialized. Use when stored
+        bytes are only forwarded so not worth decoding and re-encoding.
+
+        Returns:
+            items (Iterator): of (key, val) tuples where val is memoryview
+            of raw stored bytes. Within a .db.snapshot() block val is a zero
+            copy view only valid until the end of the block.
+
+        Parameters:
+            keys (Iterator): tuple of bytes or strs that may be a truncation of
+                a full keys tuple in  in order to get all the items from
+                multiple branches of the key space. If keys is empty then gets
+                all items in database.
+
+        """
+        for key, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
+            yield (self._tokeys(key), val)
+
+
     def trim(self, keys: Union[str, Iterable]=b""):
         """
         Removes all entries whose keys startswith keys. Enables removal of whole
@@ -259,6 +280,24 @@ class Suber(SuberBase):
         return (self._des(val) if val is not None else None)
 
 
+    def getRaw(self, keys: Union[str, Iterable]):
+        """
+        Gets raw stored bytes at keys without deserializing. Use when stored
+        bytes are only forwarded so not worth decoding and re-encoding.
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key
+
+        Returns:
+            val (memoryview): of raw stored bytes. Within a .db.snapshot()
+                block val is a zero copy view only valid until the end of
+                the block.
+            None if no entry at keys
+
+        """
+        return self.db.getVal(db=self.sdb, key=self._tokey(keys))
+
+
     def rem(self, keys: Union[str, Iterable]):
         """
         Removes entry at keys
@@ -17,7 +17,7 @@ from ..core import parsing, coring, scheming
 from ..core.coring import Seqner, MtrDex, Serder
 from ..core.eventing import SealEvent, TraitDex
 from ..db import dbing
-from ..db.dbing import snKey, dgKey
+from ..db.dbing import dgKey
 from ..vc import proving, protocoling
 from ..vdr import eventing
 from ..vdr.viring import Reger
@@ -50,6 +50,8 @@ class Regery:
         if not self.reger.opened:
             raise kering.ClosedError("Attempt to setup Regery with closed "
                                      "reger.")
+        if not self.reger.readonly:  # run pending schema migrations
+            self.reger.migrate()
         self.loadRegistries()
         self.inited = True
 
@@ -319,7 +321,7 @@ class Registry:
 
         """
         vci = said
-        vcser = self.reger.getTel(snKey(pre=vci, sn=0))
+        vcser = self.reger.getTel(self.reger.ordKey(self.reger.tels, pre=vci, on=0))
         if vcser is None:
             raise kering.ValidationError("Invalid revoke of {} that has not been issued "
                                          "pre={}.".format(vci, self.regk))
@@ -640,7 +642,7 @@ class Registrar(doing.DoDoer):
     def processDiseminationEscrow(self):
         for (regk, snq), (prefixer, seqner, saider) in self.rgy.reger.tede.getItemIter():  # group multisig escrow
             rseq = coring.Seqner(qb64=snq)
-            dig = self.rgy.reger.getTel(key=snKey(pre=regk, sn=rseq.sn))
+            dig = self.rgy.reger.getTel(key=self.rgy.reger.ordKey(self.rgy.reger.tels, pre=regk, on=rseq.sn))
             if dig is None:
                 continue
 
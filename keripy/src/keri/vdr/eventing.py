@@ -1151,7 +1151,7 @@ class Tever:
         # have to compare with VC issuance serder
         vci = vcpre
 
-        dig = self.reger.getTel(snKey(pre=vci, sn=sn - 1))
+        dig = self.reger.getTel(self.reger.ordKey(self.reger.tels, pre=vci, on=sn - 1))
         ievt = self.reger.getTvt(dgKey(pre=vci, dig=dig))
         if ievt is None:
             raise ValidationError("revoke without issue... probably have to escrow")
@@ -1289,7 +1289,7 @@ class Tever:
             self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
         self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
         self.reger.putTvt(key, serder.raw)
-        self.reger.putTel(snKey(pre, sn), dig)
+        self.reger.putTel(self.reger.ordKey(self.reger.tels, pre=pre, on=sn), dig)
         logger.info("Tever state: %s Added to TEL valid event=\n%s\n",
                     pre, json.dumps(serder.ked, indent=1))
 
@@ -1824,7 +1824,7 @@ class Tevery:
         if not accepted:
             raise kering.UnverifiedReplyError(f"Unverified reply.")
 
-        ldig = self.reger.getTel(key=snKey(pre=regk, sn=sn))  # retrieve dig of last event at sn.
+        ldig = self.reger.getTel(key=self.reger.ordKey(self.reger.tels, pre=regk, on=sn))  # retrieve dig of last event at sn.
 
         # Only accept key state if for last seen version of event at sn
         if ldig is None:  # escrow because event does not yet exist in database
@@ -1970,7 +1970,7 @@ class Tevery:
         if not accepted:
             raise kering.UnverifiedReplyError(f"Unverified reply.")
 
-        ldig = self.reger.getTel(key=snKey(pre=vci, sn=sn))  # retrieve dig of last event at sn.
+        ldig = self.reger.getTel(key=self.reger.ordKey(self.reger.tels, pre=vci, on=sn))  # retrieve dig of last event at sn.
 
         # Only accept key state if for last seen version of event at sn
         if ldig is None:  # escrow because event does not yet exist in database
@@ -167,11 +167,15 @@ class Reger(dbing.LMDBer):
             key is habitat name str
             value is serialized RegistryRecord dataclass
 
+        .txnsb is Broker of txn state notices whose escrow is indexed under
+            label 'txn.-nes' in escrow expiry index .exps
+
 
     """
     TailDirPath = "keri/reg"
     AltTailDirPath = ".keri/reg"
     TempPrefix = "keri_reg_"
+    Migrations = dbing.Migrator()  # registry of schema migrations
 
     def __init__(self, headDirPath=None, reopen=True, **kwa):
         """
@@ -233,7 +237,7 @@ class Reger(dbing.LMDBer):
         # to avoid namespace collisions with Base64 identifier prefixes.
 
         self.tvts = self.env.open_db(key=b'tvts.')
-        self.tels = self.env.open_db(key=b'tels.')
+        self.tels = self.openOrdDB(key=b'tels.')
         self.ancs = self.env.open_db(key=b'ancs.')
         self.tibs = self.env.open_db(key=b'tibs.', dupsort=True)
         self.baks = self.env.open_db(key=b'baks.', dupsort=True)
@@ -901,6 +905,27 @@ class Reger(dbing.LMDBer):
         return self.delIoVal(self.baks, key, val)
 
 
+@Reger.Migrations.register(ver=0, tables=("txn.-nes",))
+def indexStateEscrows(db, batch):
+    """
+    Backfills escrow expiry index .exps with the txn state notice escrows of
+    .txnsb escrowed before they were indexed. They are indexed at the time of
+    migration so each gets a full timeout before it is stale.
+
+    Parameters:
+        db (Reger): database to migrate
+        batch (int): max entries indexed per write transaction
+    """
+    dt = helping.nowUTC()
+    escrowdb = db.txnsb.escrowdb
+
+    def index(txn, key, val):
+        key, _ = dbing.unsuffix(key, sep=escrowdb.sep)  # strip insertion ordinal
+        db.txnsb.expirer.put(key, val, dt=dt)
+
+    db.streamItems(escrowdb.sdb, index, ckey=b'indexStateEscrows', batch=batch)
+
+
 def buildProof(prefixer, seqner, diger, sigers):
     """
     Create CESR proof attachment from the quadlet of seal plus signatures on the credential
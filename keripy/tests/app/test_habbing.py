@@ -9,11 +9,12 @@ import os
 import shutil
 
 from hio.base import doing, tyming
+from hio.help import decking
 
 from keri import kering
 from keri import help
 from keri.app import habbing, keeping, configing
-from keri.db import basing
+from keri.db import basing, dbing
 from keri.core import coring, eventing, parsing
 from keri.peer import exchanging
 
@@ -583,6 +584,85 @@ def test_habery_reinitialization():
     """End Test"""
 
 
+def test_habery_lazy_reload():
+    """Test reopening Habery builds Habs and Kevers on first access from snapshot
+    """
+    name = "lazy-test"
+    with habbing.openHby(name=name, base="test", temp=False, clear=True) as hby:
+        hab = hby.makeHab(name=name)
+        other = hby.makeHab(name="other")
+        assert hby.db.strt.get(keys="habs") is None  # dropped by writes to .habs
+
+    with habbing.openHby(name=name, base="test", temp=False) as hby:  # rebuilds snapshot
+        snap = hby.db.strt.get(keys="habs")
+        assert snap.names == {hab.pre: name, other.pre: "other"}
+
+    with habbing.openHby(name=name, base="test", temp=False) as hby:  # from snapshot
+        assert list(hby.db.prefixes) == [hab.pre, other.pre]
+        assert dict.__len__(hby.db.kevers) == 0  # no kevers built yet
+        assert dict.__len__(hby.habs) == 0  # no habs built yet
+        assert len(hby.habs) == 2
+        assert hab.pre in hby.habs
+        assert set(hby.habs.keys()) == {hab.pre, other.pre}
+        assert dict.__len__(hby.habs) == 0
+
+        lhab = hby.habByName(name)
+        assert lhab.pre == hab.pre
+        assert lhab.kever.local
+        assert lhab.kever.serder.said == hab.kever.serder.said
+        assert dict.__len__(hby.habs) == 1
+        assert hby.habs.names == {other.pre: "other"}
+        assert dict.__len__(hby.db.kevers) == 1
+
+        assert [h.name for h in hby.habs.values()] == [name, "other"]
+        assert not hby.habs.names
+
+        lhab.rotate()  # kever built lazily still signs and rotates
+        assert lhab.kever.sn == 1
+        assert hby.db.strt.get(keys="habs") is not None  # rotation does not write .habs
+
+        hby.db.habs.rem(keys="other")  # any write to .habs drops snapshot
+        assert hby.db.strt.get(keys="habs") is None
+
+    hby.close(clear=True)
+    hby.cf.close(clear=True)
+
+    """End Test"""
+
+
+def test_habery_migrate(monkeypatch):
+    """Test Habery setup runs pending schema migrations of its databases
+    """
+    with habbing.openHby(name="mig") as hby:
+        hab = hby.makeHab(name="mig")
+        ver = basing.Baser.Migrations.version
+        assert hby.db.schemaVer == ver
+        assert hby.ks.schemaVer == keeping.Keeper.Migrations.version == 0
+
+        runs = []
+        migrations = dbing.Migrator()
+        migrations.migrations = dict(basing.Baser.Migrations.migrations)
+
+        @migrations.register(ver=ver, tables=("evts.",))
+        def indexEvents(dber, batch):
+            runs.append((dber, batch))
+
+        monkeypatch.setattr(basing.Baser, "Migrations", migrations)
+        assert hby.db.migrate(dry=True)[0]["entries"] == hby.db.cnt(hby.db.evts)
+        assert hby.db.schemaVer == ver
+
+        rehby = habbing.Habery(name="mig", temp=True, ks=hby.ks, db=hby.db)
+        assert rehby.inited
+        assert runs == [(hby.db, 1000)]
+        assert hby.db.schemaVer == ver + 1
+        assert hab.pre in hby.db.kevers  # reloaded after migration
+
+        rehby = habbing.Habery(name="mig", temp=True, ks=hby.ks, db=hby.db)
+        assert len(runs) == 1  # nothing pending
+
+    """End Test"""
+
+
 def test_habery_signatory():
     with habbing.openHby() as hby:
         signer = hby.signator
@@ -811,6 +891,31 @@ def test_make_other_event():
 
 
 
+def test_hab_receipt_flush():
+    """
+    Test each receipt cue flushes group commit batch before receipt is made
+    """
+    with habbing.openHby() as hby:
+        hab = hby.makeHab(name="test")
+        other = hby.makeHab(name="other")
+        hby.db.batchSize = 100  # group commit mode
+        hby.db.batchPeriod = 60.0
+
+        cues = decking.Deck([dict(kin="receipt", serder=other.kever.serder),
+                             dict(kin="receipt", serder=other.kever.serder)])
+        hby.db.setVal(hby.db.evts, b"A", b"a")  # pending in batch
+        assert hby.db._batch is not None
+
+        msgs = hab.processCuesIter(cues)
+        assert next(msgs)
+        assert hby.db._batch is None  # flushed before first receipt
+
+        hby.db.setVal(hby.db.evts, b"B", b"b")  # written between cues
+        assert hby.db._batch is not None
+        assert next(msgs)
+        assert hby.db._batch is None  # flushed again before second receipt
+        assert not cues
+
 
 if __name__ == "__main__":
     pass
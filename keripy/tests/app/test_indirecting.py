@@ -6,6 +6,7 @@ tests.app.indirecting module
 import json
 
 import pytest
+from hio.base import tyming
 from hio.help import decking
 
 from keri.app import indirecting, storing, habbing
@@ -148,6 +149,32 @@ def test_qrymailbox_iter():
         with pytest.raises(StopIteration):
             next(mbi)
 
+def test_mailbox_director_poll_lazy():
+    """
+    Test MailboxDirector.pollDo builds each accepted Hab in turn with a yield
+    in between instead of building every Hab up front
+    """
+    name = "poll-lazy"
+    with habbing.openHby(name=name, base="test", temp=False, clear=True) as hby:
+        hby.makeHab(name="one")
+        hby.makeHab(name="two")
+
+    with habbing.openHby(name=name, base="test", temp=False) as hby:
+        assert dict.__len__(hby.habs) == 0  # no habs built yet
+        mbd = indirecting.MailboxDirector(hby=hby, topics=["/receipt"])
+        poll = mbd.pollDo(tymth=tyming.Tymist().tymen())
+        next(poll)  # enter
+        assert dict.__len__(hby.habs) == 0
+        next(poll)
+        assert dict.__len__(hby.habs) == 1
+        next(poll)
+        assert dict.__len__(hby.habs) == 2
+
+    hby.close(clear=True)
+    hby.cf.close(clear=True)
+
+    """End Test"""
+
 
 if __name__ == "__main__":
     test_mailbox_iter()
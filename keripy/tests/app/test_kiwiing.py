@@ -1397,6 +1397,78 @@ def test_escrow_end(mockHelpingNowUTC):
         assert len(response.json['likely-duplicitous-events']) == 0
 
 
+def test_escrow_pages():
+    with habbing.openHby(name="bob", temp=True) as hby:
+        app = falcon.App()
+        escrowEnd = kiwiing.EscrowEnd(db=hby.db)
+        app.add_route("/escrows", escrowEnd)
+        app.add_route("/escrows/pages", escrowEnd, suffix="pages")
+        client = testing.TestClient(app)
+
+        response = client.simulate_get("/escrows/pages")
+        assert response.status == falcon.HTTP_400
+        response = client.simulate_get("/escrows/pages?escrow=unknown-escrow")
+        assert response.status == falcon.HTTP_404
+        response = client.simulate_get("/escrows/pages?escrow=out-of-order-events")
+        assert response.status == falcon.HTTP_200
+        assert response.json == dict(escrow="out-of-order-events", count=0, next=None, events=[])
+
+        kvy = eventing.Kevery(db=hby.db)
+        habs = [hby.makeHab(name=name) for name in ("amy", "bev", "cal")]
+        for hab in habs:
+            sigs = [coring.Siger(qb64b=bytes(sig))
+                    for sig in hby.db.getSigsIter(dbing.dgKey(hab.pre, hab.kever.serder.said))]
+            kvy.escrowOOEvent(serder=hab.kever.serder, sigers=sigs)
+        pres = sorted(hab.pre for hab in habs)  # escrow keys are in prefix order
+
+        response = client.simulate_get("/escrows/pages?escrow=out-of-order-events&limit=2")
+        assert response.status == falcon.HTTP_200
+        page = response.json
+        assert page["count"] == 3
+        assert [evt["ked"]["i"] for evt in page["events"]] == pres[:2]
+        assert page["next"] is not None
+
+        response = client.simulate_get("/escrows/pages", params=dict(escrow="out-of-order-events",
+                                                                     limit=2, cursor=page["next"]))
+        assert response.status == falcon.HTTP_200
+        page = response.json
+        assert [evt["ked"]["i"] for evt in page["events"]] == pres[2:]
+        assert page["next"] is None
+
+        response = client.simulate_get("/escrows/pages", params=dict(escrow="out-of-order-events",
+                                                                     pre=pres[1]))
+        assert response.json["count"] == 1
+        assert [evt["ked"]["i"] for evt in response.json["events"]] == [pres[1]]
+
+        response = client.simulate_get("/escrows/pages?escrow=out-of-order-events&cursor=bad")
+        assert response.status == falcon.HTTP_400
+
+        response = client.simulate_get("/escrows?limit=1")
+        assert response.status == falcon.HTTP_200
+        assert [evt["ked"]["i"] for evt in response.json["out-of-order-events"]] == pres[:1]
+        assert response.json["partially-signed-events"] == []
+
+
+def test_database_end():
+    with habbing.openHby(name="bob", temp=True) as hby:
+        app = falcon.App()
+        databaseEnd = kiwiing.DatabaseEnd(db=hby.db)
+        app.add_route("/database", databaseEnd)
+        client = testing.TestClient(app)
+
+        bob = hby.makeHab(name="bob")
+        response = client.simulate_get("/database")
+        assert response.status == falcon.HTTP_200
+        stats = response.json
+        assert stats["mapSize"] == hby.db.mapSize
+        assert 0.0 < stats["fill"] < 1.0
+        assert stats["dbs"]["evts."]["entries"] == hby.db.cnt(hby.db.evts)
+        assert stats["dbs"]["kels."]["entries"] == hby.db.cnt(hby.db.kels)
+        assert stats["dbs"]["evts."]["bytes"] == (stats["dbs"]["evts."]["pages"] *
+                                                   stats["pageSize"])
+        assert stats["escrows"]["ooes"]["size"] == 0
+
+
 def test_presentation_ends(seeder, mockCoringRandomNonce, mockHelpingNowIso8601):
     with habbing.openHby(name="pal", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as palHby, \
             habbing.openHby(name="ken", salt=coring.Salter(raw=b'0123456789ghijkl').qb64) as kenHby:
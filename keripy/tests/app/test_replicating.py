@@ -0,0 +1,65 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.replicating module
+
+"""
+import json
+
+import falcon
+import lmdb
+import pytest
+from falcon import testing
+
+from keri.app import habbing, replicating
+from keri.vdr import viring
+
+
+def test_replica(tmp_path):
+    """ Test readonly replica endpoints over databases of writer """
+    head = str(tmp_path)
+    with habbing.openHby(name="rep", temp=False, headDirPath=head) as hby:
+        hab = hby.makeHab(name="rep")
+        reger = viring.Reger(name="rep", temp=False, headDirPath=head)
+
+        replica = replicating.Replica(name="rep", headDirPath=head)
+        assert replica.db.readonly and replica.reger.readonly
+        assert replica.db.path == hby.db.path
+        with pytest.raises(lmdb.ReadonlyError):
+            replica.db.states.pin(keys=hab.pre, val=hab.kever.state())
+
+        app = falcon.App()
+        replicating.loadEnds(app, replica=replica)
+        client = testing.TestClient(app)
+
+        result = client.simulate_get(path=f"/keystate/{hab.pre}")
+        assert result.status == falcon.HTTP_200
+        assert result.json["state"]["s"] == "0"
+        assert len(result.json["kel"]) == 1
+        assert result.json["pending"] == []
+
+        hab.interact()  # writer commits and replica reads latest without reopen
+        result = client.simulate_get(path=f"/keystate/{hab.pre}")
+        assert result.json["state"]["s"] == "1"
+        assert [evt["ked"]["s"] for evt in result.json["kel"]] == ["0", "1"]
+
+        result = client.simulate_get(path="/keystate/EKH07Vsmt_2fK1v214zCmiHpT4-Qc7wR8WtjXvB-u0Gf")
+        assert result.status == falcon.HTTP_404
+
+        result = client.simulate_get(path=f"/mailbox/{hab.pre}/credential")
+        assert result.status == falcon.HTTP_404  # mailbox reads stay with writer
+
+        result = client.simulate_get(path=f"/tels/{hab.pre}")
+        assert result.status == falcon.HTTP_404
+
+        result = client.simulate_get(path="/escrows")
+        assert result.status == falcon.HTTP_200
+
+        result = client.simulate_get(path="/database")
+        assert json.loads(result.content)["path"] == hby.db.path
+
+        replica.close()
+        reger.close(clear=True)
+        hby.db.close(clear=True)
+        hby.ks.close(clear=True)
+
+    """End Test"""
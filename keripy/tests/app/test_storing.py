@@ -108,6 +108,12 @@ def test_mailboxing():
         assert(len(msgs)) == 6
         assert msgs[0][0] == 4
 
+        with mber.snapshot():
+            raws = [(tn, msg) for tn, topic, msg in mber.cloneTopicIter(topic=dest.qb64b, fn=4, copy=False)]
+            assert [tn for tn, msg in raws] == [tn for tn, msg in msgs]
+            assert all(isinstance(msg, memoryview) for tn, msg in raws)
+            assert [bytes(msg) for tn, msg in raws] == [msg for tn, msg in msgs]
+
 
 
 if __name__ == '__main__':
@@ -2227,6 +2227,10 @@ def test_counter():
         '-0': 3
     }
 
+    # partial two character code selector needs more characters
+    with pytest.raises(ShortageError):
+        Counter(qb64b=b'-')
+
     # Codes table with sizes of code (hard) and full primitive material
     assert Counter.Sizes == {
         '-A': Sizage(hs=2, ss=2, fs=4, ls=0),
@@ -1399,6 +1399,79 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_stalled_escrow_not_retried():
+    """
+    Test partial signature and partial witness escrows are only retried when
+    new signatures or witness signatures arrive for their events
+    """
+    psr = parsing.Parser()
+    signers = coring.Salter(raw=b'0123456789abcdef').signers(count=4, temp=True)
+    witer = coring.Signer(transferable=False)  # witness
+
+    def message(serder, sigers, wigers=None):
+        """ returns event message of serder with sigers and wigers attached """
+        msg = bytearray(serder.raw)
+        msg.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
+                                  count=len(sigers)).qb64b)
+        for siger in sigers:
+            msg.extend(siger.qb64b)
+        if wigers:
+            msg.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
+                                      count=len(wigers)).qb64b)
+            for wiger in wigers:
+                msg.extend(wiger.qb64b)
+        return msg
+
+    with basing.openDB(name="stall") as db:
+        kvy = eventing.Kevery(db=db)
+
+        # partially signed 2 of 3
+        srdr = eventing.incept(keys=[signer.verfer.qb64 for signer in signers[:3]],
+                               isith="2", code=coring.MtrDex.Blake3_256)
+        key = dbing.snKey(srdr.pre, 0)
+        sigers = [signer.sign(srdr.raw, index=i) for i, signer in enumerate(signers[:3])]
+        psr.parse(ims=message(srdr, [sigers[0]]), kvy=kvy)
+        assert db.getPses(key) == [srdr.saidb]
+
+        # fully signed but not witnessed
+        wsrdr = eventing.incept(keys=[signers[3].verfer.qb64], wits=[witer.verfer.qb64],
+                                toad=1, code=coring.MtrDex.Blake3_256)
+        wkey = dbing.snKey(wsrdr.pre, 0)
+        wsigers = [signers[3].sign(wsrdr.raw, index=0)]
+        psr.parse(ims=message(wsrdr, wsigers), kvy=kvy)
+        assert db.getPwes(wkey) == [wsrdr.saidb]
+
+        kvy.processEscrows()  # new entries tried once
+        tries = (db.tallies[db.pses]["tries"], db.tallies[db.pwes]["tries"])
+        assert tries == (1, 1)
+        for _ in range(3):  # stalled entries are not retried
+            kvy.processEscrows()
+        assert (db.tallies[db.pses]["tries"], db.tallies[db.pwes]["tries"]) == tries
+        assert key not in db.wakes[db.pses] and wkey not in db.wakes[db.pwes]
+
+        # same signature again does not wake
+        psr.parse(ims=message(srdr, [sigers[0]]), kvy=kvy)
+        assert key not in db.wakes[db.pses]
+
+        # new signature wakes escrowed event that completes on next pass
+        psr.parse(ims=message(srdr, [sigers[1]]), kvy=kvy)
+        assert srdr.pre not in kvy.kevers
+        assert key in db.wakes[db.pses]
+        kvy.processEscrows()
+        assert srdr.pre in kvy.kevers
+        assert db.getPses(key) == []
+
+        # witnessed event accepted on arrival wakes its stale escrow entry
+        wiger = witer.sign(wsrdr.raw, index=0)
+        psr.parse(ims=message(wsrdr, wsigers, [wiger]), kvy=kvy)
+        assert wsrdr.pre in kvy.kevers
+        assert wkey in db.wakes[db.pwes]
+        kvy.processEscrows()
+        assert db.getPwes(wkey) == []
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_unverified_receipt_escrow()
 
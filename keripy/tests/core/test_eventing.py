@@ -8,6 +8,7 @@ import os
 import blake3
 import pysodium
 import pytest
+from hio.help import decking
 
 from keri import help
 from keri.app import habbing, keeping
@@ -30,7 +31,7 @@ from keri.core.eventing import (incept, rotate, interact, receipt, query,
 from keri.db import dbing, basing
 from keri.db.basing import openDB
 from keri.db.dbing import dgKey, snKey
-from keri.kering import (ValidationError, DerivationError)
+from keri.kering import (ValidationError, DerivationError, LikelyDuplicitousError)
 
 logger = help.ogler.getLogger()
 
@@ -2596,6 +2597,13 @@ def test_recovery():
         kes.extend(counter.qb64b)
         kes.extend(siger.qb64b)
 
+        # recovery drops index entries of superseded events after it so
+        # they resolve to the recovery rotation not the superseded est event
+        rpre = kever.prefixer.qb64
+        assert kever.db.getEst(rpre, 5)[1].qb64 == event_digs[7]
+        assert kever.db.getEst(rpre, 6) is None
+        assert Kevery(db=kever.db).fetchEstEvent(rpre, 6).said == event_digs[7]
+
         # Next Event Interaction
         sn += 1  # do not increment esn
         assert sn == 6
@@ -2645,12 +2653,160 @@ def test_recovery():
         y_db_est_digs = [bytes(val).decode("utf-8") for val in kevery.db.getKelEstIter(pre)]
         assert db_est_digs == y_db_est_digs
 
+        # establishment event index is latest est event wrt each sn
+        # (sn, sn of est event, index of est event in event_digs)
+        ests = [(0, 0, 0), (1, 1, 1), (2, 1, 1), (3, 3, 3), (4, 3, 3), (5, 5, 7), (6, 5, 7)]
+        for sn, esn, idx in ests:
+            seqner, saider = vallgr.getEst(pre, sn)
+            assert (seqner.sn, saider.qb64) == (esn, event_digs[idx])
+            assert kevery.fetchEstEvent(pre, sn).said == event_digs[idx]
+        assert vallgr.getEst(pre, 7) is None
+        assert kevery.fetchEstEvent(pre, 7) is None
+
+        # verifiers of est events are cached
+        tholder, verfers = vallgr.resolveVerifiers(pre=pre, sn=5, dig=event_digs[7])
+        assert verfers[0].qb64 == signers[3].verfer.qb64
+        assert vallgr.resolveVerifiers(pre=pre, sn=5)[1] is verfers
+        assert (pre, event_digs[7]) in vallgr._verifiers
+        with pytest.raises(ValidationError):
+            vallgr.resolveVerifiers(pre=pre, sn=5, dig=event_digs[5])
+
+        # migration backfills index of KELs accepted before index existed
+        vallgr.delTopVal(vallgr.ests, b'')
+        assert kevery.fetchEstEvent(pre, 6).said == event_digs[7]  # walks KEL
+        vallgr.setVal(vallgr.meta, dbing.SchemaKey, b'1')
+        reports = vallgr.migrate()
+        assert reports[0]["name"] == "indexEstablishments"
+        for sn, esn, idx in ests:
+            assert vallgr.getEst(pre, sn)[1].qb64 == event_digs[idx]
+
     assert not os.path.exists(kevery.db.path)
     assert not os.path.exists(kever.db.path)
 
     """ Done Test """
 
 
+def test_process_event_batch():
+    """
+    Test Kevery batch processing of events in order of sn per prefix
+    """
+    with habbing.openHby(name="bat", temp=True) as hby, openDB(name="batval") as vdb:
+        ahab = hby.makeHab(name="alpha")
+        bhab = hby.makeHab(name="beta")
+        for i in range(3):
+            ahab.interact()
+            bhab.interact()
+        ahab.rotate()
+        ahab.interact()
+
+        def evts(hab):
+            """ returns event dicts of KEL of hab in order of sn """
+            items = []
+            for dig in hab.db.getKelIter(hab.pre):
+                dgkey = dgKey(hab.pre, bytes(dig))
+                serder = Serder(raw=bytes(hab.db.getEvt(dgkey)))
+                sigers = [Siger(qb64b=bytes(sig)) for sig in hab.db.getSigs(dgkey)]
+                items.append(dict(serder=serder, sigers=sigers))
+            return items
+
+        aevts, bevts = evts(ahab), evts(bhab)
+        assert len(aevts) == 6 and len(bevts) == 4
+        bad = dict(aevts[3])  # event with signature of other key
+        bad["sigers"] = bevts[3]["sigers"]
+
+        kvy = Kevery(db=vdb)
+        for evt in [aevts[5], bevts[3], aevts[4], bad, bevts[1], aevts[1], aevts[3],
+                    bevts[0], aevts[2], bevts[2], aevts[0]]:  # out of order
+            kvy.evts.push(evt)
+        assert kvy.processEventBatch() == 10  # all but bad event
+        assert not kvy.evts
+
+        assert kvy.kevers[ahab.pre].sn == 5
+        assert kvy.kevers[ahab.pre].serder.said == ahab.kever.serder.said
+        assert kvy.kevers[bhab.pre].sn == 3
+        assert vdb.cnt(vdb.ooes) == 0  # no out of order escrow churn
+        assert vdb.getEst(ahab.pre, 5)[0].sn == 4
+
+        # event after gap in batch is out of order escrowed and escrow is kept
+        ahab.interact()
+        ahab.interact()
+        aevts = evts(ahab)
+        assert kvy.processEventBatch(evts=decking.Deck([aevts[7]])) == 0
+        assert vdb.cnt(vdb.ooes) == 1
+        assert kvy.processEventBatch(evts=decking.Deck([aevts[6]])) == 1
+        assert kvy.kevers[ahab.pre].sn == 6
+        kvy.processEscrows()
+        assert kvy.kevers[ahab.pre].sn == 7
+
+        # parser in batch mode pushes cloned events with receipts for batch
+        whab = hby.makeHab(name="wit", transferable=False)
+        dgkey = dgKey(bhab.pre, bhab.kever.serder.said)
+        cigar = whab.sign(ser=bhab.kever.serder.raw, indexed=False)[0]
+        hby.db.addRct(dgkey, cigar.verfer.qb64b + cigar.qb64b)
+        msgs = bytearray()
+        for msg in hby.db.clonePreIter(pre=bhab.pre, fn=0):
+            msgs.extend(msg)
+
+        with openDB(name="batpsr") as pdb:
+            pkvy = Kevery(db=pdb)
+            parsing.Parser(kvy=pkvy, batch=True).parse(ims=msgs)
+            assert len(pkvy.evts) == 4
+            assert bhab.pre not in pkvy.kevers  # nothing processed until batch
+            assert pkvy.processEventBatch() == 4
+            assert pkvy.kevers[bhab.pre].sn == 3
+            assert pdb.getRcts(dgkey) == [cigar.verfer.qb64b + cigar.qb64b]
+
+    """ Done Test """
+
+
+def test_duplicity():
+    """
+    Test Kevery duplicity detection and evidence index
+    """
+    with habbing.openHby(name="dup", temp=True) as hby, openDB(name="dupval") as vdb:
+        ahab = hby.makeHab(name="alpha")
+        bhab = hby.makeHab(name="beta")
+        ahab.interact()
+        kvy = Kevery(db=vdb)
+        for dig in ahab.db.getKelIter(ahab.pre):
+            dgkey = dgKey(ahab.pre, bytes(dig))
+            kvy.processEvent(serder=Serder(raw=bytes(ahab.db.getEvt(dgkey))),
+                             sigers=[Siger(qb64b=bytes(sig)) for sig in ahab.db.getSigs(dgkey)])
+        assert kvy.kevers[ahab.pre].sn == 1
+        accepted = ahab.kever.serder.said
+
+        # second version of sn 1 signed by the keys in effect is proven duplicitous
+        dup = interact(pre=ahab.pre, dig=ahab.kever.prefixer.qb64, sn=1, data=[dict(x=1)])
+        kvy.cues.clear()
+        kvy.processEvent(serder=dup, sigers=ahab.sign(ser=dup.raw, indexed=True))
+        assert [cue["kin"] for cue in kvy.cues] == ["duplicitous"]
+        duper = vdb.getDuplicity(ahab.pre, 1)
+        assert duper.accepted == accepted
+        assert duper.saids == [dup.said]
+        assert vdb.getSeen(ahab.pre, 1) == [accepted, dup.said]
+        assert vdb.getSigs(dgKey(ahab.pre, dup.said))
+        assert vdb.cntLdes(snKey(ahab.pre, 1)) == 0
+        assert kvy.kevers[ahab.pre].serder.said == accepted  # key state unchanged
+
+        kvy.cues.clear()
+        kvy.processEvent(serder=dup, sigers=ahab.sign(ser=dup.raw, indexed=True))
+        assert not kvy.cues  # already evidence
+
+        # version not signed by the keys in effect stays likely duplicitous
+        bad = interact(pre=ahab.pre, dig=ahab.kever.prefixer.qb64, sn=1, data=[dict(x=2)])
+        with pytest.raises(LikelyDuplicitousError):
+            kvy.processEvent(serder=bad, sigers=bhab.sign(ser=bad.raw, indexed=True))
+        assert vdb.cntLdes(snKey(ahab.pre, 1)) == 1
+        assert vdb.getSeen(ahab.pre, 1) == [accepted, dup.said]
+
+        assert [(pre, sn, duper.saids) for pre, sn, duper in vdb.getDuplicityItemIter(ahab.pre)] == \
+               [(ahab.pre, 1, [dup.said])]
+        assert list(vdb.getDuplicityItemIter(bhab.pre)) == []
+        assert len(list(vdb.getDuplicityItemIter())) == 1
+
+    """ Done Test """
+
+
 def test_receipt():
     """
     Test event receipt message and attached couplets
@@ -4218,6 +4374,16 @@ def test_reload_kever(mockHelpingNowUTC):
 
         # now create new Kever with state
         kever = eventing.Kever(state=state, db=natHby.db)
+        assert not hasattr(kever, "__dict__")  # slotted
+        assert kever._verfers is None and kever._serder is None  # built lazily
+        assert [verfer.qb64 for verfer in kever.verfers] == state.ked["k"]
+        assert kever.verfers is kever.verfers  # built once
+        assert kever.tholder.sith == "2"
+        assert kever.ntholder.sith == "2"
+        assert kever.nexter.digs == state.ked["n"]
+        assert kever.toader.num == 0
+        assert kever.dater.dts == state.ked["dt"]
+        assert kever.prefixer.qb64 == natHab.pre
         assert kever.sn == 6
         assert kever.fn == 6
         assert kever.serder.ked == natHab.kever.serder.ked
@@ -6,9 +6,11 @@ Test key state notification reply messages
 routes: /ksn
 
 """
+import os
+
 from keri.app import keeping, habbing
 from keri.core import coring, eventing, parsing, routing
-from keri.db import basing
+from keri.db import basing, dbing
 
 
 def test_keystate(mockHelpingNowUTC):
@@ -297,5 +299,160 @@ def test_keystate(mockHelpingNowUTC):
 
     """End Test"""
 
+
+def test_keystate_checkpoint(monkeypatch):
+    """
+    Bob is the controller with a long KEL
+    Wes is Bam's watcher that fully verified Bob's KEL up to a checkpoint
+    Bam bootstraps Bob's key state from the checkpoint of Wes plus the tail
+    """
+    with (habbing.openHby(name="bob", base="test") as bobHby,
+          habbing.openHby(name="wes", base="test") as wesHby,
+          habbing.openHby(name="bam", base="test") as bamHby):
+
+        wesHab = wesHby.makeHab(name="wes", isith='1', icount=1, transferable=False)
+        bobHab = bobHby.makeHab(name="bob", isith='1', icount=1, transferable=True)
+        for _ in range(2):
+            bobHab.rotate()
+            bobHab.interact()
+        assert bobHab.kever.sner.num == 4
+
+        # Wes fully verifies Bob's KEL up to sn 4 and signs its key state
+        wesKvy = eventing.Kevery(db=wesHby.db, lax=False, local=False)
+        msgs = bytearray()
+        for msg in bobHby.db.clonePreIter(pre=bobHab.pre, fn=0):
+            msgs.extend(msg)
+        parsing.Parser().parse(ims=msgs, kvy=wesKvy)
+        ksn = wesHab.kevers[bobHab.pre].state()
+        assert ksn.sn == 4
+        ckpt = wesHab.reply(route="/ksn/" + wesHab.pre, data=ksn.ked)
+        forged = dict(ksn.ked)
+        forged["n"] = [coring.Diger(ser=b"forged").qb64]
+        badCkpt = wesHab.reply(route="/ksn/" + wesHab.pre, data=forged)
+
+        bobHab.interact()  # tail beyond checkpoint
+
+        bamHab = bamHby.makeHab(name="bam", isith='1', icount=1, transferable=True)
+        habr = bamHby.db.habs.get("bam")
+        habr.watchers = [wesHab.pre]
+        bamHby.db.habs.pin("bam", habr)
+
+        bamRtr = routing.Router()
+        bamRvy = routing.Revery(db=bamHby.db, rtr=bamRtr)
+        bamKvy = eventing.Kevery(db=bamHby.db, lax=False, local=False, rvy=bamRvy,
+                                 checkpoint=True)
+        bamKvy.registerReplyRoutes(router=bamRtr)
+        parsing.Parser().parse(ims=bytearray(ckpt), kvy=bamKvy, rvy=bamRvy)
+        ckp = bamHby.db.ckps.get(keys=bobHab.pre)
+        assert ckp.status == "pending"
+        assert ckp.sn == 4
+        assert ckp.aid == wesHab.pre
+
+        # tail from checkpoint bootstraps key state without inception
+        tail = bytearray()
+        for msg in bobHby.db.clonePreIter(pre=bobHab.pre, fn=4):
+            tail.extend(msg)
+        parsing.Parser().parse(ims=bytearray(tail), kvy=bamKvy, rvy=bamRvy)
+        assert bamKvy.kevers[bobHab.pre].sner.num == 5
+        assert bamKvy.kevers[bobHab.pre].verfers[0].qb64 == bobHab.kever.verfers[0].qb64
+        assert bamHby.db.ckps.get(keys=bobHab.pre).status == "trusted"
+        assert bamHby.db.getKeLast(key=dbing.snKey(bobHab.pre, 0)) is None
+        assert bamHby.db.states.get(keys=bobHab.pre).sn == 5
+
+        # background full verification adopts the events before the checkpoint
+        msgs = bytearray()
+        for msg in bobHby.db.clonePreIter(pre=bobHab.pre, fn=0):
+            msgs.extend(msg)
+        parsing.Parser().parse(ims=bytearray(msgs), kvy=bamKvy, rvy=bamRvy)
+        bamKvy.processEscrows()
+        assert bamHby.db.ckps.get(keys=bobHab.pre).status == "verified"
+        assert not bamKvy.ckvys
+        assert bamHby.db.getKeLast(key=dbing.snKey(bobHab.pre, 0)) is not None
+        assert len(list(bamHby.db.getFelItemPreIter(bobHab.pre.encode("utf-8")))) == 6
+        seqner, saider = bamHby.db.getEst(bobHab.pre, 2)
+        assert seqner.sn == 1
+        assert bamKvy.kevers[bobHab.pre].sner.num == 5
+
+        # restart while verifying resumes on the verification database on disk
+        clones = list(bobHby.db.clonePreIter(pre=bobHab.pre, fn=0))
+        with habbing.openHby(name="bar", base="test", temp=False, clear=True) as barHby:
+            barHby.makeHab(name="bar", isith='1', icount=1, transferable=True)
+            habr = barHby.db.habs.get("bar")
+            habr.watchers = [wesHab.pre]
+            barHby.db.habs.pin("bar", habr)
+
+            barRtr = routing.Router()
+            barRvy = routing.Revery(db=barHby.db, rtr=barRtr)
+            barKvy = eventing.Kevery(db=barHby.db, lax=False, local=False, rvy=barRvy,
+                                     checkpoint=True)
+            barKvy.registerReplyRoutes(router=barRtr)
+            parsing.Parser().parse(ims=bytearray(ckpt), kvy=barKvy, rvy=barRvy)
+            parsing.Parser().parse(ims=bytearray(tail), kvy=barKvy, rvy=barRvy)
+            parsing.Parser().parse(ims=bytearray(b''.join(clones[:3])), kvy=barKvy, rvy=barRvy)
+            assert barHby.db.ckps.get(keys=bobHab.pre).status == "trusted"
+            ckdb = barKvy.ckvys[bobHab.pre].db
+            assert not ckdb.path.startswith(barHby.db.path + os.sep)  # beside not within
+            ckdb.close()  # process exits before verification is done
+
+            barKvy = eventing.Kevery(db=barHby.db, lax=False, local=False, rvy=barRvy,
+                                     checkpoint=True)
+            assert barKvy.ckvys[bobHab.pre].kevers[bobHab.pre].sner.num == 2
+            assert list(barKvy.cues) == [dict(kin="query", q=dict(pre=bobHab.pre))]
+            parsing.Parser().parse(ims=bytearray(b''.join(clones[3:])), kvy=barKvy, rvy=barRvy)
+            assert barHby.db.ckps.get(keys=bobHab.pre).status == "verified"
+            assert not barKvy.ckvys
+            assert not os.path.exists(ckdb.path)
+            assert len(list(barHby.db.getFelItemPreIter(bobHab.pre.encode("utf-8")))) == 6
+
+        barHby.close(clear=True)
+        barHby.cf.close(clear=True)
+
+    for kver in (dbing.KeyVerHex, dbing.KeyVerBin):  # legacy and compact .fels keys
+        monkeypatch.setattr(basing.Baser, "KeyVer", kver)
+        with (habbing.openHby(name="bal%s" % kver, base="test") as balHby):
+            assert (balHby.db.fels in balHby.db._bins) == (kver == dbing.KeyVerBin)
+            # forged checkpoint bootstraps but full verification downgrades it
+            balHab = balHby.makeHab(name="bal", isith='1', icount=1, transferable=True)
+            habr = balHby.db.habs.get("bal")
+            habr.watchers = [wesHab.pre]
+            balHby.db.habs.pin("bal", habr)
+
+            balRtr = routing.Router()
+            balRvy = routing.Revery(db=balHby.db, rtr=balRtr)
+            balKvy = eventing.Kevery(db=balHby.db, lax=False, local=False, rvy=balRvy,
+                                     checkpoint=True)
+            balKvy.registerReplyRoutes(router=balRtr)
+            parsing.Parser().parse(ims=bytearray(badCkpt), kvy=balKvy, rvy=balRvy)
+            parsing.Parser().parse(ims=bytearray(tail), kvy=balKvy, rvy=balRvy)
+            assert balHby.db.ckps.get(keys=bobHab.pre).status == "trusted"
+            assert bobHab.pre in balKvy.kevers
+            assert balHby.db.replay(bobHab.pre)  # cached until KEL dropped
+
+            balKvy.cues.clear()
+            parsing.Parser().parse(ims=bytearray(msgs), kvy=balKvy, rvy=balRvy)
+            assert balHby.db.ckps.get(keys=bobHab.pre).status == "failed"
+            assert bobHab.pre not in balKvy.kevers
+            assert balHby.db.states.get(keys=bobHab.pre) is None
+            assert [cue["kin"] for cue in balKvy.cues if cue["kin"] == "checkpointFailed"] == ["checkpointFailed"]
+            assert not balKvy.ckvys
+
+            # KEL bootstrapped from forged checkpoint is dropped
+            preb = bobHab.pre.encode("utf-8")
+            assert list(balHby.db.getFelItemPreIter(preb)) == []
+            assert list(balHby.db.getKelIter(bobHab.pre)) == []
+            assert list(balHby.db.clonePreIter(pre=bobHab.pre)) == []
+            assert balHby.db.replay(bobHab.pre) == ()
+            assert balHby.db.getEst(bobHab.pre, 4) is None
+            ckp = balHby.db.ckps.get(keys=bobHab.pre)
+            assert balHby.db.getEvt(dbing.dgKey(bobHab.pre, ckp.said)) is None
+            assert balHby.db.getSigs(dbing.dgKey(bobHab.pre, ckp.said)) == []
+
+            # so the real KEL is then accepted from inception
+            parsing.Parser().parse(ims=bytearray(msgs), kvy=balKvy, rvy=balRvy)
+            assert balKvy.kevers[bobHab.pre].sner.num == 5
+            assert len(list(balHby.db.getFelItemPreIter(preb))) == 6
+
+    """End Test"""
+
 if __name__ == "__main__":
     pass
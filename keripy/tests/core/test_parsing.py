@@ -3,6 +3,7 @@
 tests.core.test_eventing module
 
 """
+import mmap
 import os
 
 import pytest
@@ -246,6 +247,50 @@ def test_parser():
     """ Done Test """
 
 
+def test_parser_chunks(tmp_path):
+    """
+    Test Parser.chunkParsator fed from memory mapped CESR stream file
+    """
+    with habbing.openHby(name="exporter") as hby:
+        hab = hby.makeHab(name="exporter")
+        for _ in range(3):
+            hab.interact()
+        path = tmp_path / "kels.cesr"
+        with open(path, "wb") as f:
+            for msg in hby.db.cloneAllPreIter():
+                f.write(msg)
+
+        for size in (1, 7, 100, 4096):  # chunk boundaries split primitives and counters
+            with openDB(name="importer") as valDB:
+                kevery = Kevery(db=valDB, lax=True, local=False)
+                parser = parsing.Parser(kvy=kevery)
+                with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    chunks = [view[i:i + size] for i in range(0, len(mm), size)]
+                    rests = list(parser.chunkParsator(chunks=chunks))
+                    assert len(rests) == len(chunks)
+                    assert rests[-1] == 0  # cloned messages are pipelined so all parsed
+                    del chunks
+                    view.release()
+
+                assert hab.pre in kevery.kevers
+                assert kevery.kevers[hab.pre].sn == 3
+                assert kevery.kevers[hab.pre].serder.said == hab.kever.serder.said
+                assert ([bytes(dig) for dig in valDB.getKelIter(hab.pre)] ==
+                        [bytes(dig) for dig in hby.db.getKelIter(hab.pre)])
+
+        assert list(parsing.Parser().chunkParsator(chunks=[])) == []
+
+    with habbing.openHby(name="exporter", temp=True) as hby, openDB(name="importer") as valDB:
+        hab = hby.makeHab(name="exporter")
+        msg = next(hby.db.clonePreIter(pre=hab.pre))
+        size = hab.kever.serder.size  # chunk ends exactly at end of message body
+        kevery = Kevery(db=valDB, lax=True, local=False)
+        parser = parsing.Parser(kvy=kevery)
+        assert list(parser.chunkParsator(chunks=[msg[:size], msg[size:]])) == [0, 0]
+        assert kevery.kevers[hab.pre].serder.said == hab.pre
+
+    """ Done Test """
 
 
 if __name__ == "__main__":
@@ -625,6 +625,8 @@ def test_reply(mockHelpingNowUTC):
         escrowkeys = ("/end/role",)  # escrow route base not full route
         [saider] = nelHab.db.rpes.get(keys=escrowkeys)
         assert saider.qb64 == serder.said
+        # escrow indexed for expiry by route and said
+        assert nelHab.db.getVal(nelHab.db.exks, b'rpes./end/role.%s' % saider.qb64b) is not None
 
         serder0 = serderR
 
@@ -723,6 +725,7 @@ def test_reply(mockHelpingNowUTC):
         assert len(sigers) == 3 == len(tamHab.kever.verfers)
         escrowkeys = ("/end/role",)  # escrow route base not full route
         assert not nelHab.db.rpes.get(keys=escrowkeys)
+        assert nelHab.db.getVal(nelHab.db.exks, b'rpes./end/role.%s' % serder.saidb) is None
 
         endkeys = (tamHab.pre, role, wesHab.pre)
         saider = nelHab.db.eans.get(keys=endkeys)
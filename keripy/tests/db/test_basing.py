@@ -10,7 +10,7 @@ import lmdb
 import pytest
 from hio.base import doing
 from keri.app import habbing
-from keri.core import coring, eventing
+from keri.core import coring, eventing, parsing
 from keri.core.coring import MtrDex
 from keri.core.coring import Serials, versify
 from keri.core.coring import Signer, Salter
@@ -1675,6 +1675,154 @@ def test_baser():
     """ End Test """
 
 
+def test_escrow_expiry_index():
+    """
+    Test escrow expiry index of indexed escrow sub dbs
+    """
+    import datetime
+    from keri.help import helping
+
+    pre = b'BAKY1sKmgyjAiUDdUBPNPyrSz_ad_Qf9yzhDNZlEKiMc'
+    dig0 = b'EAhdYfbI5qfFKmGeEvc6rYlz7w0aOgAGkQGsG6JHUI1e'
+    dig1 = b'EBh6vbWk-ZOhLrhHSO-oi5D9xnyXEB5hZxSaRZcOQsqr'
+    key = snKey(pre, 1)
+
+    with openDB() as db:
+        assert db.schemaVer == Baser.Migrations.version == 4
+        assert db.putOoes(key, [dig0, dig1]) == True
+        assert db.addOoe(key, dig1) == False  # dup not indexed again
+        assert db.cnt(db.exps) == 2
+        assert db.cnt(db.exks) == 2
+        assert db.getVal(db.exks, b'ooes.%s.%s' % (key, dig0)) is not None
+
+        assert db.delOoe(key, dig0) == True
+        assert db.getOoes(key) == [dig1]
+        assert db.cnt(db.exps) == 1
+        assert db.delOoes(key) == True
+        assert db.cnt(db.exps) == db.cnt(db.exks) == 0
+
+        # expire only stale entries by escrow time in order
+        dt = helping.fromIso8601("2021-01-01T00:00:00.000000+00:00")
+        db.addPse(key, dig0)
+        db.addIoVal(db.ooes, key, dig0)  # escrow without index then index back dated
+        db.addIoVal(db.ooes, key, dig1)
+        assert db.putExp(db.ooes, key, dig0, dt=dt) == True
+        assert db.putExp(db.ooes, key, dig1, dt=dt + datetime.timedelta(seconds=10)) == True
+        assert db.putExp(db.ooes, key, dig1) == False  # already indexed
+        assert db.getVal(db.exps, b'ooes.%s.%s' % (basing.expStamp(dt), key)) == dig0
+        assert db.getIoVals(db.ooes, key) == [dig0, dig1]
+
+        now = dt + datetime.timedelta(seconds=15)
+        assert db.expireIoEscrows(db.ooes, timeout=20, now=now) == []
+        assert db.expireIoEscrows(db.ooes, timeout=10, now=now) == [(key, dig0)]
+        assert db.getOoes(key) == [dig1]
+        assert db.expireIoEscrows(db.ooes, timeout=5, now=now) == []  # not older
+        assert db.expireIoEscrows(db.ooes, timeout=4, now=now) == [(key, dig1)]
+        assert db.getOoes(key) == []
+        assert db.getPses(key) == [dig0]  # other escrow untouched
+        assert db.expireIoEscrows(db.ooes, timeout=0) == []
+        assert db.expireIoEscrows(db.pses, timeout=0,
+                                  now=helping.nowUTC() + datetime.timedelta(seconds=1)) == [(key, dig0)]
+        assert db.cnt(db.exps) == db.cnt(db.exks) == 0
+
+        # migration backfills index of escrows of database without index
+        db.addIoVal(db.ures, key, dig0)
+        db.addIoVal(db.ures, key, dig1)
+        db.addIoVal(db.ldes, key, dig0)
+        db.rpes.put(keys=("/end/role",), vals=[coring.Saider(qb64b=dig0)])
+        db.setVal(db.meta, dbing.SchemaKey, b'0')
+        assert db.schemaVer == 0
+        reports = db.migrate(batch=1)
+        assert reports[0]["name"] == "indexEscrows"
+        assert reports[0]["entries"] == 3
+        assert reports[3]["name"] == "indexReplyEscrows"
+        assert db.schemaVer == 4
+        assert db.cnt(db.exps) == db.cnt(db.exks) == 4
+        assert db.getVal(db.exks, b'rpes./end/role.%s' % dig0) is not None
+        assert db.rpxs.expire(timeout=0, now=helping.nowUTC() +
+                              datetime.timedelta(seconds=1)) == [(b'/end/role', dig0)]
+        assert db.cnt(db.exps) == db.cnt(db.exks) == 3
+        assert db.delUre(key, dig0) == True
+        assert db.cnt(db.exps) == 2
+
+    """ End Test """
+
+
+def test_escrow_wakes():
+    """
+    Test ready iteration of indexed escrow sub dbs woken by dependencies
+    and escrow gauges
+    """
+    import datetime
+    from keri.help import helping
+
+    pre = b'BAKY1sKmgyjAiUDdUBPNPyrSz_ad_Qf9yzhDNZlEKiMc'
+    dig0 = b'EAhdYfbI5qfFKmGeEvc6rYlz7w0aOgAGkQGsG6JHUI1e'
+    dig1 = b'EBh6vbWk-ZOhLrhHSO-oi5D9xnyXEB5hZxSaRZcOQsqr'
+    key0 = snKey(pre, 0)
+    key1 = snKey(pre, 1)
+
+    def walk(db, sdb):
+        """ returns items of one escrow pass in the manner of escrow processors """
+        items = []
+        key = ekey = b''
+        while True:
+            for ekey, val in db.getReadyIoItemsNextIter(sdb, key=key):
+                items.append((bytes(ekey), bytes(val)))
+            if ekey == key:
+                break
+            key = ekey
+        return items
+
+    with openDB() as db:
+        assert db.sweeps == set(db.wakes)  # first pass after open walks all
+        assert walk(db, db.ooes) == []
+        assert db.ooes not in db.sweeps
+
+        db.addOoe(key0, dig0)
+        db.addOoe(key1, dig1)
+        db.addOoe(key1, dig0)
+        assert db.wakes[db.ooes] == {key0, key1}  # new entries ready once
+        assert walk(db, db.ooes) == [(key0, dig0), (key1, dig1), (key1, dig0)]
+        assert walk(db, db.ooes) == []  # still escrowed but nothing woke
+
+        db.wakeEscrow(db.ooes, key1)
+        db.wakeEscrow(db.ooes, snKey(pre, 5))  # nothing escrowed at key
+        assert walk(db, db.ooes) == [(key1, dig1), (key1, dig0)]
+        assert db.wakes[db.ooes] == set()
+
+        db.wakeEscrowPre(db.ooes, pre)
+        assert db.wakes[db.ooes] == {key0, key1}
+        db.delOoes(key0)
+        assert walk(db, db.ooes) == [(key1, dig1), (key1, dig0)]
+
+        db.sweepEscrow(db.ooes)
+        assert walk(db, db.ooes) == [(key1, dig1), (key1, dig0)]
+        assert walk(db, db.ooes) == []
+
+        # escrow gauges
+        assert db.tallies[db.ooes] == dict(tries=9, retries=9, exits=1, expires=0)
+        db.wakeEscrow(db.ooes, key1)
+        for ekey, val in db.getReadyIoItemsNextIter(db.ooes):
+            db.delOoe(ekey, val)  # unescrow each item tried
+        assert db.tallies[db.ooes] == dict(tries=11, retries=9, exits=3, expires=0)
+
+        db.addOoe(key0, dig0)
+        now = helping.nowUTC() + datetime.timedelta(seconds=5)
+        stats = db.escrowStats(now=now)
+        assert set(stats) == {'ooes', 'pses', 'pwes', 'uwes', 'ures', 'vres', 'ldes', 'qnfs'}
+        assert stats["pses"] == dict(size=0, oldest=None, tries=0, retries=0,
+                                     unescrowed=0, expired=0, throughput=0.0)
+        ooes = stats["ooes"]
+        assert ooes["size"] == 1
+        assert 5.0 <= ooes["oldest"] < 6.0
+        assert (ooes["tries"], ooes["retries"], ooes["unescrowed"]) == (11, 9, 3)
+        assert ooes["throughput"] == 3 / (now - db.tallied).total_seconds()
+        assert db.stats()["escrows"]["ooes"]["size"] == 1
+
+    """ End Test """
+
+
 def test_clean_baser():
     """
     Test Baser db clean clone method
@@ -1715,7 +1863,7 @@ def test_clean_baser():
         state = natHab.db.states.get(keys=natHab.pre)  # Serder instance
         assert state.sn == 6
         assert state.ked["f"] == '6'
-        assert natHab.db.env.stat()['entries'] == 67
+        assert natHab.db.env.stat()['entries'] == 75
 
         # test reopenDB with reuse  (because temp)
         with basing.reopenDB(db=natHab.db, reuse=True):
@@ -1724,7 +1872,7 @@ def test_clean_baser():
             assert ldig == natHab.kever.serder.saidb
             serder = coring.Serder(raw=bytes(natHab.db.getEvt(dbing.dgKey(natHab.pre,ldig))))
             assert serder.said == natHab.kever.serder.said
-            assert natHab.db.env.stat()['entries'] == 67
+            assert natHab.db.env.stat()['entries'] == 75
 
             # verify name pre kom in db
             data = natHab.db.habs.get(keys=natHab.name)
@@ -1794,6 +1942,80 @@ def test_clean_baser():
     """End Test"""
 
 
+def test_clean_baser_objs(monkeypatch):
+    """
+    Test Baser clone of events as objects, resumable and parallel clean
+    """
+    name = "nat"
+    with habbing.openHby(name=name) as hby:  # default is temp=True
+        natHab = hby.makeHab(name=name, isith='2', icount=3)
+        natHab.interact()
+        natHab.rotate()
+        natHab.interact()
+        bobHab = hby.makeHab(name="bob")
+        bobHab.interact()
+        path = hby.db.path
+
+        # objects match the parsed message of cloneEvtMsg
+        msgs = list(hby.db.cloneAllPreIter())
+        objs = list(hby.db.cloneObjAllPreIter())
+        assert len(objs) == len(msgs) == 4 + 2 + 1  # nat, bob, signator
+        for msg, (serder, sigers, wigers, seal, receipts, first) in zip(msgs, objs):
+            assert msg.startswith(serder.raw)
+            assert sigers and all(isinstance(siger, coring.Siger) for siger in sigers)
+            assert wigers == []
+            assert seal == (None, None)
+            assert receipts == ([], [])
+            firner, dater = first
+            assert hby.db.getFe(dbing.fnKey(serder.preb, firner.sn)) == serder.saidb
+            assert dater.dts
+        objs = list(hby.db.cloneObjPreIter(pre=natHab.pre, fn=2))
+        assert [serder.sn for serder, *_ in objs] == [2, 3]
+
+        # interrupted clean leaves copy that resume reuses
+        def interrupt(self):
+            raise KeyboardInterrupt()
+
+        with monkeypatch.context() as m:
+            m.setattr(eventing.Kevery, "processEscrows", interrupt)
+            with pytest.raises(KeyboardInterrupt):
+                hby.db.clean()
+        marker = path + ".clean"
+        with open(marker) as f:
+            clean = f.read()
+        assert clean.endswith("/keri/clean/db/nat")
+        assert os.path.exists(clean)
+
+        skipped = []
+        cloneObjs = basing._cloneObjs
+        monkeypatch.setattr(basing, "_cloneObjs",
+                            lambda kvy, objs: skipped.append(not cloneObjs(kvy, objs)))
+        hby.db.clean(resume=True)
+        monkeypatch.undo()
+        assert len(skipped) == 7 and all(skipped)  # all already cloned
+        assert not os.path.exists(marker)
+        assert not os.path.exists(clean)
+        assert hby.db.path == path
+        assert natHab.kever.sn == 3
+        assert hby.db.kevers[bobHab.pre].sn == 1
+
+        # parallel clean with worker processes
+        hby.db.clean(workers=2)
+        assert not os.path.exists(marker)
+        assert natHab.pre in hby.db.prefixes
+        assert bobHab.pre in hby.db.prefixes
+        assert hby.db.kevers[natHab.pre].sn == 3
+        assert hby.db.kevers[bobHab.pre].sn == 1
+        with basing.reopenDB(db=hby.db, reuse=True):
+            assert len(list(hby.db.cloneAllPreIter())) == 7
+            state = hby.db.states.get(keys=natHab.pre)
+            assert state.sn == 3
+
+    assert not os.path.exists(hby.db.path)
+
+    """End Test"""
+
+
 def test_fetchkeldel():
     """
     Test fetching full KEL and full DEL from Baser
@@ -1904,6 +2126,109 @@ def test_fetchkeldel():
 
 
 
+def test_anchor_index():
+    """
+    Test anchor index of event seals in accepted events
+    """
+    with habbing.openHab(name="anc", temp=True) as (hby, hab):
+        seal = dict(i=hab.pre, s="a", d=hab.kever.serder.said)
+        other = dict(i=hab.pre, s=coring.Seqner(sn=11).snh, d=hab.kever.serder.said)
+        hab.interact(data=[seal, dict(d=hab.kever.serder.said), dict(i=1, s=0, d=2)])
+        serder = hab.kever.serder
+
+        assert basing.anchorKeys(seal) == (hab.pre, "%032x" % 10, seal["d"])
+        assert basing.anchorKeys(dict(seal, s=10)) == basing.anchorKeys(seal)
+        (prefixer, seqner, saider), = hby.db.ancs.get(keys=basing.anchorKeys(seal))
+        assert (prefixer.qb64, seqner.sn, saider.qb64) == (hab.pre, 1, serder.said)
+        assert hby.db.cnt(hby.db.ancs.sdb) == 1  # digest and malformed seals not indexed
+
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=dict(seal, s=10)).said == serder.said
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=other) is None
+        assert hby.db.findAnchoringEvent("EOther", anchor=seal) is None  # other KEL
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=dict(i=1, s=0, d=2)) is None
+
+        # migration backfills index of KELs accepted before index existed
+        hby.db.ancs.trim()
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=seal) is None
+        hby.db.setVal(hby.db.meta, dbing.SchemaKey, b'2')
+        reports = hby.db.migrate()
+        assert reports[0]["name"] == "indexAnchors"
+        assert hby.db.findAnchoringEvent(hab.pre, anchor=seal).said == serder.said
+
+    """ End Test """
+
+
+def test_query_response_cache():
+    """
+    Test cached query responses dropped on writes to logs of prefix
+    """
+    with habbing.openHab(name="rsp", temp=True) as (hby, hab):
+        db = hby.db
+        msgs = db.replay(hab.pre)
+        assert msgs == tuple(bytes(msg) for msg in db.clonePreIter(pre=hab.pre, fn=0))
+        assert db.replay(hab.pre) is msgs  # cached
+        assert db.replay(hab.pre, fn=1) == ()
+        ksn = db.response(hab.pre, ("ksn",), hab.kever.state)
+        assert db.response(hab.pre, ("ksn",), hab.kever.state) is ksn
+
+        db.dropResponses(dgKey("EOther", hab.pre))  # other prefix
+        assert db.replay(hab.pre) is msgs
+
+        hab.interact()  # first seen event drops responses
+        assert hab.pre not in db._responses
+        msgs = db.replay(hab.pre)
+        assert len(msgs) == 2
+        assert db.response(hab.pre, ("ksn",), hab.kever.state).sn == 1
+
+        # new signature on logged event drops responses
+        dgkey = dgKey(hab.pre, hab.kever.serder.said)
+        db.addSig(dgkey, db.getSigs(dgkey)[0])
+        assert db.replay(hab.pre) is not msgs
+
+        # compact ordinal key ends in binary ordinal
+        assert db.replay(hab.pre)
+        assert not db.delFe(dbing.onKeyBin(hab.pre, 200))
+        assert hab.pre not in db._responses
+
+        db.ResponseLimit = 1  # least recently used prefix is evicted
+        db.replay("EOther")
+        assert list(db._responses) == ["EOther"]
+
+    """ End Test """
+
+
+def test_stream_replay():
+    """
+    Test replays streamed in chunks of whole messages
+    """
+    with habbing.openHab(name="stm", temp=True) as (hby, hab):
+        for _ in range(3):
+            hab.interact()
+        db = hby.db
+        msgs = [bytes(msg) for msg in db.clonePreIter(pre=hab.pre, fn=0)]
+        assert len(msgs) == 4
+
+        chunks = list(db.streamPreIter(pre=hab.pre))
+        assert len(chunks) == 1
+        assert chunks[0] == b''.join(msgs)
+
+        chunks = list(db.streamPreIter(pre=hab.pre, size=1))  # one message per chunk
+        assert [bytes(chunk) for chunk in chunks] == msgs
+
+        chunks = list(db.streamPreIter(pre=hab.pre, fn=2, size=len(msgs[2]) + 1))
+        assert [bytes(chunk) for chunk in chunks] == [msgs[2] + msgs[3]]
+        assert list(db.streamPreIter(pre=hab.pre, fn=4)) == []
+
+        allMsgs = [bytes(msg) for msg in db.cloneAllPreIter()]
+        chunks = list(db.streamAllPreIter(size=1))
+        assert [bytes(chunk) for chunk in chunks] == allMsgs
+
+        assert hab.replay() == b''.join(hab.replayIter(size=1))
+        assert hab.replayAll() == b''.join(hab.replayAllIter(size=1))
+
+    """ End Test """
+
+
 def test_usebaser():
     """
     Test using Baser
@@ -2057,6 +2382,53 @@ def test_dbdict():
     """End Test"""
 
 
+def test_dbdict_limit():
+    """
+    Test bounded kever cache of dbdict with pinned local prefixes
+    """
+    dbd = basing.dbdict()
+    dbd.limit = 3
+    for k in "abcd":
+        dbd[k] = k
+    assert list(dbd) == ['b', 'c', 'd']  # least recently used evicted
+    assert dbd.evictions == 1
+    assert dbd['b'] == 'b'  # moves to most recently used
+    dbd['e'] = 'e'
+    assert list(dbd) == ['d', 'b', 'e']
+    assert (dbd.hits, dbd.misses, dbd.evictions) == (1, 0, 2)
+    assert dbd.get('a') is None
+    assert 'a' not in dbd
+    assert dbd.misses == 1
+
+    # kevers evicted from Baser reload from key state and local ones stay pinned
+    with habbing.openHby(name="nat", base="test") as natHby, \
+            habbing.openHby(name="bob", base="test") as bobHby:
+        natHby.db.kevers.limit = 2
+        nat = natHby.makeHab(name="nat")
+        kvy = eventing.Kevery(db=natHby.db, lax=False, local=False)
+        habs = [bobHby.makeHab(name=name) for name in ("bob", "amy", "cal")]
+        for hab in habs:
+            parsing.Parser().parse(ims=bytearray(hab.makeOwnInception()), kvy=kvy)
+
+        kevers = natHby.db.kevers
+        assert len(kevers) == 2
+        assert nat.pre in kevers  # pinned local prefix
+        assert list(kevers)[-1] == habs[-1].pre
+        assert kevers.evictions >= 2
+        misses = kevers.misses
+        for hab in habs:  # evicted kevers reload from key state
+            assert kevers[hab.pre].serder.said == hab.kever.serder.said
+        assert kevers.misses == misses + 3  # one slot beside pinned so each evicts prior
+        assert nat.pre in kevers and len(kevers) == 2
+
+        stats = natHby.db.stats()["kevers"]
+        assert stats["limit"] == 2
+        assert stats["size"] == 2
+        assert stats["evictions"] == kevers.evictions
+
+    """End Test"""
+
+
 def test_baserdoer():
     """
     Test BaserDoer
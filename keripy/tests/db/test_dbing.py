@@ -6,7 +6,11 @@ tests.db.dbing module
 import pytest
 
 import os
+import shutil
+import subprocess
+import sys
 import json
+import threading
 import datetime
 
 import lmdb
@@ -14,6 +18,7 @@ from  ordered_set import OrderedSet as oset
 
 from hio.base import doing
 
+from keri import kering
 from keri.db import dbing
 from keri.db.dbing import clearDatabaserDir, openLMDB
 from keri.db.dbing import (dgKey, onKey, fnKey, snKey, dtKey, splitKey,
@@ -620,6 +625,27 @@ def test_lmdber():
         assert items == []  # empty
         assert not items
 
+        # Test cntIoValsTop and getIoItemsPage
+        assert dber.cnt(edb) == dber.cntIoValsTop(edb) == 10
+        assert dber.cntIoValsTop(edb, top=b'A.') == 10
+        assert dber.cntIoValsTop(edb, top=b'B.') == 0
+
+        items, last = dber.getIoItemsPage(edb, limit=4)
+        assert items == [(aKey, val) for val in aVals] + [(bKey, b"o")]
+        assert last == (bKey, b'00000000000000000000000000000000.o')
+        assert dber.delIoVal(edb, bKey, b"o")  # resume point survives delete
+        items, last = dber.getIoItemsPage(edb, key=last[0], ioval=last[1], limit=4)
+        assert items == [(bKey, b"r"), (bKey, b"z"), (cKey, b"h"), (cKey, b"n")]
+        items, last = dber.getIoItemsPage(edb, key=last[0], ioval=last[1], limit=4)
+        assert items == [(dKey, val) for val in dVals]
+        assert last is None  # no more
+        items, last = dber.getIoItemsPage(edb, top=b'B.')
+        assert items == [] and last is None
+        with pytest.raises(ValueError):
+            dber.getIoItemsPage(edb, limit=0)
+        assert dber.delIoVals(edb, bKey)  # restore bVals in order
+        assert dber.putIoVals(edb, key=bKey, vals=bVals)
+
         # Test getIoItemsNextIter(self, db, key=b"")
         #  get dups at first key in database
         # aVals
@@ -796,6 +822,676 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_txn():
+    """
+    Test LMDBer .txn shared write transaction context
+    """
+    with openLMDB() as dber:
+        assert dber._txn is None
+        db = dber.env.open_db(key=b'beep.')
+        dupdb = dber.env.open_db(key=b'boop.', dupsort=True)
+        ondb = dber.env.open_db(key=b'ords.')
+
+        key = b'A'
+        pre = b'BAzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+
+        # writes within txn across sub dbs are visible within and commit once
+        with dber.txn() as txn:
+            assert dber._txn is txn
+            assert dber.putVal(db, key, b'x')
+            assert not dber.putVal(db, key, b'y')
+            assert dber.getVal(db, key) == b'x'  # reads join write txn
+            assert dber.putVals(dupdb, key, [b'z', b'a'])
+            assert dber.getVals(dupdb, key) == [b'a', b'z']
+            assert dber.appendOrdValPre(ondb, pre, b'd0') == 0
+            assert dber.appendOrdValPre(ondb, pre, b'd1') == 1
+            with dber.txn() as inner:  # nested joins outer
+                assert inner is txn
+                assert dber.setVal(db, key, b'w')
+
+        assert dber._txn is None
+        assert bytes(dber.getVal(db, key)) == b'w'
+        assert [bytes(val) for val in dber.getVals(dupdb, key)] == [b'a', b'z']
+        assert [(on, bytes(val)) for on, val in dber.getAllOrdItemPreIter(ondb, pre)] == \
+               [(0, b'd0'), (1, b'd1')]
+
+        # exception within txn aborts all writes in txn
+        with pytest.raises(ValueError):
+            with dber.txn():
+                assert dber.setVal(db, key, b'v')
+                assert dber.delVals(dupdb, key)
+                assert dber.appendOrdValPre(ondb, pre, b'd2') == 2
+                raise ValueError("Abort")
+
+        assert dber._txn is None
+        assert bytes(dber.getVal(db, key)) == b'w'
+        assert [bytes(val) for val in dber.getVals(dupdb, key)] == [b'a', b'z']
+        assert dber.appendOrdValPre(ondb, pre, b'd2') == 2
+
+        # nested savepoint aborts only its own writes
+        with dber.txn() as txn:
+            assert dber.setVal(db, key, b'u')
+            with pytest.raises(ValueError):
+                with dber.txn(nested=True) as inner:
+                    assert inner is not txn
+                    assert dber._txn is inner
+                    assert dber.setVal(db, b'B', b'b')
+                    assert dber.appendOrdValPre(ondb, pre, b'd3') == 3
+                    raise ValueError("Abort")
+            assert dber._txn is txn
+            assert dber.getVal(db, b'B') is None
+            with dber.txn(nested=True):
+                assert dber.appendOrdValPre(ondb, pre, b'd3') == 3
+            assert dber.getVal(db, key) == b'u'
+
+        assert dber._txn is None
+        assert bytes(dber.getVal(db, key)) == b'u'
+        assert dber.getVal(db, b'B') is None
+        assert [on for on, val in dber.getAllOrdItemPreIter(ondb, pre)] == [0, 1, 2, 3]
+
+    assert not os.path.exists(dber.path)
+
+    """ End Test """
+
+
+def test_lmdber_group_commit():
+    """
+    Test LMDBer group commit mode with .batchSize and .batchPeriod
+    """
+    with openLMDB(batchSize=3, batchPeriod=60.0) as dber:
+        assert dber.sync
+        assert dber._batch is None
+        assert not dber.batchDue
+        db = dber.env.open_db(key=b'beep.')
+
+        assert dber.putVal(db, b'A', b'a')  # begins batch
+        batch = dber._batch
+        assert batch is not None
+        assert dber._txn is batch
+        assert dber._batchOps == 1
+        assert dber.getVal(db, b'A') == b'a'  # read joins batch
+
+        # not committed so not visible to another reader in other thread
+        def peek(key):
+            result = []
+            thread = threading.Thread(target=lambda: result.append(
+                dber.env.begin(db=db).get(key)))
+            thread.start()
+            thread.join()
+            return result[0]
+
+        assert peek(b'A') is None
+
+        assert dber.putVal(db, b'B', b'b')
+        assert dber._batchOps == 2
+        # explicit txn is child of batch. Abort only aborts child
+        with pytest.raises(ValueError):
+            with dber.txn():
+                assert dber.putVal(db, b'C', b'c')
+                raise ValueError("Abort")
+        assert dber._txn is batch
+        assert dber.getVal(db, b'C') is None
+        assert dber._batchOps == 2
+
+        # read iterator holds off commit
+        items = dber.getAllItemIter(db, split=False)
+        assert next(items) == (b'A', b'a')
+        assert dber.putVal(db, b'D', b'd')  # 3 ops is due but reader open
+        assert dber._batch is batch
+        assert not dber.batchDue
+        assert [key for key, val in items] == [b'B', b'D']
+        assert dber.batchDue
+        dber.tick()  # commits when due
+        assert dber._batch is None
+        assert dber._txn is None
+        assert peek(b'D') == b'd'
+
+        assert dber.setVal(db, b'A', b'z')
+        with pytest.raises(ValueError):  # no flush barrier within txn
+            with dber.txn():
+                dber.flush()
+        dber.batchPeriod = 0.0  # now every write is due
+        with dber.txn():
+            assert dber.putVal(db, b'E', b'e')
+        assert dber._batch is None
+        assert peek(b'A') == b'z'
+        assert peek(b'E') == b'e'
+
+        dber.batchPeriod = 60.0
+        assert dber.putVal(db, b'F', b'f')
+        assert dber._batch is not None
+        dber.flush()  # durability barrier
+        assert dber._batch is None
+        assert peek(b'F') == b'f'
+        assert not dber.commit()
+
+        assert dber.putVal(db, b'G', b'g')  # close commits open batch
+        path = dber.path
+
+    with openLMDB(temp=False, name="group", sync=False, batchSize=10) as dber:
+        assert not dber.sync
+        db = dber.env.open_db(key=b'beep.')
+        assert dber.putVal(db, b'A', b'a')
+        dber.close()  # flush and sync on close
+        dber.reopen()
+        db = dber.env.open_db(key=b'beep.')
+        assert bytes(dber.getVal(db, b'A')) == b'a'
+        dber.close(clear=True)
+
+    assert not os.path.exists(path)
+
+    """ End Test """
+
+
+def test_lmdber_snapshot():
+    """
+    Test LMDBer .snapshot shared read transaction and cursor reuse
+    """
+    with openLMDB() as dber:
+        assert dber._snap is None
+        db = dber.env.open_db(key=b'beep.')
+        dupdb = dber.env.open_db(key=b'boop.', dupsort=True)
+        key = b'A'
+        assert dber.putVals(dupdb, key, [b'z', b'a'])
+        assert dber.putVal(db, key, b'x')
+
+        with dber.snapshot() as snap:
+            assert dber._snap is snap
+            assert dber._txn is None
+            assert bytes(dber.getVal(db, key)) == b'x'
+            assert [bytes(val) for val in dber.getVals(dupdb, key)] == [b'a', b'z']
+            cursor = dber._cursors[dupdb]
+            assert dber.cntVals(dupdb, key) == 2
+            assert dber._cursors[dupdb] is cursor  # reused
+            with dber.snapshot() as inner:  # nested joins outer
+                assert inner is snap
+
+            # writes commit in own txn but are not visible to snapshot
+            assert dber.setVal(db, key, b'y')
+            assert dber.putVal(db, b'B', b'b')
+            assert bytes(dber.getVal(db, key)) == b'x'
+            assert dber.getVal(db, b'B') is None
+            assert [bytes(k) for k, v in dber.getAllItemIter(db, split=False)] == [b'A']
+
+        assert dber._snap is None
+        assert dber._cursors == {}
+        assert bytes(dber.getVal(db, key)) == b'y'
+        assert bytes(dber.getVal(db, b'B')) == b'b'
+
+        # within write txn snapshot joins write txn so sees its writes
+        with dber.txn() as txn:
+            assert dber.setVal(db, key, b'w')
+            with dber.snapshot() as snap:
+                assert snap is txn
+                assert dber.getVal(db, key) == b'w'
+
+    assert not os.path.exists(dber.path)
+
+    """ End Test """
+
+
+def test_lmdber_map_growth():
+    """
+    Test LMDBer automatic map size growth and capacity stats
+    """
+    size = 1048576  # 1 MiB
+    with openLMDB(mapSize=size, mapGrowth=size, mapFill=0.5) as dber:
+        assert dber.mapSize == size
+        assert dber.env.info()["map_size"] == size
+        db = dber.env.open_db(key=b'beep.')
+        dupdb = dber.env.open_db(key=b'boop.', dupsort=True)
+
+        val = b'x' * 1024
+        for i in range(1024):  # 1 MiB of values would overflow initial map
+            assert dber.putVal(db, b'%08d' % i, val)
+        assert dber.putVals(dupdb, b'A', [b'a', b'b', b'c'])
+        assert dber.mapSize > size
+        assert dber.env.info()["map_size"] == dber.mapSize
+
+        stats = dber.stats()
+        assert stats["path"] == dber.path
+        assert stats["mapSize"] == dber.mapSize
+        assert stats["pageSize"] == dber._psize
+        assert stats["used"] < dber.mapFill * stats["mapSize"]
+        assert 0.0 < stats["fill"] < dber.mapFill
+        assert set(stats["dbs"]) == {"beep.", "boop.", "meta."}
+        beep = stats["dbs"]["beep."]
+        assert beep["entries"] == 1024
+        assert beep["pages"] == (beep["branchPages"] + beep["leafPages"] +
+                                 beep["overflowPages"])
+        assert beep["bytes"] == beep["pages"] * stats["pageSize"]
+        assert beep["bytes"] >= 1024 * len(val)
+        assert stats["dbs"]["boop."]["entries"] == 3
+
+        with dber.snapshot():  # no growth while transaction open
+            assert not dber.grow(force=True)
+            assert dber.stats()["dbs"]["boop."]["entries"] == 3
+
+        mapSize = dber.mapSize
+        assert dber.grow(force=True)
+        assert dber.mapSize == mapSize + size
+
+    # MapFullError in txn forces growth at next write so retry succeeds
+    with openLMDB(mapSize=size, mapGrowth=size, mapFill=1.0) as dber:
+        db = dber.env.open_db(key=b'beep.')
+        with pytest.raises(lmdb.MapFullError):
+            with dber.txn():
+                for i in range(768):
+                    dber.putVal(db, b'%08d' % i, val)
+        assert dber._full
+        assert dber.getVal(db, b'%08d' % 0) is None  # aborted
+        with dber.txn():
+            for i in range(768):
+                assert dber.putVal(db, b'%08d' % i, val)
+        assert not dber._full
+        assert dber.mapSize == 2 * size
+        assert dber.cnt(db) == 768
+
+    """ End Test """
+
+
+def test_lmdber_key_versions(monkeypatch):
+    """
+    Test compact binary ordinal keys and resumable migration of ordinal sub dbs
+    """
+    pre = b'BAzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+    key = dbing.onKeyBin(pre, 1)
+    assert key == pre + b'.' + b'\x00' * 15 + b'\x01'
+    assert len(key) == len(pre) + 1 + dbing.OnBinSize
+    assert dbing.splitKeyONBin(key) == (pre, 1)
+    assert dbing.splitKeyONBin(memoryview(key)) == (pre, 1)
+    assert dbing.onKeyBin(pre.decode("utf-8"), dbing.MaxON) == pre + b'.' + b'\xff' * 16
+    ons = [0, 1, 255, 256, 65536, 2 ** 64, dbing.MaxON]
+    assert sorted(dbing.onKeyBin(pre, on) for on in ons) == [dbing.onKeyBin(pre, on) for on in ons]
+    with pytest.raises(ValueError):
+        dbing.splitKeyONBin(onKey(pre, 1))
+
+    other = b'EAzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+    with openLMDB() as dber:
+        assert dber.meta is not None
+        db = dber.openOrdDB(key=b'ords.')
+        assert dber.keyVers() == {"ords.": dbing.KeyVerHex}
+        for i in range(5):
+            assert dber.appendOrdValPre(db, pre, val=b'p%d' % i) == i
+            assert dber.appendOrdValPre(db, other, val=b'o%d' % i) == i
+        assert dber.ordKey(db, pre, 3) == onKey(pre, 3)
+        items = [(p, on, bytes(val)) for p, on, val in dber.getAllOrdItemAllPreIter(db)]
+
+        calls = 0
+        onKeyBin = dbing.onKeyBin
+
+        def failing(*pa, **kwa):  # interrupt migration during third batch
+            nonlocal calls
+            calls += 1
+            if calls > 4:
+                raise ValueError("Interrupted")
+            return onKeyBin(*pa, **kwa)
+
+        monkeypatch.setattr(dbing, "onKeyBin", failing)
+        with pytest.raises(ValueError):
+            dber.migrateKeys(batch=2)
+        monkeypatch.setattr(dbing, "onKeyBin", onKeyBin)
+        assert dber.keyVers() == {"ords.": dbing.KeyVerHex}
+        assert dber.getVal(dber.meta, b'ords.kmig')  # checkpoint of phase 1
+
+        assert dber.migrateKeys(batch=2) == {"ords.": 10}  # resumes
+        assert dber.keyVers() == {"ords.": dbing.KeyVerBin}
+        assert dber.migrateKeys() == {}  # nothing left to migrate
+        assert dber.getVal(dber.meta, b'ords.kmig') is None
+        assert dber.getVal(dber.meta, b'ords.kmig2') is None
+        assert dber.ordKey(db, pre, 3) == dbing.onKeyBin(pre, 3)
+        assert dber.getVal(db, dbing.onKeyBin(pre, 3)) == b'p3'
+        assert dber.getVal(db, onKey(pre, 3)) is None
+        assert [(p, on, bytes(val)) for p, on, val in dber.getAllOrdItemAllPreIter(db)] == items
+        assert [bytes(val) for on, val in dber.getAllOrdItemPreIter(db, pre, on=3)] == [b'p3', b'p4']
+        assert dber.cntValsAllPre(db, other) == 5
+        assert dber.appendOrdValPre(db, pre, val=b'p5') == 5
+        assert dber.appendOrdValPre(db, b'CAzw', val=b'c0') == 0
+
+        dber.reopen(reuse=True)  # key version persists
+        db = dber.openOrdDB(key=b'ords.')
+        assert dber.keyVers() == {"ords.": dbing.KeyVerBin}
+        assert dber.getVal(db, dbing.onKeyBin(pre, 5)) == b'p5'
+        assert dber.appendOrdValPre(db, pre, val=b'p6') == 6
+
+        class BinLMDBer(LMDBer):
+            KeyVer = dbing.KeyVerBin
+
+        with openLMDB(cls=BinLMDBer) as bber:  # new sub db uses class key version
+            db = bber.openOrdDB(key=b'ords.')
+            assert bber.keyVers() == {"ords.": dbing.KeyVerBin}
+            assert bber.appendOrdValPre(db, pre, val=b'p0') == 0
+            assert bber.getVal(db, dbing.onKeyBin(pre, 0)) == b'p0'
+
+    """ End Test """
+
+
+def test_lmdber_migrate(tmp_path, monkeypatch):
+    """
+    Test schema migration registry and resumable streamed migrations
+    """
+    class MigLMDBer(LMDBer):
+        Migrations = dbing.Migrator()
+
+    assert MigLMDBer.Migrations.version == 0
+    assert LMDBer.Migrations.version == 0
+    seen = []
+
+    @MigLMDBer.Migrations.register(ver=0, tables=("vals.", "none."))
+    def indexVals(dber, batch):  # doubles vals in place and indexes them by val
+        vals = dber.env.open_db(key=b'vals.')
+        idxs = dber.env.open_db(key=b'idxs.')
+
+        def fn(txn, key, val):
+            seen.append(key)
+            txn.put(key, val + val, db=vals)
+            txn.put(val + val, key, db=idxs)
+
+        dber.streamItems(vals, fn, ckey=b'indexVals', batch=batch)
+
+    @MigLMDBer.Migrations.register(ver=1, name="nothing")
+    def noop(dber, batch):
+        pass
+
+    migs = MigLMDBer.Migrations
+    assert migs.version == 2
+    assert migs.pending(0) == [migs.migrations[0], migs.migrations[1]]
+    assert migs.migrations[0].name == "indexVals"
+    assert migs.migrations[0].tables == ("vals.", "none.")
+    assert migs.migrations[1].name == "nothing"
+    assert migs.pending(2) == []
+    with pytest.raises(ValueError):
+        migs.register(ver=1)(noop)
+    with pytest.raises(kering.DatabaseError):
+        migs.pending(3)  # newer than supported
+    gappy = dbing.Migrator()
+    gappy.register(ver=1)(noop)
+    with pytest.raises(kering.DatabaseError):
+        gappy.pending(0)
+
+    # new database stores current schema version
+    dber = MigLMDBer(name="new", headDirPath=str(tmp_path), reopen=True)
+    assert dber.schemaVer == 2
+    assert dber.migrate() == []
+    dber.close()
+
+    # database created by older code at schema version 0
+    dber = LMDBer(name="old", headDirPath=str(tmp_path), reopen=True)
+    assert dber.schemaVer == 0
+    vals = dber.env.open_db(key=b'vals.')
+    for i in range(7):
+        dber.putVal(vals, key=b'k%d' % i, val=b'v%d' % i)
+    dber.close()
+    dber = LMDBer(name="old", headDirPath=str(tmp_path), reopen=True, reuse=True)
+    assert dber.schemaVer == 0  # existing database is not stamped
+    dber.close()
+
+    dber = MigLMDBer(name="old", headDirPath=str(tmp_path), reopen=True, reuse=True)
+    assert dber.schemaVer == 0
+    reports = dber.migrate(dry=True, rate=7)
+    assert reports == [dict(ver=0, name="indexVals", entries=7, secs=1.0),
+                       dict(ver=1, name="nothing", entries=0, secs=0.0)]
+    assert dber.schemaVer == 0
+    assert seen == []
+
+    streamItems = dber.streamItems
+
+    def interrupted(db, fn, ckey, batch=1000, done=None):  # fail in third batch
+        def failing(txn, key, val):
+            if len(seen) == 4:
+                raise ValueError("Interrupted")
+            fn(txn, key, val)
+        return streamItems(db, failing, ckey, batch=batch, done=done)
+
+    monkeypatch.setattr(dber, "streamItems", interrupted)
+    with pytest.raises(ValueError):
+        dber.migrate(batch=2)
+    assert dber.schemaVer == 0
+    assert dber.getVal(dber.meta, b'indexVals') == b'k3'
+    monkeypatch.setattr(dber, "streamItems", streamItems)
+
+    reports = dber.migrate(batch=2)
+    assert [report["name"] for report in reports] == ["indexVals", "nothing"]
+    assert dber.schemaVer == 2
+    assert dber.getVal(dber.meta, b'indexVals') is None
+    assert seen == [b'k%d' % i for i in range(7)]  # each once despite interruption
+    vals = dber.env.open_db(key=b'vals.')
+    idxs = dber.env.open_db(key=b'idxs.')
+    for i in range(7):
+        assert dber.getVal(vals, b'k%d' % i) == b'v%dv%d' % (i, i)
+        assert dber.getVal(idxs, b'v%dv%d' % (i, i)) == b'k%d' % i
+    assert dber.migrate() == []
+    dber.close()
+
+    # readonly database can not migrate but can estimate
+    dber = LMDBer(name="ro", headDirPath=str(tmp_path), reopen=True)
+    dber.env.open_db(key=b'vals.')
+    dber.close()
+    dber = MigLMDBer(name="ro", headDirPath=str(tmp_path), reopen=True, reuse=True,
+                     readonly=True)
+    assert dber.migrate(dry=True)[0]["entries"] == 0
+    with pytest.raises(kering.DatabaseError):
+        dber.migrate()
+    dber.close()
+
+    """ End Test """
+
+
+def test_lmdber_readonly_replica(tmp_path):
+    """
+    Test readonly LMDBer reads latest commits of writer in other process and
+    adopts map size grown by writer
+    """
+    head = str(tmp_path)
+    writer = LMDBer(name="rep", headDirPath=head, temp=False, mapSize=1048576)
+    db = writer.env.open_db(key=b'vals.')
+    assert writer.putVal(db, key=b"a", val=b"1")
+    writer.close()
+
+    reader = LMDBer(name="rep", headDirPath=head, temp=False, reuse=True,
+                    readonly=True, mapSize=1048576)
+    assert reader.readonly
+    rdb = reader.env.open_db(key=b'vals.')
+    assert reader.getVal(rdb, key=b"a") == b"1"
+    with pytest.raises(lmdb.ReadonlyError):
+        reader.putVal(rdb, key=b"b", val=b"2")
+    assert reader.mapSize == 1048576
+
+    code = ("from keri.db.dbing import LMDBer\n"
+            f"w = LMDBer(name='rep', headDirPath={head!r}, temp=False, reuse=True, mapSize=1048576)\n"
+            "db = w.env.open_db(key=b'vals.')\n"
+            "for i in range(4096): w.putVal(db, key=b'k%04d' % i, val=bytes(1024))\n"
+            "w.close()\n")
+    subprocess.run([sys.executable, "-c", code], check=True)  # writer grows map
+
+    assert bytes(reader.getVal(rdb, key=b"k4095")) == bytes(1024)
+    assert reader.mapSize > 1048576  # adopted grown map size
+    assert reader.cnt(rdb) == 4097
+    reader.close()
+
+    """ End Test """
+
+
+def test_lmdber_backup_compact():
+    """
+    Test LMDBer hot backup and online compaction with swap in on reopen
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.')
+        val = b'x' * 1024
+        for i in range(256):
+            assert dber.putVal(db, b'%08d' % i, val)
+        for i in range(0, 256, 2):  # free pages so compaction shrinks
+            assert dber.delVal(db, b'%08d' % i)
+
+        # hot backup while snapshot open
+        path = os.path.join(os.path.dirname(dber.path), "backup")
+        with dber.snapshot():
+            txnid = dber.backup(path)
+            assert dber.getVal(db, b'%08d' % 1) == val
+        assert txnid == dber.env.info()["last_txnid"]
+        assert os.path.exists(os.path.join(path, "data.mdb"))
+        with pytest.raises(ValueError):  # not empty
+            dber.backup(path)
+        env = lmdb.open(path, max_dbs=dber.MaxNamedDBs)
+        bdb = env.open_db(key=b'beep.')
+        with env.begin(db=bdb) as txn:
+            assert txn.stat(bdb)["entries"] == 128
+            assert txn.get(b'%08d' % 1) == val
+        env.close()
+
+        # compact then swap in on reopen
+        size = os.path.getsize(os.path.join(dber.path, "data.mdb"))
+        staged = dber.compact()
+        assert staged == dber.path + ".compact"
+        assert os.path.exists(os.path.join(staged, "txnid"))
+        assert dber.getVal(db, b'%08d' % 1) == val  # still serving
+        dber.reopen(reuse=True)
+        assert not os.path.exists(staged)
+        assert not os.path.exists(dber.path + ".old")
+        assert not os.path.exists(os.path.join(dber.path, "txnid"))
+        assert os.path.getsize(os.path.join(dber.path, "data.mdb")) < size
+        db = dber.env.open_db(key=b'beep.')
+        assert dber.cnt(db) == 128
+        assert dber.getVal(db, b'%08d' % 1) == val
+
+        assert not dber.stale
+
+        # write after compaction makes staged copy stale so it is discarded
+        # and env compacted again on reopen before it is opened
+        for i in range(1, 256, 4):  # free pages so compaction shrinks
+            assert dber.delVal(db, b'%08d' % i)
+        staged = dber.compact()
+        assert dber.putVal(db, b'new', b'val')
+        size = os.path.getsize(os.path.join(dber.path, "data.mdb"))
+        for i in range(3, 256, 4):  # free pages since compaction
+            assert dber.delVal(db, b'%08d' % i)
+        dber.reopen(reuse=True)
+        assert dber.stale
+        assert not os.path.exists(staged)
+        assert not os.path.exists(staged + ".tmp")
+        assert not os.path.exists(os.path.join(dber.path, "txnid"))
+        assert os.path.getsize(os.path.join(dber.path, "data.mdb")) < size
+        db = dber.env.open_db(key=b'beep.')
+        assert dber.getVal(db, b'new') == b'val'
+        assert dber.cnt(db) == 1
+        dber.reopen(reuse=True)  # nothing staged
+        assert not dber.stale
+        db = dber.env.open_db(key=b'beep.')
+
+        # no swap under env open in this process as locks do not conflict
+        staged = dber.compact()
+        other = LMDBer(name=dber.name, reopen=False)
+        other.path = dber.path
+        assert not other._swap()
+        assert os.path.exists(staged)
+        assert dber.getVal(db, b'new') == b'val'  # own env untouched
+        shutil.rmtree(staged)
+
+        # crash between renames of swap is completed on reopen
+        staged = dber.compact()
+        dber.close()
+        os.replace(dber.path, dber.path + ".old")
+        os.makedirs(dber.path)
+        dber.reopen(reuse=True)
+        assert not os.path.exists(staged)
+        assert not os.path.exists(dber.path + ".old")
+        db = dber.env.open_db(key=b'beep.')
+        assert dber.getVal(db, b'new') == b'val'
+
+        shutil.rmtree(path)
+
+    assert not os.path.exists(dber.path)
+
+    """ End Test """
+
+
+def test_lmdber_append_cache():
+    """
+    Test LMDBer cached last ordinal for appendOrdValPre and appendIoSetVal
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'ords.')
+        pre = b'BAKY1sKmgyjAiUDdUBPNPyrSz_ad_Qf9yzhDNZlEKiMc'
+        other = b'BBKY1sKmgyjAiUDdUBPNPyrSz_ad_Qf9yzhDNZlEKiMc'
+        assert dber.appendOrdValPre(db, pre, b'a') == 0
+        assert dber._ons[db] == {pre: 0}
+        assert dber.appendOrdValPre(db, other, b'x') == 0
+        assert dber.appendOrdValPre(db, pre, b'b') == 1
+        assert dber._ons[db] == {pre: 1, other: 0}
+
+        # stale cache from write not by append falls back to walk
+        assert dber.putVal(db, onKey(pre, 2), b'c')
+        assert dber.appendOrdValPre(db, pre, b'd') == 3
+        assert dber._ons[db][pre] == 3
+
+        # delete invalidates cache of sub db
+        assert dber.delVal(db, onKey(pre, 3))
+        assert db not in dber._ons
+        assert dber.appendOrdValPre(db, pre, b'e') == 3
+
+        # aborted transaction clears cache
+        with pytest.raises(ValueError):
+            with dber.txn():
+                assert dber.appendOrdValPre(db, pre, b'f') == 4
+                raise ValueError()
+        assert dber._ons == {}
+        assert dber.appendOrdValPre(db, pre, b'f') == 4
+        assert [bytes(val) for on, val in dber.getAllOrdItemPreIter(db, pre)] == \
+               [b'a', b'b', b'c', b'e', b'f']
+
+        sdb = dber.env.open_db(key=b'sets.')
+        key = b'topic'
+        assert dber.appendIoSetVal(sdb, key, b'a') == 0
+        assert dber.appendIoSetVal(sdb, key, b'b') == 1
+        assert dber._ons[sdb] == {key: 1}
+        assert dber.addIoSetVal(sdb, key, b'c')  # stale cache
+        assert dber.appendIoSetVal(sdb, key, b'd') == 3
+        assert dber.delIoSetVal(sdb, key, b'd')
+        assert sdb not in dber._ons
+        assert dber.appendIoSetVal(sdb, key, b'e') == 3
+        assert [bytes(val) for val in dber.getIoSetVals(sdb, key)] == \
+               [b'a', b'b', b'c', b'e']
+
+    """ End Test """
+
+
+def test_lmdber_append_no_walk():
+    """
+    Test cached appends over many topics confirm the cached ordinal with a
+    single set_range instead of walking back from the max ordinal. A value
+    planted past the end of each topic makes the cache stale so appends land
+    after it.
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'ords.')
+        sdb = dber.env.open_db(key=b'sets.')
+        keys = [b'topic%03d' % i for i in range(10)]
+        for key in keys:
+            assert dber.appendOrdValPre(db, key, b'a') == 0
+            assert dber.appendIoSetVal(sdb, key, b'a') == 0
+            assert dber.putVal(db, onKey(key, 5), b'z')  # cache now stale
+            assert dber.putVal(sdb, dbing.suffix(key, 5), b'z')
+
+        with dber.txn():
+            for i in range(1, 5):
+                for key in keys:
+                    assert dber.appendOrdValPre(db, key, b'%d' % i) == 5 + i
+                    assert dber.appendIoSetVal(sdb, key, b'%d' % i) == 5 + i
+
+        for key in keys:
+            assert dber._ons[db][key] == 9
+            assert dber._ons[sdb][key] == 9
+            assert dber.appendOrdValPre(db, key, b'w') == 10
+            assert dber.appendIoSetVal(sdb, key, b'w') == 10
+            assert [bytes(val) for on, val in dber.getAllOrdItemPreIter(db, key)] == \
+                   [b'a', b'z', b'1', b'2', b'3', b'4', b'w']
+            assert [bytes(val) for val in dber.getIoSetVals(sdb, key)] == \
+                   [b'a', b'z', b'1', b'2', b'3', b'4', b'w']
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_lmdber()
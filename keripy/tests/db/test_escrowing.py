@@ -158,6 +158,39 @@ def test_broker_trans():
         assert bork.serderdb.get(keys=(saider.qb64,)).raw == tserder.raw
         assert bork.saiderdb.get(keys=(pre, aid)).qb64 == saider.qb64
 
+def test_broker_expiry():
+    """
+    Test stale state escrows expire by range scan of the escrow expiry index
+    without loading their datetime stamps
+    """
+    import datetime
+
+    aid = "EBWY7LU2xwp0d4IhCvz1etbuv2iwcgBEigKJWnd-0Whs"
+    saider0 = coring.Saider(qb64="EAhdYfbI5qfFKmGeEvc6rYlz7w0aOgAGkQGsG6JHUI1e")
+    saider1 = coring.Saider(qb64="EBh6vbWk-ZOhLrhHSO-oi5D9xnyXEB5hZxSaRZcOQsqr")
+
+    with dbing.openLMDB() as db:
+        bork = escrowing.Broker(db=db, subkey="test", timeout=10)
+        old = helping.nowUTC() - datetime.timedelta(seconds=20)
+        bork.escrowdb.put(keys=("test", "pre0", aid), vals=[saider0])
+        assert bork.expirer.put(b'test.pre0.%s' % aid.encode(), saider0.qb64b, dt=old)
+        bork.escrowdb.put(keys=("test", "pre1", aid), vals=[saider1])
+        assert bork.expirer.put(b'test.pre1.%s' % aid.encode(), saider1.qb64b)
+        assert db.cnt(bork.expirer.exps) == db.cnt(bork.expirer.exks) == 2
+
+        tried = []
+
+        def process(**kwargs):
+            tried.append(kwargs["saider"].qb64)
+
+        bork.processEscrowState(typ="test", processReply=process,
+                                extype=kering.OutOfOrderError)
+
+        assert bork.escrowdb.get(keys=("test", "pre0", aid)) == []  # stale
+        assert tried == []  # fresh one missing artifacts so removed untried
+        assert bork.escrowdb.get(keys=("test", "pre1", aid)) == []
+        assert db.cnt(bork.expirer.exps) == db.cnt(bork.expirer.exks) == 0
+
 
 if __name__ == "__main__":
     test_broker()
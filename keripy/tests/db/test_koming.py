@@ -193,6 +193,15 @@ def test_kom_get_item_iter():
 
         assert mydb.cntAll() == 8
 
+        with db.snapshot():
+            raw = mydb.getRaw(keys=("a", "1"))
+            assert isinstance(raw, memoryview)
+            assert raw == b'{"a":"Big","b":"Blue"}'
+            assert mydb.getRaw(keys=("z", "1")) is None
+            items = [(keys, bytes(val)) for keys, val in mydb.getRawItemIter(keys=("b", ""))]
+            assert items == [(('b', '1'), b'{"a":"Big","b":"Blue"}'),
+                             (('b', '2'), b'{"a":"Tall","b":"Red"}')]
+
         assert mydb.trim(keys=("b", ""))
         items = [(keys, asdict(data)) for keys, data in mydb.getItemIter()]
         assert items == [(('a', '1'), {'a': 'Big', 'b': 'Blue'}),
@@ -57,6 +57,16 @@ def test_suber():
         actual = sdb.get(keys=keys)
         assert actual == kip
 
+        # raw zero copy access
+        with db.snapshot():
+            raw = sdb.getRaw(keys=keys)
+            assert isinstance(raw, memoryview)
+            assert raw == kip.encode("utf-8")
+            assert sdb.getRaw(keys=("not_found", "0001")) is None
+            items = [(keys, val) for keys, val in sdb.getRawItemIter(keys=("test_key", ""))]
+            assert items == [(("test_key", "0001"), kip.encode("utf-8"))]
+            assert isinstance(items[0][1], memoryview)
+
         # test with keys as string not tuple
         keys = "keystr"
 
@@ -9,8 +9,8 @@ import os
 
 import lmdb
 
-from keri.core.coring import Diger, versify, Serials
-from keri.db.dbing import openLMDB, dgKey, snKey
+from keri.core.coring import Diger, Saider, versify, Serials
+from keri.db.dbing import openLMDB, dgKey, snKey, SchemaKey
 from keri.vdr.viring import Reger
 
 
@@ -341,6 +341,24 @@ def test_clone():
           b'PjioY7Ycna6ouhSSH0QcKsEjce10HCXIW_XtmEYr9SrB5BA-GAB0AAAAAAAAAAAA'
           b'AAAAAAAAABCEzpq06UecHwzy-K9FpNoRxCJp2wIGM9u2Edk-PLMZ1H4')
 
+def test_reger_migrate_state_escrows():
+    """
+    Test migration backfills escrow expiry index of txn state escrows
+    """
+    dig = b'EAhdYfbI5qfFKmGeEvc6rYlz7w0aOgAGkQGsG6JHUI1e'
+    with openLMDB(cls=Reger) as reger:
+        assert reger.schemaVer == Reger.Migrations.version == 1
+        reger.txnsb.escrowdb.put(keys=("registry-ooo", "pre", "aid"),
+                                 vals=[Saider(qb64b=dig)])  # not indexed
+        assert reger.cnt(reger.txnsb.expirer.exps) == 0
+        reger.setVal(reger.meta, SchemaKey, b'0')
+        reports = reger.migrate()
+        assert reports[0]["name"] == "indexStateEscrows"
+        assert reports[0]["entries"] == 1
+        assert reger.schemaVer == 1
+        assert reger.getVal(reger.txnsb.expirer.exks,
+                            b'txn.-nes.registry-ooo.pre.aid.%s' % dig) is not None
+
 
 if __name__ == "__main__":
     test_issuer()